@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from .card import Card, CARDS, NUM_CARDS
+from .cardset import CardSet
+from .game import Game
+from .move_validator import MoveValidator
+
+
+# ── action encoding ──────────────────────────────────────────────────────────
+# One action fits in a byte:
+#     0 ..  35   ATTACK   card id  (opening attack or pile-on)
+#    36 ..  71   DEFEND   card id  (beats the first undefended attack)
+#    72 .. 107   TRANSFER card id  (transfer mode only)
+#   108          TAKE     defender gives up and will pick up the table
+#   109          PASS     attacker is done adding cards for now
+
+ATTACK   = 0
+DEFEND   = NUM_CARDS
+TRANSFER = 2 * NUM_CARDS
+TAKE     = 3 * NUM_CARDS
+PASS     = TAKE + 1
+NUM_ACTIONS = PASS + 1
+
+_KIND_NAMES = {ATTACK: "attack", DEFEND: "defend", TRANSFER: "transfer"}
+
+# phases: who is to move and what they may do
+ATTACKING = "attacking"   # attacker opens, piles on, or passes
+DEFENDING = "defending"   # defender beats the first undefended card, transfers or takes
+TAKING    = "taking"      # defender has given up; attacker may still pile on, then passes
+
+
+def encode(kind: int, card: Card) -> int:
+    return kind + card.id
+
+
+def action_kind(action: int) -> int:
+    """ATTACK, DEFEND, TRANSFER, TAKE or PASS."""
+    if action >= TAKE:
+        return action
+    return action - action % NUM_CARDS
+
+
+def action_card(action: int) -> Optional[Card]:
+    if action >= TAKE:
+        return None
+    return CARDS[action % NUM_CARDS]
+
+
+def describe(action: int) -> str:
+    if action == TAKE:
+        return "take"
+    if action == PASS:
+        return "pass"
+    return f"{_KIND_NAMES[action_kind(action)]} {action_card(action)}"
+
+
+def _encode_mask(mask: CardSet, kind: int, out: List[int]) -> None:
+    while mask:
+        low = mask & -mask
+        out.append(kind + low.bit_length() - 1)
+        mask ^= low
+
+
+# ── generator ────────────────────────────────────────────────────────────────
+
+def can_add_attack(game: Game) -> bool:
+    """Table caps: at most six attacks per round, and never more undefended
+    attacks than the defender has cards to answer them with."""
+    table = game.table
+    return (table.attack_count() < 6 and
+            table.undefended_count() < len(game.players[game.defender_idx].hand))
+
+
+def next_defender(game: Game) -> int:
+    """Seat that would defend if the current defender transferred."""
+    return (game.defender_idx + 1) % len(game.players)
+
+
+def legal_actions(game: Game, phase: str, *, transfer_mode: bool = False) -> List[int]:
+    """Every legal action for the player to move (attacker unless phase is
+    DEFENDING), encoded as above and ordered by kind then card id."""
+    table     = game.table
+    validator = MoveValidator(game.deck.trump)
+    out: List[int] = []
+
+    if phase == DEFENDING:
+        hand = game.players[game.defender_idx].hand_mask()
+        atk  = table.pairs[table.first_undefended_index()].attack
+        _encode_mask(hand & validator.defence_mask(atk), DEFEND, out)
+        if transfer_mode:
+            new_def = game.players[next_defender(game)].hand
+            _encode_mask(hand & validator.transfer_mask(table, new_def), TRANSFER, out)
+        out.append(TAKE)
+        return out
+
+    if can_add_attack(game):
+        hand = game.players[game.attacker_idx].hand_mask()
+        _encode_mask(hand & validator.attack_mask(table), ATTACK, out)
+    if not table.is_empty():
+        out.append(PASS)
+    return out
+
+
+def to_move(game: Game, phase: str) -> int:
+    """Seat index of the player who acts in this phase."""
+    return game.defender_idx if phase == DEFENDING else game.attacker_idx
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError as e:  # optional dependency, only this module needs it
+    raise ImportError("batch_sim requires numpy (pip install numpy)") from e
+
+from .card import Suit
+from .cardset import BEATERS, SUIT_MASK, NUM_CARDS, card_index
+from .deck import Deck
+
+
+# Lockstep two-player simulator: K games held as NumPy arrays, every live game
+# advanced by one attack/defence exchange per step(). Hands and table halves are
+# uint64 CardSets (same bit layout as cardset.py) and the policies are array
+# versions of _ai_choose_attack, _ai_should_stop_attacking and _ai_choose_defence.
+# Rules match GameStateMachine as HeadlessEngine plays it, so from_seeds()
+# reproduces the engine's results exactly.
+
+_U      = np.uint64
+_ONE    = _U(1)
+_LANE   = _U(0x1FF)
+_SPREAD = _U(1 | 1 << 9 | 1 << 18 | 1 << 27)
+_S9, _S18, _S27 = _U(9), _U(18), _U(27)
+
+_M1  = _U(0x5555555555555555)
+_M2  = _U(0x3333333333333333)
+_M4  = _U(0x0F0F0F0F0F0F0F0F)
+_H01 = _U(0x0101010101010101)
+
+_SUITS      = list(Suit)
+_BEAT       = np.array([BEATERS[s] for s in _SUITS], dtype=np.uint64)   # [trump, card]
+_SUIT_MASKS = np.array([SUIT_MASK[s] for s in _SUITS], dtype=np.uint64)
+
+ATTACK = 0
+DEFEND = 1
+
+
+# ── bit helpers on uint64 arrays ─────────────────────────────────────────────
+
+def _popcount(x: np.ndarray) -> np.ndarray:
+    x = x - ((x >> _ONE) & _M1)
+    x = (x & _M2) + ((x >> _U(2)) & _M2)
+    x = (x + (x >> _U(4))) & _M4
+    return ((x * _H01) >> _U(56)).astype(np.int64)
+
+
+def _lowbit(x: np.ndarray) -> np.ndarray:
+    return x & (~x + _ONE)
+
+
+def _bit_index(bit: np.ndarray) -> np.ndarray:
+    """Index of a single set bit (undefined for 0)."""
+    return _popcount(bit - _ONE)
+
+
+def _same_rank(mask: np.ndarray) -> np.ndarray:
+    ranks = (mask | mask >> _S9 | mask >> _S18 | mask >> _S27) & _LANE
+    return ranks * _SPREAD
+
+
+def _choose_attack(valid: np.ndarray, trump: np.ndarray) -> np.ndarray:
+    """_ai_choose_attack: lowest rank, non-trumps preferred, lowest suit on ties."""
+    non_trump = valid & ~_SUIT_MASKS[trump]
+    pool  = np.where(non_trump != 0, non_trump, valid)
+    ranks = (pool | pool >> _S9 | pool >> _S18 | pool >> _S27) & _LANE
+    return _lowbit(pool & (_lowbit(ranks) * _SPREAD))
+
+
+def _choose_defence(hand: np.ndarray, attack_bit: np.ndarray,
+                    trump: np.ndarray) -> np.ndarray:
+    """_ai_choose_defence: cheapest beater, same suit before trumps. 0 = take."""
+    idx   = _bit_index(attack_bit)
+    valid = hand & _BEAT[trump, idx]
+    same  = valid & _SUIT_MASKS[idx // 9]
+    # either pool is a single suit, so the lowest bit is the lowest rank
+    return _lowbit(np.where(same != 0, same, valid))
+
+
+# ── results ──────────────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class BatchResult:
+    loser:          np.ndarray    # (K,) seat of the durak, -1 on a tie
+    first_attacker: np.ndarray    # (K,)
+    rounds:         np.ndarray    # (K,)
+    plies:          np.ndarray    # (K,)
+    piles_taken:    np.ndarray    # (K, 2)
+    biggest_pile:   np.ndarray    # (K, 2)
+    trumps_played:  np.ndarray    # (K, 2)
+    passes:         np.ndarray    # (K, 2)
+    elapsed:        float
+
+    @property
+    def games(self) -> int:
+        return len(self.loser)
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def first_attacker_loss_rate(self) -> float:
+        """Share of decided games lost by whoever attacked first."""
+        decided = self.loser >= 0
+        if not decided.any():
+            return 0.0
+        return float(np.mean(self.loser[decided] == self.first_attacker[decided]))
+
+
+# ── simulator ────────────────────────────────────────────────────────────────
+
+class BatchSimulator:
+    def __init__(self, decks: np.ndarray, fallback_attacker: np.ndarray) -> None:
+        """decks: (K, 36) card indices in draw order (last column is the trump
+        card). fallback_attacker: seat that opens when nobody holds a trump."""
+        k = len(decks)
+        self.k      = k
+        self._rows  = np.arange(k)
+        self.deck   = np.ascontiguousarray(decks, dtype=np.int64)
+        self.trump  = self.deck[:, -1] // 9
+        self.cursor = np.full(k, 12, dtype=np.int64)
+
+        # deal 6 each, 2 at a time (Game.setup order)
+        self.hands = np.zeros((k, 2), dtype=np.uint64)
+        for j in range(12):
+            seat = (j // 2) % 2
+            self.hands[:, seat] |= _ONE << self.deck[:, j].astype(np.uint64)
+
+        # lowest trump opens (Game._assign_first_attacker)
+        tmask   = _SUIT_MASKS[self.trump]
+        t0, t1  = self.hands[:, 0] & tmask, self.hands[:, 1] & tmask
+        low0    = np.where(t0 != 0, _bit_index(_lowbit(t0)), 99)
+        low1    = np.where(t1 != 0, _bit_index(_lowbit(t1)), 99)
+        opener  = np.where(low1 < low0, 1, 0)
+        self.attacker = np.where((t0 | t1) == 0, fallback_attacker, opener).astype(np.int64)
+        self.first_attacker = self.attacker.copy()
+
+        self.phase     = np.full(k, ATTACK, dtype=np.int8)
+        self.table_att = np.zeros(k, dtype=np.uint64)
+        self.table_def = np.zeros(k, dtype=np.uint64)
+        self.pending   = np.zeros(k, dtype=np.uint64)   # undefended attack card
+        self.n_attacks = np.zeros(k, dtype=np.int64)
+        self.done      = np.zeros(k, dtype=bool)
+        self.loser     = np.full(k, -1, dtype=np.int64)
+
+        self.rounds        = np.ones(k, dtype=np.int64)
+        self.plies         = np.zeros(k, dtype=np.int64)
+        self.piles_taken   = np.zeros((k, 2), dtype=np.int64)
+        self.biggest_pile  = np.zeros((k, 2), dtype=np.int64)
+        self.trumps_played = np.zeros((k, 2), dtype=np.int64)
+        self.passes        = np.zeros((k, 2), dtype=np.int64)
+
+    @classmethod
+    def from_seeds(cls, seeds: Sequence[int]) -> BatchSimulator:
+        """Same decks and opener as HeadlessEngine(...).play(seed)."""
+        decks = np.array([[card_index(c) for c in Deck.new_shuffled(seed=s).cards]
+                          for s in seeds], dtype=np.int64)
+        fallback = np.array([random.Random(s).randrange(2) for s in seeds], dtype=np.int64)
+        return cls(decks, fallback)
+
+    @classmethod
+    def random(cls, k: int, seed: Optional[int] = None) -> BatchSimulator:
+        """K fresh games shuffled by NumPy (fast; not comparable to from_seeds)."""
+        rng   = np.random.default_rng(seed)
+        decks = np.argsort(rng.random((k, NUM_CARDS)), axis=1)
+        return cls(decks, rng.integers(0, 2, size=k))
+
+    # ── stepping ─────────────────────────────────────────────────────────────
+
+    def step(self) -> int:
+        """Advance every live game by one exchange. Returns games still live."""
+        g = np.flatnonzero(~self.done & (self.phase == ATTACK))
+        if g.size:
+            self._attack(g)
+        g = np.flatnonzero(~self.done & (self.phase == DEFEND))
+        if g.size:
+            self._defend(g)
+        return int(self.k - np.count_nonzero(self.done))
+
+    def run(self) -> BatchResult:
+        start = time.perf_counter()
+        while self.step():
+            pass
+        return BatchResult(
+            loser=self.loser, first_attacker=self.first_attacker,
+            rounds=self.rounds, plies=self.plies,
+            piles_taken=self.piles_taken, biggest_pile=self.biggest_pile,
+            trumps_played=self.trumps_played, passes=self.passes,
+            elapsed=time.perf_counter() - start,
+        )
+
+    def _attack(self, g: np.ndarray) -> None:
+        att   = self.attacker[g]
+        hand  = self.hands[g, att]
+        dcnt  = _popcount(self.hands[g, 1 - att])
+        n     = self.n_attacks[g]
+        first = n == 0
+        valid = np.where(first, hand,
+                         hand & _same_rank(self.table_att[g] | self.table_def[g]))
+        # opening: only blocked by an empty hand on either side;
+        # pile-on: _ai_should_stop_attacking plus the six-card cap
+        stop = (valid == 0) | np.where(first, dcnt == 0, (n >= 6) | (dcnt <= n))
+
+        if stop.any():
+            s = g[stop]
+            self.passes[s, att[stop]] += ~first[stop]
+            self._end_round(s, took=False)
+
+        play = ~stop
+        if play.any():
+            p, pa = g[play], att[play]
+            bit   = _choose_attack(valid[play], self.trump[p])
+            self.hands[p, pa]      ^= bit
+            self.table_att[p]      |= bit
+            self.pending[p]         = bit
+            self.n_attacks[p]      += 1
+            self.plies[p]          += 1
+            self.trumps_played[p, pa] += (bit & _SUIT_MASKS[self.trump[p]]) != 0
+            self.phase[p]           = DEFEND
+
+    def _defend(self, g: np.ndarray) -> None:
+        dfd    = 1 - self.attacker[g]
+        choice = _choose_defence(self.hands[g, dfd], self.pending[g], self.trump[g])
+        take   = choice == 0
+
+        if take.any():
+            t, td = g[take], dfd[take]
+            ta    = 1 - td
+            # the attacker may pile one more card onto the taker (TAKING phase)
+            valid = self.hands[t, ta] & _same_rank(self.table_att[t] | self.table_def[t])
+            more  = (valid != 0) & (self.n_attacks[t] < 6) & (_popcount(self.hands[t, td]) >= 2)
+            bit   = np.where(more, _choose_attack(valid, self.trump[t]), _U(0))
+            self.hands[t, ta]         ^= bit
+            self.table_att[t]         |= bit
+            self.plies[t]             += more
+            self.trumps_played[t, ta] += (bit & _SUIT_MASKS[self.trump[t]]) != 0
+
+            pile  = self.table_att[t] | self.table_def[t]
+            self.hands[t, td]        |= pile
+            self.piles_taken[t, td]  += 1
+            self.biggest_pile[t, td]  = np.maximum(self.biggest_pile[t, td], _popcount(pile))
+            self._end_round(t, took=True)
+
+        ok = ~take
+        if ok.any():
+            d, dd = g[ok], dfd[ok]
+            bit   = choice[ok]
+            self.hands[d, dd]      ^= bit
+            self.table_def[d]      |= bit
+            self.plies[d]          += 1
+            self.trumps_played[d, dd] += (bit & _SUIT_MASKS[self.trump[d]]) != 0
+            self.phase[d]           = ATTACK
+
+    def _end_round(self, g: np.ndarray, took: bool) -> None:
+        if not took:
+            self.attacker[g] = 1 - self.attacker[g]
+        self._draw_up(g)
+
+        self.table_att[g] = 0
+        self.table_def[g] = 0
+        self.n_attacks[g] = 0
+        self.phase[g]     = ATTACK
+
+        c0   = _popcount(self.hands[g, 0])
+        c1   = _popcount(self.hands[g, 1])
+        over = (c0 == 0) | (c1 == 0)
+        self.done[g[over]]  = True
+        self.loser[g[over]] = np.where(c1[over] > 0, 1, np.where(c0[over] > 0, 0, -1))
+        self.rounds[g[~over]] += 1
+
+    def _draw_up(self, g: np.ndarray) -> None:
+        """One card each per pass, new attacker first (GameStateMachine order)."""
+        g   = g[self.cursor[g] < NUM_CARDS]
+        att = self.attacker[g]
+        hands = (self.hands[g, att], self.hands[g, 1 - att])
+        need  = [np.maximum(6 - _popcount(h), 0) for h in hands]
+        cur   = self.cursor[g]
+        for j in range(int(max(n.max(initial=0) for n in need))):
+            for hand, n in zip(hands, need):
+                m     = (j < n) & (cur < NUM_CARDS)
+                card  = self.deck[g, np.minimum(cur, NUM_CARDS - 1)]
+                hand |= np.where(m, _ONE << card.astype(np.uint64), _U(0))
+                cur   = cur + m
+        self.hands[g, att]     = hands[0]
+        self.hands[g, 1 - att] = hands[1]
+        self.cursor[g]         = cur
+
+
+if __name__ == "__main__":
+    import sys
+    k   = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    res = BatchSimulator.random(k, seed=0).run()
+    print(f"{res.games} games in {res.elapsed:.2f}s ({res.games_per_second:.0f} games/s)  "
+          f"ties {np.count_nonzero(res.loser < 0)}  "
+          f"first attacker loses {res.first_attacker_loss_rate():.3f}")
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import bisect
+import os
+import random
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .actions import ATTACKING
+from .canonical import canonical_hand, invert, permute_action
+from .engine import GreedyPolicy, HeadlessEngine, Policy
+from .ismcts import seat_reward
+from .sampler import DealSampler
+from .state_machine import GameStateMachine
+
+
+# ── format ───────────────────────────────────────────────────────────────────
+# The first attack of a game, keyed by the attacker's canonical starting hand
+# (trump moved to spades, other suits sorted; see canonical.py):
+#     header            magic, version, players, transfer mode, entry count
+#     count × uint64    canonical hands, ascending
+#     count × uint8     best opening action per hand, in the canonical frame
+# Lookup is a binary search over the key array; 9 bytes per hand.
+
+MAGIC   = b"FHOB"
+VERSION = 1
+_HEADER = struct.Struct("<4sBBBI")      # magic, version, players, transfer, count
+
+
+def is_opening(machine: GameStateMachine) -> bool:
+    """The first attacker's first decision: nothing drawn or played yet."""
+    g = machine.game
+    return (machine.round == 1 and machine.phase == ATTACKING and not g.table.pairs
+            and g.deck.pos == 6 * len(g.players))
+
+
+class OpeningBook:
+    """A loaded book: sorted canonical hands and their opening actions."""
+
+    def __init__(self, keys: array, actions: bytes, *, players: int = 2,
+                 transfer_mode: bool = False) -> None:
+        self.keys          = keys
+        self.actions       = actions
+        self.players       = players
+        self.transfer_mode = transfer_mode
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def load(cls, path: str) -> OpeningBook:
+        with open(path, "rb") as fp:
+            data = fp.read()
+        magic, version, players, transfer, n = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+        start = _HEADER.size
+        if len(data) != start + 9 * n:
+            raise ValueError(f"{path} is truncated")
+        keys = array("Q")
+        keys.frombytes(data[start:start + 8 * n])
+        if sys.byteorder != "little":
+            keys.byteswap()
+        return cls(keys, data[start + 8 * n:], players=players, transfer_mode=bool(transfer))
+
+    def save(self, path: str) -> None:
+        keys = array("Q", self.keys)
+        if sys.byteorder != "little":
+            keys.byteswap()
+        with open(path, "wb") as fp:
+            fp.write(_HEADER.pack(MAGIC, VERSION, self.players, self.transfer_mode, len(keys)))
+            fp.write(keys.tobytes())
+            fp.write(bytes(self.actions))
+
+    def lookup(self, machine: GameStateMachine) -> Optional[int]:
+        """The book's opening action for the seat to move, or None when this
+        is not a book position or the hand is not in the book."""
+        g = machine.game
+        if (len(g.players) != self.players or machine.transfer_mode != self.transfer_mode
+                or not is_opening(machine)):
+            return None
+        hand, perm = canonical_hand(g.players[machine.to_move()].hand_mask(), g.deck.trump)
+        i = bisect.bisect_left(self.keys, hand)
+        if i == len(self.keys) or self.keys[i] != hand:
+            return None
+        return permute_action(self.actions[i], invert(perm))
+
+
+class BookPolicy(Policy):
+    """Plays the opening book's first attack, and fallback everywhere else."""
+
+    def __init__(self, book: OpeningBook, fallback: Optional[Policy] = None) -> None:
+        self.book     = book
+        self.fallback = fallback or GreedyPolicy()
+        self.name     = f"book+{self.fallback.name}"
+
+    def choose(self, machine: GameStateMachine) -> int:
+        action = self.book.lookup(machine)
+        if action is not None and action in machine.legal_actions():
+            return action
+        return self.fallback.choose(machine)
+
+
+# ── generator ────────────────────────────────────────────────────────────────
+# Flat Monte Carlo from the first attacker's point of view: for every legal
+# opening, deal the unseen cards at random, play the attack and finish the
+# game with the rollout policy. Each seed's deal gets one DealSampler, and
+# the hidden cards for all its rollouts come from one sample_many() call.
+# Totals are summed per canonical (hand, action), so hands that come up in
+# several deals pool their samples.
+
+Totals = Dict[int, Dict[int, List[float]]]     # hand → action → [reward, games]
+
+
+def _sample_deals(seeds: range, rollouts: int, players: int, transfer_mode: bool) -> Totals:
+    """Worker entry point: evaluate the opening of each seed's deal."""
+    engine  = HeadlessEngine([GreedyPolicy()] * players, transfer_mode=transfer_mode)
+    rollout = GreedyPolicy()
+    totals: Totals = defaultdict(dict)
+    for seed in seeds:
+        rng     = random.Random(seed)
+        machine = engine.new_game(seed)
+        machine.start()
+        seat    = machine.to_move()
+        hand, perm = canonical_hand(machine.game.players[seat].hand_mask(),
+                                    machine.game.deck.trump)
+        sampler = DealSampler(machine, seat)
+        legal   = machine.legal_actions()
+        deals   = sampler.sample_many(rollouts * len(legal), rng)
+        for n, action in enumerate(legal):
+            t = totals[hand].setdefault(permute_action(action, perm), [0.0, 0])
+            for deal in deals[n * rollouts:(n + 1) * rollouts]:
+                m = sampler.restore(*deal)
+                m.apply(action, check=False)
+                while not m.over:
+                    m.apply(rollout.choose(m), check=False)
+                t[0] += seat_reward(m, seat)
+                t[1] += 1
+    return totals
+
+
+def build(n_deals: int, *, rollouts: int = 8, players: int = 2, transfer_mode: bool = False,
+          first_seed: int = 0, shard_size: int = 50, workers: Optional[int] = None,
+          on_shard: Optional[Callable[[int, int], None]] = None) -> OpeningBook:
+    """Simulate n_deals seeded deals across all cores and keep the opening
+    with the best mean reward for every canonical hand met. on_shard, if
+    given, gets (shards done, shards total)."""
+    totals: Totals = defaultdict(dict)
+    shards = [range(s, min(s + shard_size, first_seed + n_deals))
+              for s in range(first_seed, first_seed + n_deals, shard_size)]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(_sample_deals, s, rollouts, players, transfer_mode)
+                   for s in shards]
+        for done, fut in enumerate(as_completed(futures), start=1):
+            for hand, by_action in fut.result().items():
+                mine = totals[hand]
+                for action, (reward, games) in by_action.items():
+                    t = mine.setdefault(action, [0.0, 0])
+                    t[0] += reward
+                    t[1] += games
+            if on_shard:
+                on_shard(done, len(shards))
+
+    keys = array("Q", sorted(totals))
+    best = bytes(max(sorted(totals[h]), key=lambda a: totals[h][a][0] / totals[h][a][1])
+                 for h in keys)
+    return OpeningBook(keys, best, players=players, transfer_mode=transfer_mode)
+
+
+if __name__ == "__main__":
+    out = sys.argv[1] if len(sys.argv) > 1 else "openings.fhob"
+    n   = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    book = build(n, on_shard=lambda d, k: print(f"\r  {d}/{k} shards", end="", flush=True))
+    book.save(out)
+    print(f"\n{len(book)} hands → {out}")
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Sequence, Tuple
+
+from .actions import TAKE
+from .card import Suit, CARDS, NUM_CARDS, _SUIT_INDEX
+from .cardset import CardSet, NUM_RANKS, _LANE, permute_suits
+from .deck import Deck
+from .record import Snapshot, take_snapshot
+from .state_machine import GameStateMachine
+
+
+# ── suit isomorphism ─────────────────────────────────────────────────────────
+# Durak rules never tell the three non-trump suits apart, and the trump is
+# only special for being the trump. So relabeling suits gives an equivalent
+# position as long as the trump moves with its lane. The canonical form
+# moves the trump lane to spades (FRAME_TRUMP), then sorts the other three
+# lanes by what they hold, largest first. Up to 24 labelings of one position
+# (6 for a fixed trump) end up as a single form.
+#
+# A Perm is a tuple with perm[i] = the lane that suit lane i moves to, which
+# is the same as permute_suits. Use it to map cards and actions into the
+# canonical frame; invert(perm) maps them back.
+
+Perm = Tuple[int, ...]
+
+FRAME_TRUMP = Suit.SPADES
+_FRAME      = _SUIT_INDEX[FRAME_TRUMP]
+_LANES      = range(len(Suit))
+_FREE       = [i for i in _LANES if i != _FRAME]
+IDENTITY: Perm = tuple(_LANES)
+
+
+def lane(mask: CardSet, i: int) -> int:
+    """The 9 rank bits of suit lane i."""
+    return mask >> (i * NUM_RANKS) & _LANE
+
+
+def suit_perm(keys: Sequence, trump: Suit) -> Perm:
+    """Send trump to the frame lane and the other lanes, in decreasing order
+    of keys[lane], to the remaining lanes. Lanes with equal keys keep their
+    order, which does not matter when equal keys mean equal contents."""
+    t    = _SUIT_INDEX[trump]
+    rest = sorted((i for i in _LANES if i != t), key=keys.__getitem__, reverse=True)
+    perm = [0] * len(Suit)
+    perm[t] = _FRAME
+    for dest, i in zip(_FREE, rest):
+        perm[i] = dest
+    return tuple(perm)
+
+
+def frame_perm(trump: Suit) -> Perm:
+    """Swap the trump lane with the frame lane, nothing else."""
+    perm = list(IDENTITY)
+    t = _SUIT_INDEX[trump]
+    perm[t], perm[_FRAME] = _FRAME, t
+    return tuple(perm)
+
+
+def to_frame(mask: CardSet, trump: Suit) -> CardSet:
+    """mask with the trump lane swapped into the frame lane."""
+    return mask if trump == FRAME_TRUMP else permute_suits(mask, frame_perm(trump))
+
+
+def invert(perm: Perm) -> Perm:
+    out = [0] * len(perm)
+    for i, j in enumerate(perm):
+        out[j] = i
+    return tuple(out)
+
+
+def permute_card(card_id: int, perm: Perm) -> int:
+    suit, rank = divmod(card_id, NUM_RANKS)
+    return perm[suit] * NUM_RANKS + rank
+
+
+def permute_action(action: int, perm: Perm) -> int:
+    """An action with its card relabeled; TAKE and PASS pass through."""
+    if action >= TAKE:
+        return action
+    card = action % NUM_CARDS
+    return action - card + permute_card(card, perm)
+
+
+# ── canonical forms ──────────────────────────────────────────────────────────
+
+def canonical_hand(hand: CardSet, trump: Suit) -> Tuple[CardSet, Perm]:
+    """(canonical hand, perm) with permute_suits(hand, perm) == canonical hand."""
+    perm = suit_perm([lane(hand, i) for i in _LANES], trump)
+    return permute_suits(hand, perm), perm
+
+
+def canonical_position(masks: Sequence[CardSet], trump: Suit) -> Tuple[Tuple[CardSet, ...], Perm]:
+    """Canonical form of a position given as card sets (hands, table, deck,
+    ...) in a fixed order. Lanes are compared on the first mask, then the
+    next, and so on, so a canonical position also has a canonical first
+    mask."""
+    perm = suit_perm([tuple(lane(m, i) for m in masks) for i in _LANES], trump)
+    return tuple(permute_suits(m, perm) for m in masks), perm
+
+
+def canonical_snapshot(snap: Snapshot, deck: Deck) -> Tuple[Snapshot, Deck, Perm]:
+    """A full game position in canonical form: the snapshot and deck with
+    every card relabeled, trump spades. Lanes are ordered by the hands in
+    seat order, then where their cards sit in the rest of the deck (draw
+    order matters, not just which cards are left), then which table slots
+    they hold. restore_snapshot on the result gives an equivalent game whose
+    legal actions are the originals mapped with permute_action."""
+    left  = deck.cards[deck.pos:]
+    keys  = []
+    for i in _LANES:
+        keys.append((tuple(lane(h, i) for h in snap.hands),
+                     tuple(n for n, c in enumerate(left) if c.id // NUM_RANKS == i),
+                     tuple(n for n, c in enumerate(snap.attacks) if c // NUM_RANKS == i),
+                     tuple(n for n, c in enumerate(snap.defences) if c >= 0 and c // NUM_RANKS == i)))
+    perm = suit_perm(keys, deck.trump)
+    snap = replace(snap,
+                   hands=tuple(permute_suits(h, perm) for h in snap.hands),
+                   attacks=tuple(permute_card(c, perm) for c in snap.attacks),
+                   defences=tuple(permute_card(c, perm) if c >= 0 else -1 for c in snap.defences))
+    deck = Deck(cards=[CARDS[permute_card(c.id, perm)] for c in deck.cards],
+                trump=FRAME_TRUMP, pos=deck.pos)
+    return snap, deck, perm
+
+
+def canonical_game(machine: GameStateMachine) -> Tuple[Snapshot, Deck, Perm]:
+    """canonical_snapshot of a live machine."""
+    return canonical_snapshot(take_snapshot(machine, 0), machine.game.deck)
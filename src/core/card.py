@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterable
+from typing import Iterable, List
 
 
 class Suit(Enum):
@@ -25,10 +25,21 @@ def ranks_on_cards(cards: Iterable[Card]) -> set[str]:
     return {c.rank for c in cards}
 
 
+_SUIT_INDEX = {s: i for i, s in enumerate(Suit)}
+
+
 @dataclass(frozen=True, slots=True)
 class Card:
     suit: Suit
     rank: str  # one of RANKS_32
+    # small-integer id (suit_index * 9 + rank_value), indexes the rule tables
+    id: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        v = _RANK_VALUE.get(self.rank)
+        if v is None:
+            raise ValueError(f"rank {self.rank!r} is not in the 36-card deck")
+        object.__setattr__(self, "id", _SUIT_INDEX[self.suit] * len(RANKS_32) + v)
 
     def rank_value(self) -> int:
         return _RANK_VALUE[self.rank]
@@ -38,19 +49,44 @@ class Card:
 
     def can_beat(self, other: Card, trump: Suit) -> bool:
         """Return True if self beats other under Durak rules."""
-        if self.suit == other.suit:
-            return self.rank_value() > other.rank_value()
-        if self.is_trump(trump) and not other.is_trump(trump):
-            return True
-        return False
+        return BEATS[trump][other.id * NUM_CARDS + self.id] == 1
 
-    def sort_key(self, trump: Suit) -> tuple:
+    def sort_key(self, trump: Suit) -> int:
         """Non-trumps first (by rank, then suit as tiebreaker), trumps last."""
-        is_trump = 1 if self.suit == trump else 0
-        return (is_trump, self.rank_value(), list(Suit).index(self.suit))
+        return SORT_KEYS[trump][self.id]
+
+    def canonical(self) -> Card:
+        """The interned registry instance equal to this card."""
+        return CARDS[self.id]
 
     def __str__(self) -> str:
         return f"{self.rank}{self.suit}"
 
     def __repr__(self) -> str:
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()
+
+
+# ── registry ─────────────────────────────────────────────────────────────────
+# The 36 interned cards, indexed by Card.id. Deck deals these instances, so
+# hands, table and discards only ever hold registry cards.
+
+CARDS: List[Card] = [Card(suit=s, rank=r) for s in Suit for r in RANKS_32]
+NUM_CARDS = len(CARDS)
+
+
+def _beats(a: Card, b: Card, trump: Suit) -> bool:
+    if a.suit == b.suit:
+        return _RANK_VALUE[a.rank] > _RANK_VALUE[b.rank]
+    return a.suit == trump
+
+
+def _sort_key(c: Card, trump: Suit) -> int:
+    is_trump = 1 if c.suit == trump else 0
+    return (is_trump * len(RANKS_32) + _RANK_VALUE[c.rank]) * len(Suit) + _SUIT_INDEX[c.suit]
+
+
+# SORT_KEYS[trump][id] → int key, same order as (is_trump, rank, suit_index)
+SORT_KEYS = {t: [_sort_key(c, t) for c in CARDS] for t in Suit}
+
+# BEATS[trump][attack.id * 36 + defence.id] == 1 when defence beats attack
+BEATS = {t: bytes(_beats(d, a, t) for a in CARDS for d in CARDS) for t in Suit}
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Iterable, List
+
+from .card import Card, Suit, RANKS_32, CARDS, BEATS, NUM_CARDS, _RANK_VALUE, _SUIT_INDEX
+
+
+# A CardSet is a plain int used as a 36-bit set of cards.
+# Bit layout is suit-major: bit = suit_index * 9 + rank_value, so each suit
+# occupies a contiguous 9-bit lane and a rank sits at the same offset in
+# every lane. Folding the four lanes together gives a 9-bit rank set.
+CardSet = int
+
+NUM_RANKS = len(RANKS_32)
+
+EMPTY:     CardSet = 0
+FULL_DECK: CardSet = (1 << NUM_CARDS) - 1
+
+_LANE = (1 << NUM_RANKS) - 1          # one suit's 9 bits
+_SPREAD = sum(1 << (s * NUM_RANKS) for s in range(len(Suit)))  # 1 bit per lane
+
+# every card, in bit order (bit index == Card.id)
+ALL_CARDS: List[Card] = CARDS
+
+# SUIT_MASK[suit]  → all 9 cards of that suit
+# RANK_MASK[rank]  → all 4 cards of that rank
+SUIT_MASK = {s: _LANE << (i * NUM_RANKS) for s, i in _SUIT_INDEX.items()}
+RANK_MASK = {r: _SPREAD << v for r, v in _RANK_VALUE.items()}
+
+
+def _build_beaters(trump: Suit) -> List[CardSet]:
+    """For each card id, the set of cards that beat it under this trump."""
+    beats = BEATS[trump]
+    out = []
+    for a in range(NUM_CARDS):
+        row = beats[a * NUM_CARDS:(a + 1) * NUM_CARDS]
+        out.append(sum(1 << d for d in range(NUM_CARDS) if row[d]))
+    return out
+
+
+# computed once per trump at import: BEATERS[trump][card_id]
+BEATERS = {t: _build_beaters(t) for t in Suit}
+
+
+# ── conversions ──────────────────────────────────────────────────────────────
+
+def card_index(card: Card) -> int:
+    return card.id
+
+
+def card_bit(card: Card) -> CardSet:
+    return 1 << card.id
+
+
+def mask_of(cards: Iterable[Card]) -> CardSet:
+    """Pack a collection of cards into a CardSet."""
+    m = 0
+    for c in cards:
+        m |= 1 << c.id
+    return m
+
+
+def cards_of(mask: CardSet) -> List[Card]:
+    """Unpack a CardSet into cards, in bit order."""
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(ALL_CARDS[low.bit_length() - 1])
+        mask ^= low
+    return out
+
+
+def filter_cards(cards: Iterable[Card], mask: CardSet) -> List[Card]:
+    """Cards from an ordered collection that are in mask (order preserved)."""
+    return [c for c in cards if mask >> c.id & 1]
+
+
+def count(mask: CardSet) -> int:
+    return mask.bit_count()
+
+
+# ── rank folding ─────────────────────────────────────────────────────────────
+
+def rank_bits(mask: CardSet) -> int:
+    """9-bit set of ranks present in mask (bit = rank_value)."""
+    return (mask | mask >> 9 | mask >> 18 | mask >> 27) & _LANE
+
+
+def cards_of_ranks(ranks: int) -> CardSet:
+    """All cards (every suit) whose rank bit is set in a 9-bit rank set."""
+    return ranks * _SPREAD
+
+
+def same_rank_cards(mask: CardSet) -> CardSet:
+    """All cards sharing a rank with any card in mask."""
+    return rank_bits(mask) * _SPREAD
+
+
+def beaters(card: Card, trump: Suit) -> CardSet:
+    """Every card that beats card under the given trump."""
+    return BEATERS[trump][card.id]
+
+
+# ── suit permutation ─────────────────────────────────────────────────────────
+
+def permute_suits(mask: CardSet, perm) -> CardSet:
+    """Move each suit lane i of mask to lane perm[i] (perm is a permutation
+    of suit indices). Ranks stay put, so rules are unchanged when the trump
+    moves with them."""
+    out = 0
+    for i, j in enumerate(perm):
+        out |= (mask >> (i * NUM_RANKS) & _LANE) << (j * NUM_RANKS)
+    return out
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
-from .card import Card, Suit, RANKS_32
+from . import zobrist
+from .card import Card, Suit, CARDS
+from .cardset import CardSet, mask_of
 
 
 @dataclass(slots=True)
 class Deck:
+    # cards in draw order; cards[pos:] are still in the deck and cards[-1] is
+    # the face-up trump card, which stays put until it is the last one drawn
     cards: List[Card]
     trump: Suit
+    pos: int = 0
+    _mask: CardSet = field(default=0, init=False, repr=False, compare=False)
+    # Zobrist key of the trump and the cards still in the deck (the cursor is
+    # implied by how many remain; the order below it is fixed per shuffle)
+    key:   int     = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._mask = mask_of(self.cards[self.pos:])
+        self.key   = zobrist.TRUMP[self.trump] ^ zobrist.cards_key(self._mask, zobrist.DECK)
 
     @classmethod
     def new_shuffled(cls, *, seed: Optional[int] = None) -> Deck:
         rng = random.Random(seed)
-        all_cards: List[Card] = [Card(suit=s, rank=r) for s in Suit for r in RANKS_32]
+        all_cards: List[Card] = list(CARDS)   # registry instances, suit-major order
         rng.shuffle(all_cards)
 
         # In Durak, trump is usually revealed from the bottom card.
@@ -24,14 +37,49 @@ class Deck:
         return cls(cards=all_cards, trump=trump_suit)
 
     def draw(self) -> Card:
-        if not self.cards:
+        if self.pos >= len(self.cards):
             raise IndexError("Cannot draw: deck is empty")
-        return self.cards.pop(0)
+        card = self.cards[self.pos]
+        self.pos   += 1
+        self._mask ^= 1 << card.id
+        self.key   ^= zobrist.DECK[card.id]
+        return card
+
+    def draw_many(self, k: int) -> List[Card]:
+        """Draw up to k cards in one slice (fewer if the deck runs out)."""
+        out = self.cards[self.pos:self.pos + max(0, k)]
+        z   = zobrist.DECK
+        for card in out:
+            self.key ^= z[card.id]
+        self.pos   += len(out)
+        self._mask ^= mask_of(out)
+        return out
+
+    def deal(self, n_players: int, per_player: int, chunk: int = 2) -> List[List[Card]]:
+        """Deal per_player cards to each of n_players, chunk cards at a time
+        round-robin (the table deal: 2 each, three times around). The last
+        chunk is short when per_player is not a multiple of chunk; if the
+        deck runs out, later hands come up short."""
+        if n_players < 1 or per_player < 0 or chunk < 1:
+            raise ValueError("deal needs n_players >= 1, per_player >= 0, chunk >= 1")
+        block = self.draw_many(n_players * per_player)
+        hands: List[List[Card]] = [[] for _ in range(n_players)]
+        k = 0
+        for start in range(0, per_player, chunk):
+            take = min(chunk, per_player - start)
+            for hand in hands:
+                hand.extend(block[k:k + take])
+                k += take
+        return hands
 
     def remaining(self) -> int:
-        return len(self.cards)
+        return len(self.cards) - self.pos
+
+    def mask(self) -> CardSet:
+        """Cards still in the deck, as a CardSet."""
+        return self._mask
 
     def peek_bottom(self) -> Card:
-        if not self.cards:
+        if self.pos >= len(self.cards):
             raise IndexError("Deck empty")
-        return self.cards[-1]
\ No newline at end of file
+        return self.cards[-1]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+from .card import Card, Suit, CARDS
+from .cardset import BEATERS, CardSet, NUM_RANKS, SUIT_MASK
+from .engine import GreedyPolicy
+from .game import Game
+from .table import Table
+
+
+# ── cover solver ─────────────────────────────────────────────────────────────
+# Covering the table is an assignment problem: every undefended attack needs
+# its own beater from the defender's hand. With at most six attacks, a DP
+# over the subset of attacks covered so far is exact and small: cards are
+# taken one at a time and each may cover one attack it beats or sit out, so
+# there are at most 64 states per card and only cards that beat something
+# are looked at.
+
+def defence_cost(card_id: int, trump: Suit) -> int:
+    """What spending a card costs the defender: its rank, plus a full suit
+    of ranks for a trump, so any plain card is cheaper than any trump."""
+    rank = card_id % NUM_RANKS
+    return rank + NUM_RANKS if SUIT_MASK[trump] >> card_id & 1 else rank
+
+
+def cover(attacks: Sequence[int], hand: CardSet,
+          trump: Suit) -> Optional[Tuple[int, Tuple[int, ...]]]:
+    """Cheapest complete defence of attacks (card ids) from hand.
+
+    Returns (total cost, defence card id per attack) or None when some
+    attack cannot be covered, whatever else is played. Ties go to the
+    assignment found first, with hand cards taken in bit order."""
+    n    = len(attacks)
+    full = (1 << n) - 1
+    beat = BEATERS[trump]
+    # which attacks each useful hand card beats
+    useful: List[Tuple[int, int]] = []
+    reach  = 0
+    rest   = hand
+    while rest:
+        low   = rest & -rest
+        rest ^= low
+        c     = low.bit_length() - 1
+        hits  = 0
+        for i, a in enumerate(attacks):
+            if beat[a] >> c & 1:
+                hits |= 1 << i
+        if hits:
+            useful.append((c, hits))
+            reach |= hits
+    if reach != full or len(useful) < n:
+        return None
+
+    # best[mask] = (cost, defences) for covering exactly the attacks in mask
+    best: List[Optional[Tuple[int, Tuple[int, ...]]]] = [None] * (full + 1)
+    best[0] = (0, (-1,) * n)
+    for c, hits in useful:
+        cost = defence_cost(c, trump)
+        for mask in range(full, -1, -1):          # high to low: each card once
+            cur = best[mask]
+            if cur is None:
+                continue
+            free = hits & ~mask
+            while free:
+                bit   = free & -free
+                free ^= bit
+                i     = bit.bit_length() - 1
+                total = cur[0] + cost
+                dst   = best[mask | bit]
+                if dst is None or total < dst[0]:
+                    defs    = list(cur[1])
+                    defs[i] = c
+                    best[mask | bit] = (total, tuple(defs))
+    return best[full]
+
+
+def cover_table(table: Table, hand: CardSet, trump: Suit) -> Optional[Tuple[int, List[Card]]]:
+    """cover() for the table's undefended attacks, in slot order: (cost,
+    defence card per undefended slot), or None if the defender must take."""
+    attacks = [p.attack.id for p in table.pairs if p.defence is None]
+    plan    = cover(attacks, hand, trump)
+    if plan is None:
+        return None
+    return plan[0], [CARDS[c] for c in plan[1]]
+
+
+# ── policy ───────────────────────────────────────────────────────────────────
+
+class CoverPolicy(GreedyPolicy):
+    """GreedyPolicy that defends with the cheapest complete cover of the
+    table and takes at once when there is none. Attackers can only add
+    cards, so a table that cannot be covered now never can be, and beating
+    some of it first only hands the attacker more ranks to pile on."""
+
+    name = "cover"
+
+    def defend(self, game: Game, seat: int, attack_card: Card) -> Optional[Card]:
+        table = game.table
+        plan  = cover_table(table, game.players[seat].hand_mask(), game.deck.trump)
+        if plan is None:
+            return None
+        slot = [p.attack for p in table.pairs if p.defence is None].index(attack_card)
+        return plan[1][slot]
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from . import zobrist
+from .actions import (
+    ATTACK, DEFEND, TRANSFER, TAKE, PASS, ATTACKING, DEFENDING, TAKING,
+)
+from .card import Suit, SORT_KEYS, NUM_CARDS
+from .cardset import FULL_DECK, BEATERS, cards_of_ranks, rank_bits
+from .engine import GreedyPolicy
+from .state_machine import GameStateMachine
+
+
+# ── positions ────────────────────────────────────────────────────────────────
+# Once the deck is empty in a two-player game nothing is hidden: each side's
+# hand is everything not in its own hand, on the table or in the discards.
+# The solver then works on plain tuples instead of Game objects:
+#     (hand0, hand1, attacker, phase, attack mask, defence mask,
+#      undefended attack ids in play order, transferred, zobrist key)
+# Seat 0 maximises, seat 1 minimises; values are 1 (seat 0 gets out),
+# 0 (seat 0 is the durak) and 0.5 (both empty on the same round).
+
+H0, H1, ATT, PHASE, AMASK, DMASK, UNDEF, TRANSFERRED, KEY = range(9)
+
+WIN, TIE, LOSS = 1.0, 0.5, 0.0
+
+# endgame-only features, drawn from the shared Zobrist generator
+_bits = zobrist.bits
+
+Z_HAND  = [[_bits() for _ in range(NUM_CARDS)] for _ in range(2)]
+Z_ATT   = [_bits() for _ in range(NUM_CARDS)]
+Z_DEF   = [_bits() for _ in range(NUM_CARDS)]
+Z_QUEUE = [[_bits() for _ in range(NUM_CARDS)] for _ in range(12)]  # undefended slot order
+Z_SIDE  = _bits()                                                   # seat 1 attacks
+Z_PHASE = {ATTACKING: 0, DEFENDING: _bits(), TAKING: _bits()}
+Z_TRANSFERRED = _bits()
+
+
+def _queue_key(undef: Tuple[int, ...]) -> int:
+    k = 0
+    for i, c in enumerate(undef):
+        k ^= Z_QUEUE[i][c]
+    return k
+
+
+def position_key(h0: int, h1: int, attacker: int, phase: str, amask: int,
+                 dmask: int, undef: Tuple[int, ...], transferred: bool) -> int:
+    """Zobrist key of a position from scratch (moves update it incrementally)."""
+    k = (zobrist.cards_key(h0, Z_HAND[0]) ^ zobrist.cards_key(h1, Z_HAND[1]) ^
+         zobrist.cards_key(amask, Z_ATT) ^ zobrist.cards_key(dmask, Z_DEF) ^ _queue_key(undef) ^
+         Z_PHASE[phase])
+    if attacker:
+        k ^= Z_SIDE
+    if transferred:
+        k ^= Z_TRANSFERRED
+    return k
+
+
+def position_of(machine: GameStateMachine) -> tuple:
+    g     = machine.game
+    table = g.table
+    h0, h1 = g.players[0].hand_mask(), g.players[1].hand_mask()
+    undef  = tuple(p.attack.id for p in table.pairs if p.defence is None)
+    amask, dmask = table.attack_mask(), table.defence_mask()
+    return (h0, h1, g.attacker_idx, machine.phase, amask, dmask, undef,
+            machine.transferred,
+            position_key(h0, h1, g.attacker_idx, machine.phase, amask, dmask,
+                         undef, machine.transferred))
+
+
+def mover(pos: tuple) -> int:
+    """Seat to act in a position."""
+    return pos[ATT] if pos[PHASE] != DEFENDING else 1 - pos[ATT]
+
+
+def is_endgame(machine: GameStateMachine) -> bool:
+    g = machine.game
+    return not machine.over and len(g.players) == 2 and g.deck.remaining() == 0
+
+
+# ── solver ───────────────────────────────────────────────────────────────────
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# tablebase outcome for the attacker → solver value for the attacker
+_TB_VALUE = {1: WIN, 2: LOSS, 3: TIE}
+
+
+class SearchBudgetExceeded(Exception):
+    pass
+
+
+class EndgameSolver:
+    """Exact alpha-beta over two-player endgames (empty deck).
+
+    Moves are ordered transposition-table move first, then cheapest card
+    first, with TAKE / PASS last. The table maps Zobrist keys to (value,
+    bound, best action) and is kept across calls, so successive decisions
+    in one endgame mostly hit it. Each solve() visits at most max_nodes
+    positions, which bounds response time. With a Tablebase (classic rules
+    only), round starts it covers are scored by one lookup instead of a
+    subtree.
+
+    Transfer mode can cycle (each side keeps transferring and taking back).
+    The rules have no draw by repetition; as a search approximation a
+    position repeating on the current path scores 0.5, and any value that
+    depended on such a cut-off is path-dependent, so it is never stored."""
+
+    def __init__(self, trump: Suit, *, transfer_mode: bool = False,
+                 max_nodes: int = 100_000, max_entries: int = 1 << 20,
+                 tablebase=None) -> None:
+        self.trump         = trump
+        self.transfer_mode = transfer_mode
+        self.tablebase     = None if transfer_mode else tablebase
+        self.max_nodes     = max_nodes
+        self.max_entries   = max_entries
+        self.table: Dict[int, Tuple[float, int, int]] = {}
+        self.nodes = 0
+        self._beaters = BEATERS[trump]
+        keys = SORT_KEYS[trump]
+        self._order = sorted(range(NUM_CARDS), key=lambda c: keys[c])   # cheapest first
+        self._path: set[int] = set()
+        self._repeated  = False     # current subtree hit a repetition cut-off
+        self._last_move = -1        # best move of the last node searched
+
+    # ── rules on positions (mirror GameStateMachine with an empty deck) ─────
+
+    def _cards(self, mask: int, kind: int, out: List[int]) -> None:
+        for c in self._order:
+            if mask >> c & 1:
+                out.append(kind + c)
+
+    def legal(self, pos: tuple) -> List[int]:
+        att   = pos[ATT]
+        hands = (pos[H0], pos[H1])
+        am, dm, undef = pos[AMASK], pos[DMASK], pos[UNDEF]
+        out: List[int] = []
+        if pos[PHASE] == DEFENDING:
+            hand = hands[1 - att]
+            self._cards(hand & self._beaters[undef[0]], DEFEND, out)
+            if self.transfer_mode and not dm:
+                ranks = rank_bits(am)
+                if not ranks & (ranks - 1) and hands[att].bit_count() >= am.bit_count() + 1:
+                    self._cards(hand & cards_of_ranks(ranks), TRANSFER, out)
+            out.append(TAKE)
+            return out
+        if am.bit_count() < 6 and len(undef) < hands[1 - att].bit_count():
+            allowed = cards_of_ranks(rank_bits(am | dm)) if am else FULL_DECK
+            self._cards(hands[att] & allowed, ATTACK, out)
+        if am:
+            out.append(PASS)
+        return out
+
+    def apply(self, pos: tuple, action: int):
+        """The position after action, or the game value if it ends the game."""
+        h = [pos[H0], pos[H1]]
+        att, phase, am, dm, undef, tr, key = pos[ATT:]
+        d = 1 - att
+
+        if action < TAKE:
+            kind, c = action - action % NUM_CARDS, action % NUM_CARDS
+            bit = 1 << c
+            if kind == DEFEND:
+                h[d] ^= bit
+                dm   |= bit
+                key  ^= Z_HAND[d][c] ^ Z_DEF[c] ^ _queue_key(undef)
+                undef = undef[1:]
+                key  ^= _queue_key(undef)
+                if not undef:
+                    key  ^= Z_PHASE[phase] ^ Z_PHASE[ATTACKING]
+                    phase = ATTACKING
+            else:
+                mover = att if kind == ATTACK else d
+                h[mover] ^= bit
+                am  |= bit
+                key ^= Z_HAND[mover][c] ^ Z_ATT[c] ^ Z_QUEUE[len(undef)][c]
+                undef += (c,)
+                if kind == TRANSFER:
+                    att, d = d, att
+                    key ^= Z_SIDE
+                    if not tr:
+                        key ^= Z_TRANSFERRED
+                        tr = True
+            return (h[0], h[1], att, phase, am, dm, undef, tr, key)
+
+        if action == TAKE:
+            if (not tr and am.bit_count() < 6 and len(undef) < h[d].bit_count()
+                    and h[att] & cards_of_ranks(rank_bits(am | dm))):
+                key ^= Z_PHASE[phase] ^ Z_PHASE[TAKING]
+                return (h[0], h[1], att, TAKING, am, dm, undef, tr, key)
+            h[d] |= am | dm
+            return self._new_round(h, att)
+
+        # PASS
+        if phase == TAKING:
+            h[d] |= am | dm
+            return self._new_round(h, att)
+        if undef:
+            key ^= Z_PHASE[phase] ^ Z_PHASE[DEFENDING]
+            return (h[0], h[1], att, DEFENDING, am, dm, undef, tr, key)
+        return self._new_round(h, d)
+
+    @staticmethod
+    def _new_round(h: List[int], att: int):
+        if not h[0] or not h[1]:
+            if h[0]:
+                return LOSS
+            return WIN if h[1] else TIE
+        return (h[0], h[1], att, ATTACKING, 0, 0, (), False,
+                position_key(h[0], h[1], att, ATTACKING, 0, 0, (), False))
+
+    # ── search ───────────────────────────────────────────────────────────────
+
+    def solve(self, machine: GameStateMachine) -> Optional[Tuple[float, int]]:
+        """(value for the player to move, best action), or None when the
+        machine is not in an endgame or the node budget runs out."""
+        if not is_endgame(machine):
+            return None
+        if len(self.table) > self.max_entries:
+            self.table.clear()
+        pos = position_of(machine)
+        self.nodes = 0
+        self._path.clear()
+        self._repeated = False
+        try:
+            value = self._search(pos, LOSS, WIN)
+        except SearchBudgetExceeded:
+            return None
+        action = self._last_move
+        return (value if mover(pos) == 0 else 1.0 - value), action
+
+    def _search(self, pos: tuple, alpha: float, beta: float) -> float:
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise SearchBudgetExceeded
+        key = pos[KEY]
+        if key in self._path:
+            self._repeated = True
+            return TIE
+
+        tt_move = -1
+        entry = self.table.get(key)
+        if entry is not None:
+            value, bound, tt_move = entry
+            if (bound == EXACT or (bound == LOWER and value >= beta)
+                    or (bound == UPPER and value <= alpha)):
+                self._last_move = tt_move
+                return value
+
+        if self.tablebase is not None and pos[AMASK] == 0 and self.nodes > 1:
+            att   = pos[ATT]
+            hands = (pos[H0], pos[H1])
+            hit   = self.tablebase.probe(hands[att], hands[1 - att], self.trump)
+            if hit is not None:
+                value = _TB_VALUE[hit[0]]
+                return value if att == 0 else 1.0 - value
+
+        moves = self.legal(pos)
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        maximise = mover(pos) == 0
+        a0, b0 = alpha, beta
+        best, best_move = (-1.0 if maximise else 2.0), moves[0]
+        outer_repeated, self._repeated = self._repeated, False
+        self._path.add(key)
+        for move in moves:
+            child = self.apply(pos, move)
+            v = child if isinstance(child, float) else self._search(child, alpha, beta)
+            if maximise:
+                if v > best:
+                    best, best_move = v, move
+                    alpha = max(alpha, v)
+            elif v < best:
+                best, best_move = v, move
+                beta = min(beta, v)
+            if alpha >= beta:
+                break
+        self._path.discard(key)
+
+        if not self._repeated:
+            bound = UPPER if best <= a0 else LOWER if best >= b0 else EXACT
+            self.table[key] = (best, bound, best_move)
+        self._repeated  = self._repeated or outer_repeated
+        self._last_move = best_move
+        return best
+
+
+# ── policy ───────────────────────────────────────────────────────────────────
+
+class EndgamePolicy(GreedyPolicy):
+    """GreedyPolicy that plays the exact solver's move once the deck is empty
+    in a two-player game, and falls back to the heuristics if the solver
+    runs out of nodes."""
+
+    name = "endgame"
+
+    def __init__(self, *, max_nodes: int = 100_000, tablebase=None) -> None:
+        self.max_nodes = max_nodes
+        self.tablebase = tablebase
+        self._solvers: Dict[tuple, EndgameSolver] = {}
+
+    def solver(self, machine: GameStateMachine) -> EndgameSolver:
+        spec = (machine.game.deck.trump, machine.transfer_mode)
+        s = self._solvers.get(spec)
+        if s is None:
+            s = self._solvers[spec] = EndgameSolver(
+                spec[0], transfer_mode=spec[1], max_nodes=self.max_nodes,
+                tablebase=self.tablebase)
+        return s
+
+    def choose(self, machine: GameStateMachine) -> int:
+        if is_endgame(machine):
+            solved = self.solver(machine).solve(machine)
+            if solved is not None:
+                return solved[1]
+        return super().choose(machine)
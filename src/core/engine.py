@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence
+
+from .actions import (
+    ATTACK, DEFEND, TRANSFER, TAKE, PASS, DEFENDING, TAKING,
+    can_add_attack, describe, encode, next_defender,
+)
+from .card import Card
+from .game import Game, _ai_choose_attack, _ai_choose_defence, _ai_should_stop_attacking
+from .move_validator import MoveValidator
+from .record import GameRecord, GameRecorder
+from .state_machine import (
+    EV_ATTACK, EV_DEFEND, EV_TRANSFER, EV_PICKUP, EV_DISCARD,
+    GameEvent, GameStateMachine,
+)
+
+# per-seat outcome labels (same strings GameScreen uses for R_WIN/R_LOSS/R_TIE)
+WIN  = "win"
+LOSS = "loss"
+TIE  = "tie"
+
+
+# ── policies ─────────────────────────────────────────────────────────────────
+
+class Policy(ABC):
+    """A headless bot. choose() is called with the GameStateMachine whenever
+    this policy's seat is to move and must return one of its legal_actions()."""
+
+    name = "policy"
+
+    @abstractmethod
+    def choose(self, machine: GameStateMachine) -> int:
+        ...
+
+
+class CardPolicy(Policy):
+    """A Policy written as card-level hooks: attack() and defend() get the
+    live Game and the seat index and return a card, or None to stop
+    attacking / take the pile. Attacks go to the defender one card at a
+    time."""
+
+    @abstractmethod
+    def attack(self, game: Game, seat: int, first: bool) -> Optional[Card]:
+        ...
+
+    @abstractmethod
+    def defend(self, game: Game, seat: int, attack_card: Card) -> Optional[Card]:
+        ...
+
+    def choose(self, machine: GameStateMachine) -> int:
+        g     = machine.game
+        table = g.table
+        seat  = machine.to_move()
+        if machine.phase == DEFENDING:
+            attack_card = table.pairs[table.first_undefended_index()].attack
+            card = self.defend(g, seat, attack_card)
+            return TAKE if card is None else encode(DEFEND, card)
+        if not table.all_defended() or (machine.phase == TAKING and machine.piled_on):
+            return PASS
+        legal = machine.legal_actions()
+        if legal[0] >= DEFEND:          # no attack fits under the table caps
+            return PASS
+        card = self.attack(g, seat, table.is_empty())
+        return PASS if card is None else encode(ATTACK, card)
+
+
+class GreedyPolicy(CardPolicy):
+    """The built-in bot: the _ai_* heuristics from game.py, plus the transfer
+    and pile-on choices GameScreen's bot makes."""
+
+    name = "greedy"
+
+    def attack(self, game: Game, seat: int, first: bool) -> Optional[Card]:
+        attacker = game.players[seat]
+        trump    = game.deck.trump
+        if not first and _ai_should_stop_attacking(
+                attacker, game.table, game.players[game.defender_idx], trump):
+            return None
+        return _ai_choose_attack(attacker, game.table, trump)
+
+    def defend(self, game: Game, seat: int, attack_card: Card) -> Optional[Card]:
+        return _ai_choose_defence(game.players[seat], attack_card, game.deck.trump)
+
+    def choose(self, machine: GameStateMachine) -> int:
+        g     = machine.game
+        table = g.table
+        trump = g.deck.trump
+
+        if machine.phase == DEFENDING and machine.transfer_mode:
+            # transfer when there is no defence, or it would cost a trump on a non-trump
+            defender    = g.players[g.defender_idx]
+            attack_card = table.pairs[table.first_undefended_index()].attack
+            transfers   = MoveValidator(trump).valid_transfers(
+                defender.hand, table, new_defender_hand=g.players[next_defender(g)].hand)
+            if transfers:
+                defence = _ai_choose_defence(defender, attack_card, trump)
+                if defence is None or (defence.is_trump(trump) and not attack_card.is_trump(trump)):
+                    return encode(TRANSFER, transfers[0])
+
+        if machine.phase == TAKING:
+            # one extra card for the taker at most, and no stop heuristic
+            if machine.piled_on == 0 and can_add_attack(g):
+                card = _ai_choose_attack(g.players[g.attacker_idx], table, trump)
+                if card is not None:
+                    return encode(ATTACK, card)
+            return PASS
+
+        return super().choose(machine)
+
+
+# ── results ──────────────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class GameResult:
+    seed: Optional[int]
+    loser: Optional[int]          # seat of the durak, None on a tie
+    rounds: int = 0
+    plies: int = 0                # cards played (attacks, defences, transfers)
+    piles_taken:   List[int] = field(default_factory=list)
+    biggest_pile:  List[int] = field(default_factory=list)
+    trumps_played: List[int] = field(default_factory=list)
+    passes:        List[int] = field(default_factory=list)
+    record: Optional[GameRecord] = None   # set when the engine records games
+
+    def outcome(self, seat: int) -> str:
+        if self.loser is None:
+            return TIE
+        return LOSS if self.loser == seat else WIN
+
+
+@dataclass(slots=True)
+class SimulationReport:
+    results: List[GameResult]
+    elapsed: float                # seconds of wall time
+
+    @property
+    def games(self) -> int:
+        return len(self.results)
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+# ── engine ───────────────────────────────────────────────────────────────────
+
+def _tally(res: GameResult, trump) -> Callable[[GameEvent], None]:
+    """Event listener that fills in the per-seat stats of res."""
+    def on_event(ev: GameEvent) -> None:
+        if ev.kind in (EV_ATTACK, EV_DEFEND, EV_TRANSFER):
+            res.plies += 1
+            if ev.card.suit == trump:
+                res.trumps_played[ev.seat] += 1
+        elif ev.kind == EV_PICKUP:
+            res.piles_taken[ev.seat] += 1
+            res.biggest_pile[ev.seat] = max(res.biggest_pile[ev.seat], len(ev.cards))
+        elif ev.kind == EV_DISCARD:
+            res.passes[ev.seat] += 1
+    return on_event
+
+
+class HeadlessEngine:
+    """Plays complete games between policies with no printing, input or sleeps.
+
+    Rules come from GameStateMachine, the same ones GameScreen runs; the
+    engine only asks the policy to move for whichever seat is to act.
+    """
+
+    def __init__(self, policies: Sequence[Policy], *, max_rounds: int = 1000,
+                 transfer_mode: bool = False, record: bool = False) -> None:
+        assert 2 <= len(policies) <= 6
+        self.policies      = list(policies)
+        self.max_rounds    = max_rounds
+        self.transfer_mode = transfer_mode
+        self.record        = record
+
+    def new_game(self, seed: Optional[int]) -> GameStateMachine:
+        """Dealt but not started: call start() (after adding listeners)."""
+        g = Game(seed=seed)
+        g.setup_no_deal(num_players=len(self.policies), quiet=True)
+        machine = GameStateMachine(g, transfer_mode=self.transfer_mode)
+        machine.deal(rng=random.Random(seed))
+        return machine
+
+    def play(self, seed: Optional[int] = None) -> GameResult:
+        machine = self.new_game(seed)
+        g = machine.game
+        n = len(g.players)
+        res = GameResult(seed=seed, loser=None,
+                         piles_taken=[0] * n, biggest_pile=[0] * n,
+                         trumps_played=[0] * n, passes=[0] * n)
+        machine.add_listener(_tally(res, g.deck.trump))
+        if self.record:
+            res.record = GameRecorder(machine).record
+        machine.start()
+
+        while not machine.over:
+            if machine.round > self.max_rounds:
+                raise RuntimeError(f"game {seed} did not finish in {self.max_rounds} rounds")
+            policy = self.policies[machine.to_move()]
+            action = policy.choose(machine)
+            if action not in machine.legal_actions():
+                raise ValueError(f"{policy.name} played illegal action '{describe(action)}'")
+            machine.apply(action, check=False)
+
+        res.rounds = machine.round
+        res.loser  = machine.loser
+        return res
+
+    def run(self, n_games: int, *, first_seed: int = 0) -> SimulationReport:
+        """Play n_games with consecutive seeds and time them."""
+        start   = time.perf_counter()
+        results = [self.play(seed) for seed in range(first_seed, first_seed + n_games)]
+        return SimulationReport(results=results, elapsed=time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    import sys
+    n      = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    report = HeadlessEngine([GreedyPolicy(), GreedyPolicy()]).run(n)
+    losses = [0, 0]
+    ties   = 0
+    for r in report.results:
+        if r.loser is None:
+            ties += 1
+        else:
+            losses[r.loser] += 1
+    print(f"{report.games} games in {report.elapsed:.2f}s "
+          f"({report.games_per_second:.0f} games/s)  "
+          f"seat losses {losses[0]}/{losses[1]}, ties {ties}")
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from . import zobrist
 from .card import Card, Suit
+from .cardset import cards_of_ranks
 from .deck import Deck
 from .move_validator import MoveValidator
 from .player import Player
@@ -32,17 +35,16 @@ def _ai_should_stop_attacking(attacker: Player, table: Table, defender: Player,
     - Defender has few cards left (don't over-commit), OR
     - We've already attacked with 6 cards.
     """
-    on_table = table.ranks_on_table()
-    can_add = [c for c in attacker.hand if c.rank in on_table]
+    can_add = attacker.hand_mask() & cards_of_ranks(table.rank_mask())
 
     if not can_add:
         return True
-    if table.all_defended() and len(can_add) > 0 and len(defender.hand) == 0:
+    if table.all_defended() and len(defender.hand) == 0:
         return True
-    if len(table.attacks()) >= 6:
+    if table.attack_count() >= 6:
         return True
     # Hard stop heuristic: don't pile on if defender is nearly empty
-    if len(defender.hand) <= len(table.attacks()):
+    if len(defender.hand) <= table.attack_count():
         return True
     return False
 
@@ -74,36 +76,42 @@ class Game:
     attacker_idx: int = 0
     defender_idx: int = 1
 
-    def setup(self, num_players: int = 2) -> None:
+    def setup(self, num_players: int = 2, *, quiet: bool = False) -> None:
         assert 2 <= num_players <= 6
+        self._pick_seed()
         self.deck = Deck.new_shuffled(seed=self.seed)
         self.players = [Player(name=f"Bot {i}" if i > 0 else "You")
                         for i in range(num_players)]
         # deal 6 cards each, 2 at a time
-        for _ in range(3):
-            for p in self.players:
-                for _ in range(2):
-                    if self.deck.remaining() > 0:
-                        p.hand.append(self.deck.draw())
+        for p, hand in zip(self.players, self.deck.deal(num_players, 6)):
+            p.add_cards(hand)
         # sort hands trump-last
         for p in self.players:
             p.sort_hand(self.deck.trump)
 
         self.attacker_idx = 0
         self.defender_idx = 1
-        print(f"\nTrump suit: {self.deck.trump}")
-        print(f"Trump card: {self.deck.peek_bottom()}")
+        if not quiet:
+            print(f"\nTrump suit: {self.deck.trump}")
+            print(f"Trump card: {self.deck.peek_bottom()}")
 
-    def setup_no_deal(self, num_players: int = 2) -> None:
+    def setup_no_deal(self, num_players: int = 2, *, quiet: bool = False) -> None:
         """Same as setup() but leaves all hands empty  GameScreen deals via animation."""
         assert 2 <= num_players <= 6
+        self._pick_seed()
         self.deck    = Deck.new_shuffled(seed=self.seed)
         self.players = [Player(name=f"Bot {i}" if i > 0 else "You")
                         for i in range(num_players)]
         self.attacker_idx = 0
         self.defender_idx = 1
-        print(f"\nTrump suit: {self.deck.trump}")
-        print(f"Trump card: {self.deck.peek_bottom()}")
+        if not quiet:
+            print(f"\nTrump suit: {self.deck.trump}")
+            print(f"Trump card: {self.deck.peek_bottom()}")
+
+    def _pick_seed(self) -> None:
+        """Unseeded games still get a concrete seed so they can be recorded."""
+        if self.seed is None:
+            self.seed = random.randrange(1 << 63)
 
     # ── round helpers ────────────────────────────────────────────────────────
 
@@ -119,10 +127,9 @@ class Game:
             self.players[idx].draw_to_six(self.deck)
             self.players[idx].sort_hand(self.deck.trump)
 
-    def _assign_first_attacker(self) -> None:
+    def _assign_first_attacker(self, rng=None) -> None:
         """Assign first attacker to the player holding the lowest trump card.
-        If nobody has a trump, pick randomly."""
-        import random as _random
+        If nobody has a trump, pick randomly (from rng if given)."""
         trump = self.deck.trump
         best_idx  = None
         best_rank = None
@@ -133,10 +140,22 @@ class Game:
                         best_rank = card.rank_value()
                         best_idx  = i
         if best_idx is None:
-            best_idx = _random.randrange(len(self.players))
+            best_idx = (rng or random).randrange(len(self.players))
         self.attacker_idx = best_idx
         self.defender_idx = (best_idx + 1) % len(self.players)
 
+    def key(self) -> int:
+        """64-bit Zobrist key of hands, table, deck, trump and roles. Hands,
+        table and deck keep their parts current as cards move; this only
+        XORs them together with the seats."""
+        k = (self.table.key ^ zobrist.ATTACKER[self.attacker_idx]
+             ^ zobrist.DEFENDER[self.defender_idx])
+        if self.deck is not None:
+            k ^= self.deck.key
+        for seat, p in enumerate(self.players):
+            k ^= zobrist.seat_key(p.key, seat)
+        return k
+
     def _advance_roles(self, defender_took: bool) -> None:
         n = len(self.players)
         if defender_took:
@@ -271,7 +290,7 @@ class Game:
                         print(f"  {attacker.name} plays  →  {attack_card}")
                     self._pause()
                     print(f"  {defender.name} picks up {len(taken)} cards.")
-                    defender.hand.extend(taken)
+                    defender.add_cards(taken)
                     defender.sort_hand(trump)
                     self._draw_up()
                     self._advance_roles(defender_took=True)
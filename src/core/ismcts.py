@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .card import CARDS, Suit
+from .deck import Deck
+from .engine import GreedyPolicy, Policy
+from .knowledge import CardKnowledge
+from .record import Snapshot, event_action, restore_snapshot, take_snapshot
+from .sampler import DealSampler
+from .state_machine import GameEvent, GameStateMachine
+
+
+# ── tree ─────────────────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class Node:
+    """One information set, reached by an action sequence from the root.
+    reward is summed from the point of view of mover, the seat that played
+    the action leading here."""
+    mover: int = -1
+    visits: int = 0
+    avail: int = 0                  # times this action was legal when its parent was visited
+    reward: float = 0.0
+    children: Dict[int, Node] = field(default_factory=dict)
+
+    def ucb(self, c: float) -> float:
+        return self.reward / self.visits + c * math.sqrt(math.log(self.avail) / self.visits)
+
+
+def seat_reward(machine: GameStateMachine, seat: int) -> float:
+    """1 for getting out, 0 for the durak, 0.5 each on a tie."""
+    if machine.loser is None:
+        return 0.5
+    return 0.0 if machine.loser == seat else 1.0
+
+
+# ── determinization ──────────────────────────────────────────────────────────
+
+def determinize(machine: GameStateMachine, seat: int, rng: random.Random,
+                knowledge: Optional[CardKnowledge] = None) -> GameStateMachine:
+    """A copy of the game where every card seat cannot see is dealt at random.
+
+    seat sees its own hand, the table, the discards and the face-up trump,
+    plus, with knowledge, the cards other seats are known to hold (picked
+    up in the open, or the drawn trump). Those stay where they are; the
+    rest is shuffled into the other hands (same sizes as now) and the deck
+    above the trump card. Searches that sample one position many times
+    should build a DealSampler once and draw from its sample_many()."""
+    return DealSampler(machine, seat, knowledge).machine(rng)
+
+
+DEAL_BATCH = 64         # deals drawn per sample_many() call during a search
+
+
+# ── policy ───────────────────────────────────────────────────────────────────
+
+class ISMCTSPolicy(Policy):
+    """Single-observer information-set MCTS.
+
+    Each iteration deals the hidden cards at random (determinize), walks the
+    shared tree with UCB restricted to the actions legal in that deal, adds
+    one node and plays the rest of the game out with the rollout policy.
+    Search runs until budget_ms of wall time is spent (or max_iterations, if
+    set), so strength scales with the time given and latency stays close to
+    the budget plus one rollout.
+
+    The tree survives between decisions: a listener logs every action the
+    game applies, and the next call descends the old tree along them.
+    A CardKnowledge per seat follows the same game, so determinizations
+    leave cards an opponent picked up in the open in that opponent's hand."""
+
+    name = "ismcts"
+
+    def __init__(self, budget_ms: float = 100.0, *, exploration: float = 0.7,
+                 max_iterations: Optional[int] = None,
+                 rollout: Optional[Policy] = None,
+                 seed: Optional[int] = None) -> None:
+        self.budget_ms      = budget_ms
+        self.exploration    = exploration
+        self.max_iterations = max_iterations
+        self.rollout        = rollout or GreedyPolicy()
+        self.rng            = random.Random(seed)
+        self.iterations     = 0           # run by the last choose()
+        self._machine: Optional[GameStateMachine] = None
+        self._root:    Optional[Node] = None
+        self._played:  List[int] = []     # actions applied since _root
+        self._knowledge: Dict[int, CardKnowledge] = {}
+
+    # ── tree reuse ───────────────────────────────────────────────────────────
+
+    def _on_event(self, ev: GameEvent) -> None:
+        action = event_action(ev)
+        if action is not None:
+            self._played.append(action)
+
+    def _sync(self, machine: GameStateMachine) -> Node:
+        """The root for machine's current state, reusing the old subtree."""
+        if machine is not self._machine:
+            if self._machine is not None:
+                self._machine.remove_listener(self._on_event)
+            for k in self._knowledge.values():
+                k.detach()
+            self._knowledge.clear()
+            machine.add_listener(self._on_event)
+            self._machine = machine
+            self._root    = None
+        node = self._root
+        for action in self._played:
+            if node is None:
+                break
+            node = node.children.get(action)
+        self._played.clear()
+        self._root = node if node is not None else Node()
+        return self._root
+
+    # ── search ───────────────────────────────────────────────────────────────
+
+    def choose(self, machine: GameStateMachine) -> int:
+        seat  = machine.to_move()
+        root  = self._sync(machine)
+        legal = machine.legal_actions()
+        self.iterations = 0
+        if len(legal) == 1:
+            return legal[0]
+
+        self.search(root, machine, seat, self.knowledge(machine, seat))
+        best = max(legal, key=lambda a: root.children[a].visits if a in root.children else -1)
+        if best not in root.children:
+            return self.rollout.choose(machine)
+        return best
+
+    def knowledge(self, machine: GameStateMachine, seat: int) -> CardKnowledge:
+        """seat's card tracker for machine (the one _sync last saw), started
+        on first use."""
+        k = self._knowledge.get(seat)
+        if k is None:
+            k = self._knowledge[seat] = CardKnowledge.attach(machine, seat)
+        return k
+
+    def search(self, root: Node, machine: GameStateMachine, seat: int,
+               knowledge: Optional[CardKnowledge] = None) -> None:
+        """Grow root for seat until the budget runs out."""
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        sampler  = DealSampler(machine, seat, knowledge)
+        deals: List[tuple] = []
+        while time.perf_counter() < deadline:
+            if self.max_iterations is not None and self.iterations >= self.max_iterations:
+                break
+            if not deals:           # deal in batches; the unused rest are dropped
+                left  = DEAL_BATCH if self.max_iterations is None else self.max_iterations - self.iterations
+                deals = sampler.sample_many(min(DEAL_BATCH, left), self.rng)
+                deals.reverse()
+            self._iterate(root, sampler.restore(*deals.pop()))
+            self.iterations += 1
+
+    def _iterate(self, root: Node, m: GameStateMachine) -> None:
+        node = root
+        path = [root]
+        c    = self.exploration
+
+        # selection / expansion
+        while not m.over:
+            legal    = m.legal_actions()
+            children = node.children
+            untried  = []
+            for a in legal:
+                child = children.get(a)
+                if child is None:
+                    untried.append(a)
+                else:
+                    child.avail += 1
+            mover = m.to_move()
+            if untried:
+                action = self.rng.choice(untried)
+                node = children[action] = Node(mover=mover, avail=1)
+                m.apply(action, check=False)
+                path.append(node)
+                break
+            action = max(legal, key=lambda a: children[a].ucb(c))
+            node = children[action]
+            m.apply(action, check=False)
+            path.append(node)
+
+        # rollout
+        rollout = self.rollout
+        while not m.over:
+            m.apply(rollout.choose(m), check=False)
+
+        # backpropagation
+        for n in path[1:]:
+            n.visits += 1
+            n.reward += seat_reward(m, n.mover)
+
+
+# ── root parallelism ─────────────────────────────────────────────────────────
+
+_worker_bot: Optional[ISMCTSPolicy] = None
+
+
+def _init_worker() -> None:
+    global _worker_bot
+    _worker_bot = ISMCTSPolicy()
+
+
+def _ping(_: int) -> None:
+    return None
+
+
+def _search_root(snap: Snapshot, deck_ids: Tuple[int, ...], trump: Suit,
+                 transfer_mode: bool, seat: int, knowledge: CardKnowledge,
+                 settings: tuple, seed: int) -> Tuple[Dict[int, int], int]:
+    """Worker entry point: one independent search from a fresh root.
+    Returns the root's visit count per action and the iterations run."""
+    bot = _worker_bot
+    bot.budget_ms, bot.max_iterations, bot.exploration, bot.rollout = settings
+    bot.rng.seed(seed)
+    bot.iterations = 0
+    deck    = Deck(cards=[CARDS[i] for i in deck_ids], trump=trump)
+    machine = restore_snapshot(snap, deck, transfer_mode=transfer_mode)
+    root    = Node()
+    bot.search(root, machine, seat, knowledge)
+    return {a: n.visits for a, n in root.children.items()}, bot.iterations
+
+
+class RootParallelISMCTSPolicy(ISMCTSPolicy):
+    """ISMCTS with root parallelism.
+
+    Every worker process grows its own tree from its own determinizations
+    for the whole budget; the root visit counts are then summed and the
+    most visited action is played. The pool starts on first use and stays
+    up until close(), so later decisions pay no process start-up or
+    imports. Trees are not kept between decisions, since a task may land on
+    any worker. The card tracker is kept here and sent along with each
+    search. max_iterations, if set, applies per worker."""
+
+    name = "ismcts-parallel"
+
+    def __init__(self, budget_ms: float = 100.0, *, workers: Optional[int] = None,
+                 **kwargs) -> None:
+        super().__init__(budget_ms, **kwargs)
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def warm(self) -> None:
+        """Start the worker processes now rather than on the first decision."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             initializer=_init_worker)
+        list(self._pool.map(_ping, range(self.workers)))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def choose(self, machine: GameStateMachine) -> int:
+        seat  = machine.to_move()
+        self._sync(machine)
+        known = self.knowledge(machine, seat)
+        legal = machine.legal_actions()
+        self.iterations = 0
+        if len(legal) == 1:
+            return legal[0]
+        if self._pool is None:
+            self.warm()
+
+        g        = machine.game
+        settings = (self.budget_ms, self.max_iterations, self.exploration, self.rollout)
+        args     = (take_snapshot(machine, 0), tuple(c.id for c in g.deck.cards),
+                    g.deck.trump, machine.transfer_mode, seat, known.copy(), settings)
+        futures  = [self._pool.submit(_search_root, *args, self.rng.randrange(1 << 63))
+                    for _ in range(self.workers)]
+        visits: Counter = Counter()
+        for fut in futures:
+            counts, n = fut.result()
+            visits.update(counts)
+            self.iterations += n
+
+        best = max(legal, key=lambda a: visits.get(a, -1))
+        if best not in visits:
+            return self.rollout.choose(machine)
+        return best
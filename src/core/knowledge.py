@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .cardset import CardSet, FULL_DECK, card_bit, mask_of
+from .state_machine import (
+    EV_DEAL, EV_ATTACK, EV_DEFEND, EV_TRANSFER, EV_PICKUP, EV_DISCARD, EV_DRAW,
+    GameEvent, GameStateMachine,
+)
+
+
+@dataclass(slots=True)
+class CardKnowledge:
+    """What one seat knows about where the cards are, kept up to date from
+    the machine's events at a couple of mask operations per event.
+
+    known[s] is the set of cards seat s is known to hold: the observer's
+    whole hand, and for everyone else the cards seen going in (a pickup,
+    or the face-up trump when it is drawn) and not yet played. Draws and
+    deals to other seats are hidden, so they are ignored even though the
+    events carry the card."""
+    seat: int
+    known: List[CardSet]
+    discarded: CardSet = 0
+    trump_card: int = -1            # id of the face-up bottom card while it is in the deck
+    _machine: Optional[GameStateMachine] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def attach(cls, machine: GameStateMachine, seat: int) -> CardKnowledge:
+        """Start tracking for seat from machine's current state. Only what is
+        visible now is known; earlier pickups are not in the state."""
+        g     = machine.game
+        deck  = g.deck
+        known = [0] * len(g.players)
+        known[seat] = g.players[seat].hand_mask()
+        in_play = deck.mask() | g.table.mask()
+        for p in g.players:
+            in_play |= p.hand_mask()
+        k = cls(seat=seat, known=known, discarded=FULL_DECK ^ in_play,
+                trump_card=deck.cards[-1].id if deck.remaining() else -1)
+        machine.add_listener(k.on_event)
+        k._machine = machine
+        return k
+
+    def detach(self) -> None:
+        if self._machine is not None:
+            self._machine.remove_listener(self.on_event)
+            self._machine = None
+
+    def copy(self) -> CardKnowledge:
+        """A detached copy (for handing to another process)."""
+        return CardKnowledge(self.seat, list(self.known), self.discarded, self.trump_card)
+
+    def on_event(self, ev: GameEvent) -> None:
+        kind = ev.kind
+        if kind in (EV_ATTACK, EV_DEFEND, EV_TRANSFER):
+            # for a transfer ev.seat is the new attacker, who played the card
+            self.known[ev.seat] &= ~card_bit(ev.card)
+        elif kind == EV_PICKUP:
+            self.known[ev.seat] |= mask_of(ev.cards)
+        elif kind == EV_DISCARD:
+            self.discarded |= mask_of(ev.cards)
+        elif kind in (EV_DRAW, EV_DEAL):
+            if ev.seat == self.seat or ev.card.id == self.trump_card:
+                self.known[ev.seat] |= card_bit(ev.card)
+            if ev.card.id == self.trump_card:
+                self.trump_card = -1
+
+    def unseen(self, table: CardSet = 0) -> CardSet:
+        """Cards whose place seat does not know: not known in any hand, not
+        discarded, not on the table and not the face-up trump."""
+        seen = self.discarded | table
+        for mask in self.known:
+            seen |= mask
+        if self.trump_card >= 0:
+            seen |= 1 << self.trump_card
+        return FULL_DECK & ~seen
@@ -2,34 +2,69 @@ from __future__ import annotations
 
 from typing import List
 
-from .card import Card, Suit
+from .card import Card, Suit, BEATS, NUM_CARDS
+from .cardset import (
+    CardSet, FULL_DECK, BEATERS,
+    card_bit, cards_of_ranks, filter_cards, rank_bits,
+)
 from .table import Table
 
 
 class MoveValidator:
-    """Centralised Durak rule checking, extracted from game loop logic."""
+    """Centralised Durak rule checking, extracted from game loop logic.
+
+    Checks run on CardSet masks (see cardset.py); the list-returning methods
+    keep the caller's hand order."""
 
     def __init__(self, trump: Suit) -> None:
         self.trump = trump
+        self._beats   = BEATS[trump]
+        self._beaters = BEATERS[trump]
+
+    # ── mask queries ─────────────────────────────────────────────────────────
+
+    def attack_mask(self, table: Table) -> CardSet:
+        """Every card that could legally be played as an attack right now."""
+        if table.is_empty():
+            return FULL_DECK
+        return cards_of_ranks(table.rank_mask())
+
+    def defence_mask(self, attack_card: Card) -> CardSet:
+        """Every card that beats attack_card."""
+        return self._beaters[attack_card.id]
+
+    def transfer_mask(self, table: Table,
+                      new_defender_hand: list | None = None) -> CardSet:
+        """Every card that could legally transfer the attack (see can_transfer)."""
+        if table.defence_mask():
+            return 0
+        ranks = rank_bits(table.attack_mask())
+        if ranks == 0 or ranks & (ranks - 1):
+            return 0
+        # New defender would face len(pairs)+1 attacks — they need at least that many cards
+        if new_defender_hand is not None:
+            attacks_after = table.attack_count() + 1
+            if len(new_defender_hand) < attacks_after:
+                return 0
+        return cards_of_ranks(ranks)
+
+    # ── card / list queries ──────────────────────────────────────────────────
 
     def valid_attacks(self, hand: List[Card], table: Table) -> List[Card]:
         """Cards in hand that are legal opening or pile-on attacks."""
-        if not table.attacks():
+        if table.is_empty():
             return list(hand)
-        on_table = table.ranks_on_table()
-        return [c for c in hand if c.rank in on_table]
+        return filter_cards(hand, self.attack_mask(table))
 
     def can_attack(self, card: Card, table: Table) -> bool:
-        if not table.attacks():
-            return True
-        return card.rank in table.ranks_on_table()
+        return bool(self.attack_mask(table) & card_bit(card))
 
     def valid_defences(self, hand: List[Card], attack_card: Card) -> List[Card]:
         """Cards in hand that can legally beat the given attack card."""
-        return [c for c in hand if c.can_beat(attack_card, self.trump)]
+        return filter_cards(hand, self.defence_mask(attack_card))
 
     def can_defend(self, card: Card, attack_card: Card) -> bool:
-        return card.can_beat(attack_card, self.trump)
+        return self._beats[attack_card.id * NUM_CARDS + card.id] == 1
 
     def can_transfer(self, card: Card, table: Table,
                      new_defender_hand: list | None = None) -> bool:
@@ -37,20 +72,9 @@ class MoveValidator:
         to redirect it — only if all attacks share one rank, no defences have been
         played yet, and the new defender (current attacker) has enough cards to
         actually defend the resulting pile."""
-        if table.defences():
-            return False
-        attack_ranks = {p.attack.rank for p in table.pairs}
-        if len(attack_ranks) != 1 or card.rank not in attack_ranks:
-            return False
-        # New defender would face len(pairs)+1 attacks — they need at least that many cards
-        if new_defender_hand is not None:
-            attacks_after = len(table.pairs) + 1
-            if len(new_defender_hand) < attacks_after:
-                return False
-        return True
+        return bool(self.transfer_mask(table, new_defender_hand) & card_bit(card))
 
     def valid_transfers(self, hand: list, table: Table,
                         new_defender_hand: list | None = None) -> list:
         """Cards that can legally transfer the attack."""
-        return [c for c in hand
-                if self.can_transfer(c, table, new_defender_hand=new_defender_hand)]
\ No newline at end of file
+        return filter_cards(hand, self.transfer_mask(table, new_defender_hand))
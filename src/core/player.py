@@ -1,28 +1,46 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Iterable, List
 
-from .card import Card, Suit
+from . import zobrist
+from .card import Card, Suit, SORT_KEYS
+from .cardset import CardSet, mask_of
 
 
 @dataclass(slots=True)
 class Player:
     name: str
+    # add and remove cards through add_cards / remove_card so key stays current
     hand: List[Card] = field(default_factory=list)
+    key: int = field(default=0, init=False, repr=False, compare=False)   # Zobrist, seat-independent
+
+    def __post_init__(self) -> None:
+        self.key = zobrist.cards_key(mask_of(self.hand), zobrist.HAND)
+
+    def add_cards(self, cards: Iterable[Card]) -> None:
+        z = zobrist.HAND
+        for card in cards:
+            self.hand.append(card)
+            self.key ^= z[card.id]
 
     def draw_to_six(self, deck) -> None:
-        while len(self.hand) < 6 and deck.remaining() > 0:
-            self.hand.append(deck.draw())
+        if len(self.hand) < 6:
+            self.add_cards(deck.draw_many(6 - len(self.hand)))
 
     def remove_card(self, card: Card) -> None:
         self.hand.remove(card)
+        self.key ^= zobrist.HAND[card.id]
+
+    def hand_mask(self) -> CardSet:
+        return mask_of(self.hand)
 
     def card_count(self) -> int:
         return len(self.hand)
 
     def sort_hand(self, trump: Suit) -> None:
-        self.hand.sort(key=lambda c: c.sort_key(trump))
+        keys = SORT_KEYS[trump]
+        self.hand.sort(key=lambda c: keys[c.id])
 
     def __str__(self) -> str:
         return f"{self.name}({len(self.hand)}): " + " ".join(str(c) for c in self.hand)
\ No newline at end of file
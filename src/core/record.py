@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import random
+import struct
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from .actions import ATTACK, DEFEND, TRANSFER, TAKE, PASS
+from .card import CARDS
+from .cardset import CardSet, cards_of
+from .deck import Deck
+from .game import Game
+from .player import Player
+from .state_machine import (
+    EV_ATTACK, EV_DEFEND, EV_TRANSFER, EV_TAKE, EV_PASS,
+    GameEvent, GameStateMachine,
+)
+
+
+# ── format ───────────────────────────────────────────────────────────────────
+# A record is a 16-byte little-endian header followed by one byte per action
+# (actions.py encoding):
+#   magic "FH" | version u8 | flags u8 | players u8 | first attacker u8 |
+#   seed u64 | action count u16
+# Records are self-delimiting, so a file of games is just records back to back.
+
+MAGIC   = b"FH"
+VERSION = 1
+FLAG_TRANSFER = 0x01
+
+_HEADER     = struct.Struct("<2sBBBBQH")
+HEADER_SIZE = _HEADER.size
+
+
+@dataclass(slots=True)
+class GameRecord:
+    seed: int
+    transfer_mode: bool = False
+    num_players: int = 2
+    first_attacker: int = 0
+    actions: bytearray = field(default_factory=bytearray)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def to_bytes(self) -> bytes:
+        flags = FLAG_TRANSFER if self.transfer_mode else 0
+        return _HEADER.pack(MAGIC, VERSION, flags, self.num_players,
+                            self.first_attacker, self.seed, len(self.actions)) + self.actions
+
+    @classmethod
+    def from_bytes(cls, data) -> GameRecord:
+        record, _ = decode(data)
+        return record
+
+
+def decode(data, offset: int = 0) -> Tuple[GameRecord, int]:
+    """Read one record from a bytes-like object (bytes, memoryview, mmap)
+    starting at offset. Returns the record and the offset just past it."""
+    if len(data) - offset < HEADER_SIZE:
+        raise ValueError("truncated game record header")
+    magic, version, flags, players, first, seed, n = _HEADER.unpack_from(data, offset)
+    if magic != MAGIC:
+        raise ValueError("not a game record")
+    if version != VERSION:
+        raise ValueError(f"unsupported game record version {version}")
+    start = offset + HEADER_SIZE
+    end   = start + n
+    if end > len(data):
+        raise ValueError("truncated game record")
+    return GameRecord(seed, bool(flags & FLAG_TRANSFER), players, first,
+                      bytearray(data[start:end])), end
+
+
+def iter_records(data) -> Iterator[GameRecord]:
+    """Every record in a buffer of back-to-back records. Pass an mmap to walk
+    a large file without reading it all."""
+    offset = 0
+    while offset < len(data):
+        record, offset = decode(data, offset)
+        yield record
+
+
+def write_records(fp: BinaryIO, records: Iterable[GameRecord]) -> int:
+    """Append records to a binary file. Returns bytes written."""
+    written = 0
+    for record in records:
+        written += fp.write(record.to_bytes())
+    return written
+
+
+def load_records(path: str) -> List[GameRecord]:
+    with open(path, "rb") as fp:
+        return list(iter_records(fp.read()))
+
+
+# ── recording ────────────────────────────────────────────────────────────────
+
+_CARD_ACTIONS = {EV_ATTACK: ATTACK, EV_DEFEND: DEFEND, EV_TRANSFER: TRANSFER}
+
+
+def event_action(ev: GameEvent) -> Optional[int]:
+    """The action that produced ev, or None for events no action maps to
+    (deal, draw, pickup, ...). Every applied action emits exactly one
+    event that maps back to it."""
+    kind = _CARD_ACTIONS.get(ev.kind)
+    if kind is not None:
+        return kind + ev.card.id
+    if ev.kind == EV_TAKE:
+        return TAKE
+    if ev.kind == EV_PASS:
+        return PASS
+    return None
+
+
+class GameRecorder:
+    """Writes every action a GameStateMachine applies into a GameRecord.
+    Attach after deal() so the opener is known, and before the first action."""
+
+    def __init__(self, machine: GameStateMachine) -> None:
+        g = machine.game
+        if g.seed is None:
+            raise ValueError("only seeded games can be recorded")
+        self.record = GameRecord(seed=g.seed, transfer_mode=machine.transfer_mode,
+                                 num_players=len(g.players), first_attacker=g.attacker_idx)
+        machine.add_listener(self._on_event)
+
+    def _on_event(self, ev: GameEvent) -> None:
+        action = event_action(ev)
+        if action is not None:
+            self.record.actions.append(action)
+
+
+# ── snapshots ────────────────────────────────────────────────────────────────
+
+@dataclass(slots=True, frozen=True)
+class Snapshot:
+    """Everything a GameStateMachine holds between actions, minus the deck
+    order (which the seed gives back)."""
+    ply: int
+    hands: Tuple[CardSet, ...]
+    deck_pos: int
+    attacks: Tuple[int, ...]       # card ids in play order
+    defences: Tuple[int, ...]      # card id per attack, -1 while undefended
+    attacker: int
+    defender: int
+    phase: str
+    round: int
+    transferred: bool
+    piled_on: int
+    over: bool
+    loser: Optional[int]
+
+
+def take_snapshot(machine: GameStateMachine, ply: int) -> Snapshot:
+    g = machine.game
+    return Snapshot(
+        ply=ply,
+        hands=tuple(p.hand_mask() for p in g.players),
+        deck_pos=g.deck.pos,
+        attacks=tuple(p.attack.id for p in g.table.pairs),
+        defences=tuple(p.defence.id if p.defence else -1 for p in g.table.pairs),
+        attacker=g.attacker_idx, defender=g.defender_idx,
+        phase=machine.phase, round=machine.round,
+        transferred=machine.transferred, piled_on=machine.piled_on,
+        over=machine.over, loser=machine.loser,
+    )
+
+
+def restore_snapshot(snap: Snapshot, deck: Deck, *, seed: Optional[int] = None,
+                     transfer_mode: bool = False) -> GameStateMachine:
+    """Rebuild a live machine from a snapshot. deck gives the card order and
+    trump (any deck shuffled from the same seed)."""
+    trump = deck.trump
+    g = Game(seed=seed, deck=Deck(cards=list(deck.cards), trump=trump, pos=snap.deck_pos))
+    g.players = [Player(name=f"Bot {i}" if i > 0 else "You", hand=cards_of(mask))
+                 for i, mask in enumerate(snap.hands)]
+    for p in g.players:
+        p.sort_hand(trump)
+    for atk, dfn in zip(snap.attacks, snap.defences):
+        g.table.add_attack(CARDS[atk])
+        if dfn >= 0:
+            g.table.add_defence(g.table.attack_count() - 1, CARDS[dfn])
+    g.attacker_idx, g.defender_idx = snap.attacker, snap.defender
+
+    m = GameStateMachine(g, transfer_mode=transfer_mode)
+    m.phase, m.round       = snap.phase, snap.round
+    m.transferred          = snap.transferred
+    m.piled_on             = snap.piled_on
+    m.over, m.loser        = snap.over, snap.loser
+    return m
+
+
+# ── replay ───────────────────────────────────────────────────────────────────
+
+def start_machine(record: GameRecord) -> GameStateMachine:
+    """The record's game at ply 0: dealt, opener set, first round started."""
+    g = Game(seed=record.seed)
+    g.setup_no_deal(num_players=record.num_players, quiet=True)
+    m = GameStateMachine(g, transfer_mode=record.transfer_mode)
+    m.deal(rng=random.Random(record.seed))
+    g.attacker_idx = record.first_attacker
+    g.defender_idx = (record.first_attacker + 1) % record.num_players
+    m.start()
+    return m
+
+
+class Replayer:
+    """Random access into a recorded game.
+
+    Replays the record once up front (validating every action) and keeps a
+    Snapshot every snapshot_every plies, so machine_at() restores the nearest
+    snapshot and applies fewer than snapshot_every actions."""
+
+    def __init__(self, record: GameRecord, *, snapshot_every: int = 16) -> None:
+        assert snapshot_every > 0
+        self.record         = record
+        self.snapshot_every = snapshot_every
+        m = start_machine(record)
+        self._deck      = m.game.deck
+        self._snapshots = [take_snapshot(m, 0)]
+        for ply, action in enumerate(record.actions, start=1):
+            m.apply(action)
+            if ply % snapshot_every == 0:
+                self._snapshots.append(take_snapshot(m, ply))
+
+    def __len__(self) -> int:
+        return len(self.record.actions)
+
+    def machine_at(self, ply: int) -> GameStateMachine:
+        """A fresh machine holding the state after the first ply actions."""
+        if not 0 <= ply <= len(self.record.actions):
+            raise IndexError(f"ply {ply} outside 0..{len(self.record.actions)}")
+        snap = self._snapshots[ply // self.snapshot_every]
+        m = restore_snapshot(snap, self._deck, seed=self.record.seed,
+                             transfer_mode=self.record.transfer_mode)
+        for action in self.record.actions[snap.ply:ply]:
+            m.apply(action, check=False)
+        return m
+
+    def game_at(self, ply: int) -> Game:
+        return self.machine_at(ply).game
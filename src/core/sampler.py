@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: sample_many falls back to one sample() per deal
+    np = None
+
+from .card import CARDS, Card
+from .cardset import CardSet, FULL_DECK, card_bit, cards_of, mask_of
+from .deck import Deck
+from .knowledge import CardKnowledge
+from .record import restore_snapshot, take_snapshot
+from .state_machine import GameStateMachine
+
+
+if np is not None:
+    _CARDS = np.empty(len(CARDS), dtype=object)     # id → Card, for fancy indexing
+    _CARDS[:] = CARDS
+
+
+class DealSampler:
+    """Random full deals of the cards one seat cannot see, for a fixed
+    position.
+
+    Everything that does not change between samples is worked out once:
+    the observer's hand, the table, the discards, the face-up trump
+    (Deck.peek_bottom), the cards each opponent is known to hold (from a
+    CardKnowledge, if given) and how many more cards each hand and the deck
+    need. A sample is then one shuffle of the unseen cards cut into those
+    sizes, so every deal it gives is consistent and none are rejected.
+    sample_many() draws a batch of them at once with numpy."""
+
+    def __init__(self, machine: GameStateMachine, seat: int,
+                 knowledge: Optional[CardKnowledge] = None) -> None:
+        g    = machine.game
+        deck = g.deck
+        self.snap          = take_snapshot(machine, 0)
+        self.trump         = deck.trump
+        self.seed          = g.seed
+        self.transfer_mode = machine.transfer_mode
+        hands = self.snap.hands
+        table = g.table.mask()
+
+        if knowledge is not None:
+            held   = list(knowledge.known)
+            unseen = knowledge.unseen(table) & ~hands[seat]
+        else:
+            in_play = deck.mask() | table
+            for mask in hands:
+                in_play |= mask
+            # own hand, table, discards and the face-up trump
+            seen = hands[seat] | table | (FULL_DECK ^ in_play)
+            if deck.remaining():
+                seen |= card_bit(deck.peek_bottom())
+            held   = [0] * len(hands)
+            unseen = FULL_DECK & ~seen
+
+        held[seat]   = hands[seat]
+        self._held   = tuple(held)
+        self._need   = [(i, mask.bit_count() - held[i].bit_count())
+                        for i, mask in enumerate(hands) if i != seat]
+        self._unseen: List[Card] = cards_of(unseen)
+        self._ids    = None if np is None else np.array([c.id for c in self._unseen], dtype=np.int64)
+        self._drawn  = deck.cards[:deck.pos]
+        self._bottom = [deck.peek_bottom()] if deck.remaining() else []
+        if sum(n for _, n in self._need) + deck.remaining() - len(self._bottom) != len(self._unseen):
+            raise ValueError("knowledge does not match the position")
+
+    def sample(self, rng: random.Random) -> Tuple[Tuple[CardSet, ...], List[Card]]:
+        """(hand mask per seat, hidden deck cards in draw order)."""
+        cards = rng.sample(self._unseen, len(self._unseen))
+        hands = list(self._held)
+        k = 0
+        for i, n in self._need:
+            hands[i] |= mask_of(cards[k:k + n])
+            k += n
+        return tuple(hands), cards[k:]
+
+    def sample_many(self, n: int, rng: random.Random) -> List[Tuple[Tuple[CardSet, ...], List[Card]]]:
+        """n samples at once: every shuffle is an argsort of random keys, and
+        the hands are cut from the shuffled rows by cumulative hand size.
+        Seeded from rng, so a seeded rng still gives repeatable deals."""
+        if np is None or not len(self._ids):
+            return [self.sample(rng) for _ in range(n)]
+        gen   = np.random.default_rng(rng.getrandbits(64))
+        ids   = self._ids[np.argsort(gen.random((n, len(self._ids))), axis=1)]
+        bits  = np.left_shift(np.uint64(1), ids.astype(np.uint64))
+        hands = [list(self._held) for _ in range(n)]
+        k = 0
+        for i, need in self._need:
+            for hand, mask in zip(hands, bits[:, k:k + need].sum(axis=1, dtype=np.uint64).tolist()):
+                hand[i] |= mask
+            k += need
+        rest = _CARDS[ids[:, k:]].tolist()
+        return [(tuple(hand), cards) for hand, cards in zip(hands, rest)]
+
+    def machine(self, rng: random.Random) -> GameStateMachine:
+        """A live copy of the game with one sampled deal."""
+        return self.restore(*self.sample(rng))
+
+    def restore(self, hands: Tuple[CardSet, ...], rest: List[Card]) -> GameStateMachine:
+        """A live copy of the game with the deal (hands, rest) from sample()
+        or sample_many()."""
+        return restore_snapshot(replace(self.snap, hands=hands),
+                                Deck(cards=self._drawn + rest + self._bottom, trump=self.trump),
+                                seed=self.seed, transfer_mode=self.transfer_mode)
+
+
+if __name__ == "__main__":
+    import time
+    from .engine import GreedyPolicy, HeadlessEngine
+
+    m = HeadlessEngine([GreedyPolicy()] * 2).new_game(0)
+    m.start()
+    sampler, rng, n = DealSampler(m, 0), random.Random(0), 20000
+    for name, fn in [("sample()         ", lambda: [sampler.sample(rng) for _ in range(n)]),
+                     ("sample_many(64)  ", lambda: [sampler.sample_many(64, rng) for _ in range(n // 64)])]:
+        start = time.perf_counter()
+        fn()
+        print(f"{name} {(time.perf_counter() - start) / n * 1e6:6.2f} µs per deal")
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from .actions import (
+    ATTACK, DEFEND, TRANSFER, TAKE,
+    ATTACKING, DEFENDING, TAKING,
+    action_card, action_kind, can_add_attack, describe, legal_actions, next_defender,
+)
+from . import zobrist
+from .card import Card
+from .game import Game
+from .move_validator import MoveValidator
+
+
+# ── events ───────────────────────────────────────────────────────────────────
+
+EV_DEAL        = "deal"          # seat, card — initial deal, in dealing order
+EV_ROUND_START = "round_start"   # seat = attacker
+EV_ATTACK      = "attack"        # seat, card, slot
+EV_DEFEND      = "defend"        # seat, card, slot
+EV_TRANSFER    = "transfer"      # seat, card, slot — seat is the new attacker
+EV_TAKE        = "take"          # seat = defender giving up
+EV_PASS        = "pass"          # seat = attacker done adding cards
+EV_PICKUP      = "pickup"        # seat, cards — defender picks up the table
+EV_DISCARD     = "discard"       # seat = attacker who ended the round, cards
+EV_DRAW        = "draw"          # seat, card — draw-up, in drawing order
+EV_GAME_OVER   = "game_over"     # seat = durak, -1 on a tie
+
+
+@dataclass(slots=True)
+class GameEvent:
+    kind: str
+    seat: int = -1
+    card: Optional[Card] = None
+    slot: int = -1
+    cards: List[Card] = field(default_factory=list)
+
+
+# ── state machine ────────────────────────────────────────────────────────────
+
+class GameStateMachine:
+    """Production Durak rules as a pure state machine over a Game.
+
+    Callers feed integer actions from actions.py into apply(); the machine
+    mutates the Game and emits GameEvents to listeners. Nothing here touches
+    pygame, prints or sleeps, so the same rules drive GameScreen and
+    HeadlessEngine.
+
+    Round flow: the attacker plays one or more cards and passes to hand them
+    to the defender, who beats them one at a time, transfers (transfer mode)
+    or takes. After a take the attacker may pile on more cards (not after a
+    transfer) before passing. A pass on a fully defended table discards it.
+    Roles then advance and everyone draws up to six, one card at a time
+    starting with the new attacker and ending with the new defender.
+    """
+
+    def __init__(self, game: Game, *, transfer_mode: bool = False) -> None:
+        self.game          = game
+        self.transfer_mode = transfer_mode
+        self.phase         = ATTACKING
+        self.round         = 0
+        self.transferred   = False    # a transfer happened this round
+        self.piled_on      = 0        # cards added while the defender is taking
+        self.over          = False
+        self.loser: Optional[int] = None
+        self._listeners: list[Callable[[GameEvent], None]] = []
+
+    def add_listener(self, fn: Callable[[GameEvent], None]) -> None:
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[GameEvent], None]) -> None:
+        self._listeners.remove(fn)
+
+    def _emit(self, kind: str, seat: int = -1, card: Optional[Card] = None,
+              slot: int = -1, cards: Optional[List[Card]] = None) -> None:
+        if not self._listeners:
+            return
+        ev = GameEvent(kind, seat, card, slot, cards if cards is not None else [])
+        for fn in self._listeners:
+            fn(ev)
+
+    # ── setup ────────────────────────────────────────────────────────────────
+
+    def deal(self, rng=None) -> None:
+        """Deal six each, two at a time, then pick the first attacker
+        (lowest trump; rng breaks the no-trump case)."""
+        g     = self.game
+        hands = g.deck.deal(len(g.players), 6)
+        for start in range(0, 6, 2):
+            for seat, hand in enumerate(hands):
+                for card in hand[start:start + 2]:
+                    self._emit(EV_DEAL, seat, card)
+        trump = g.deck.trump
+        for p, hand in zip(g.players, hands):
+            p.add_cards(hand)
+            p.sort_hand(trump)
+        g._assign_first_attacker(rng=rng)
+
+    def start(self) -> None:
+        """Begin the next round with the current attacker/defender."""
+        g = self.game
+        n = len(g.players)
+        while not g.players[g.attacker_idx].hand:
+            g.attacker_idx = (g.attacker_idx + 1) % n
+        while not g.players[g.defender_idx].hand or g.defender_idx == g.attacker_idx:
+            g.defender_idx = (g.defender_idx + 1) % n
+        g.table.clear()
+        self.phase       = ATTACKING
+        self.transferred = False
+        self.piled_on    = 0
+        self.round      += 1
+        self._emit(EV_ROUND_START, g.attacker_idx)
+
+    # ── queries ──────────────────────────────────────────────────────────────
+
+    def legal_actions(self) -> List[int]:
+        if self.over:
+            return []
+        return legal_actions(self.game, self.phase, transfer_mode=self.transfer_mode)
+
+    def to_move(self) -> int:
+        g = self.game
+        return g.defender_idx if self.phase == DEFENDING else g.attacker_idx
+
+    def key(self) -> int:
+        """Zobrist key of the whole rules state: Game.key() plus the phase
+        and transfer flags. Equal states give equal keys on any machine
+        (piled_on and the round count are bookkeeping and are not hashed)."""
+        k = self.game.key() ^ zobrist.PHASE[self.phase]
+        if self.transferred:
+            k ^= zobrist.TRANSFERRED
+        if self.transfer_mode:
+            k ^= zobrist.TRANSFER_MODE
+        return k
+
+    # ── transitions ──────────────────────────────────────────────────────────
+
+    def apply(self, action: int, *, check: bool = True) -> None:
+        """Play one action for the player to move. check=False skips the
+        legality test for callers that only pick from legal_actions()."""
+        if check and action not in self.legal_actions():
+            raise ValueError(f"illegal action '{describe(action)}' while {self.phase}")
+        g     = self.game
+        table = g.table
+        kind  = action_kind(action)
+
+        if kind == ATTACK:
+            card = action_card(action)
+            g.players[g.attacker_idx].remove_card(card)
+            slot = table.attack_count()
+            table.add_attack(card)
+            if self.phase == TAKING:
+                self.piled_on += 1
+            self._emit(EV_ATTACK, g.attacker_idx, card, slot)
+
+        elif kind == DEFEND:
+            card = action_card(action)
+            slot = table.first_undefended_index()
+            g.players[g.defender_idx].remove_card(card)
+            table.add_defence(slot, card)
+            self._emit(EV_DEFEND, g.defender_idx, card, slot)
+            if table.all_defended():
+                self.phase = ATTACKING
+
+        elif kind == TRANSFER:
+            card = action_card(action)
+            g.players[g.defender_idx].remove_card(card)
+            slot = table.attack_count()
+            table.add_attack(card)
+            g.attacker_idx, g.defender_idx = g.defender_idx, next_defender(g)
+            self.transferred = True
+            self._emit(EV_TRANSFER, g.attacker_idx, card, slot)
+
+        elif kind == TAKE:
+            self._emit(EV_TAKE, g.defender_idx)
+            if not self.transferred and self._can_pile_on():
+                self.phase = TAKING
+            else:
+                self._pickup()
+
+        else:  # PASS
+            self._emit(EV_PASS, g.attacker_idx)
+            if self.phase == TAKING:
+                self._pickup()
+            elif not table.all_defended():
+                self.phase = DEFENDING
+            else:
+                self._emit(EV_DISCARD, g.attacker_idx, cards=table.all_cards())
+                self._end_round(defender_took=False)
+
+    def _can_pile_on(self) -> bool:
+        g = self.game
+        if not can_add_attack(g):
+            return False
+        validator = MoveValidator(g.deck.trump)
+        return bool(g.players[g.attacker_idx].hand_mask() & validator.attack_mask(g.table))
+
+    def _pickup(self) -> None:
+        g        = self.game
+        defender = g.players[g.defender_idx]
+        taken    = g.table.all_cards()
+        defender.add_cards(taken)
+        defender.sort_hand(g.deck.trump)
+        self._emit(EV_PICKUP, g.defender_idx, cards=taken)
+        self._end_round(defender_took=True)
+
+    def _end_round(self, defender_took: bool) -> None:
+        g = self.game
+        g._advance_roles(defender_took=defender_took)
+        g.table.clear()
+        self._draw_up()
+
+        active = g._active_players()
+        if len(active) <= 1:
+            self.over  = True
+            self.loser = active[0] if active else None
+            self._emit(EV_GAME_OVER, -1 if self.loser is None else self.loser)
+            return
+        self.start()
+
+    def _draw_up(self) -> None:
+        """One card per player per pass: new attacker, others, new defender."""
+        g     = self.game
+        deck  = g.deck
+        order = ([g.attacker_idx]
+                 + [i for i in range(len(g.players))
+                    if i not in (g.attacker_idx, g.defender_idx)]
+                 + [g.defender_idx])
+        needs = [max(0, 6 - len(g.players[i].hand)) for i in order]
+        if not any(needs) or deck.remaining() == 0:
+            return
+        drawn = deck.draw_many(sum(needs))
+        k = 0
+        for turn in range(max(needs)):
+            for seat, need in zip(order, needs):
+                if turn < need and k < len(drawn):
+                    g.players[seat].add_cards(drawn[k:k + 1])
+                    self._emit(EV_DRAW, seat, drawn[k])
+                    k += 1
+        for seat in order:
+            g.players[seat].sort_hand(deck.trump)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Deque, List, Optional, Tuple
 
-from .card import Card, ranks_on_cards
+from . import zobrist
+from .card import Card, RANKS_32
+from .cardset import CardSet, card_bit, rank_bits
 
 
 @dataclass(slots=True)
@@ -18,15 +21,46 @@ class BattlePair:
 @dataclass(slots=True)
 class Table:
     pairs: List[BattlePair] = field(default_factory=list)
+    # maintained by add_attack / add_defence / clear so queries never rescan
+    _attacks:    List[Card]    = field(default_factory=list, init=False, repr=False, compare=False)
+    _defences:   List[Card]    = field(default_factory=list, init=False, repr=False, compare=False)
+    _undefended: Deque[int]    = field(default_factory=deque, init=False, repr=False, compare=False)
+    _att_mask:   CardSet       = field(default=0, init=False, repr=False, compare=False)
+    _def_mask:   CardSet       = field(default=0, init=False, repr=False, compare=False)
+    key:         int           = field(default=0, init=False, repr=False, compare=False)   # Zobrist
+
+    def __post_init__(self) -> None:
+        pairs, self.pairs = list(self.pairs), []
+        for p in pairs:
+            self.add_attack(p.attack)
+            if p.defence is not None:
+                self.add_defence(len(self.pairs) - 1, p.defence)
 
     def clear(self) -> None:
         self.pairs.clear()
+        self._attacks.clear()
+        self._defences.clear()
+        self._undefended.clear()
+        self._att_mask = 0
+        self._def_mask = 0
+        self.key       = 0
 
     def attacks(self) -> List[Card]:
-        return [p.attack for p in self.pairs]
+        """Attack cards in play order. Live view — do not mutate."""
+        return self._attacks
 
     def defences(self) -> List[Card]:
-        return [p.defence for p in self.pairs if p.defence is not None]
+        """Defence cards in slot order. Live view — do not mutate."""
+        return self._defences
+
+    def attack_count(self) -> int:
+        return len(self._attacks)
+
+    def defence_count(self) -> int:
+        return len(self._defences)
+
+    def undefended_count(self) -> int:
+        return len(self._undefended)
 
     def all_cards(self) -> List[Card]:
         out = []
@@ -37,10 +71,32 @@ class Table:
         return out
 
     def ranks_on_table(self) -> set[str]:
-        return ranks_on_cards(self.all_cards())
+        bits = self.rank_mask()
+        return {r for i, r in enumerate(RANKS_32) if bits >> i & 1}
+
+    # ── card-set views ───────────────────────────────────────────────────────
+
+    def attack_mask(self) -> CardSet:
+        return self._att_mask
+
+    def defence_mask(self) -> CardSet:
+        return self._def_mask
+
+    def mask(self) -> CardSet:
+        return self._att_mask | self._def_mask
+
+    def rank_mask(self) -> int:
+        """9-bit set of ranks on the table (bit = rank_value)."""
+        return rank_bits(self._att_mask | self._def_mask)
+
+    # ── mutation ─────────────────────────────────────────────────────────────
 
     def add_attack(self, card: Card) -> None:
+        self.key ^= zobrist.ATTACK[len(self.pairs)][card.id]
+        self._undefended.append(len(self.pairs))
         self.pairs.append(BattlePair(attack=card))
+        self._attacks.append(card)
+        self._att_mask |= card_bit(card)
 
     def add_defence(self, attack_index: int, card: Card) -> None:
         if attack_index < 0 or attack_index >= len(self.pairs):
@@ -48,15 +104,21 @@ class Table:
         if self.pairs[attack_index].is_defended():
             raise ValueError("That attack is already defended")
         self.pairs[attack_index].defence = card
+        self.key ^= zobrist.DEFENCE[attack_index][card.id]
+        # slot order; at most six pairs, and usually this is an append
+        at = sum(p.defence is not None for p in self.pairs[:attack_index])
+        self._defences.insert(at, card)
+        self._def_mask |= card_bit(card)
+        if self._undefended[0] == attack_index:
+            self._undefended.popleft()
+        else:
+            self._undefended.remove(attack_index)
 
     def first_undefended_index(self) -> Optional[int]:
-        for i, p in enumerate(self.pairs):
-            if not p.is_defended():
-                return i
-        return None
+        return self._undefended[0] if self._undefended else None
 
     def all_defended(self) -> bool:
-        return self.first_undefended_index() is None
+        return not self._undefended
 
     def is_empty(self) -> bool:
         return len(self.pairs) == 0
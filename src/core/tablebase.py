@@ -0,0 +1,428 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+import mmap
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from math import comb
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .actions import ATTACKING
+from .canonical import FRAME_TRUMP, canonical_hand, canonical_position, lane, to_frame
+from .card import Suit, NUM_CARDS, _SUIT_INDEX
+from .cardset import NUM_RANKS
+from .endgame import AMASK, ATT, DMASK, H0, H1, KEY, EndgameSolver, mover, position_key
+
+
+# ── format ───────────────────────────────────────────────────────────────────
+# Every two-player, empty-deck position at the start of a round (classic
+# rules, table empty) with 1..K cards in each hand, one byte per position:
+#     0                 not solved yet
+#     outcome << 6 | n  outcome for the attacker (WIN / LOSS / TIE) and n, the
+#                       rounds until the game ends under best play (capped at 63;
+#                       0 for ties). The winner plays for the shortest game and
+#                       the loser for the longest.
+#
+# Only canonical positions are stored (canonical.py): the trump moved to
+# spades and the other suits relabeled, so the up to 24 labelings of a
+# position share one byte and one file serves all four trumps.
+#
+# After the header come K uint32 counts and then, all little-endian uint64:
+#     for each attacker size a, the sorted list of attacker hands that start
+#     a canonical position (exactly those canonical on their own);
+#     for each (a, b), where each listed attacker's block starts in the
+#     (a, b) section, plus the section's size at the end.
+# Then the sections: per attacker, one byte for each defender of b cards
+# that makes the pair canonical, at its rank (_defender_rank). A lookup is
+# a canonicalization, a binary search in the attacker list, a rank and one
+# mmap read.
+
+MAGIC   = b"FHTB"
+VERSION = 2
+_HEADER = struct.Struct("<4sBB")          # magic, version, K
+HEADER_SIZE = _HEADER.size
+
+WIN, LOSS, TIE = 1, 2, 3
+MAX_ROUNDS = 63
+
+
+def _colex_rank(mask: int) -> int:
+    """Rank of a set among all sets of its size (colexicographic order)."""
+    r, i = 0, 0
+    while mask:
+        low = mask & -mask
+        i  += 1
+        r  += comb(low.bit_length() - 1, i)
+        mask ^= low
+    return r
+
+
+def _squeeze(mask: int, holes: int) -> int:
+    """mask renumbered over the cards not in holes (holes and mask disjoint)."""
+    out = 0
+    while mask:
+        low = mask & -mask
+        out |= low >> (holes & (low - 1)).bit_count()
+        mask ^= low
+    return out
+
+
+# ── defender ranks ───────────────────────────────────────────────────────────
+# Against a canonical attacker, a defender hand splits into independent
+# units: the trump lane, then each run of plain lanes the attacker holds
+# identically. Inside a run, canonical form puts the defender's lanes in
+# non-increasing order, so a run of g lanes is a sorted g-tuple of subsets
+# of its free ranks. Defenders are ranked by cards per unit (in unit order),
+# then by each unit's own rank: colex within a single lane, sorted order of
+# tuples within a run.
+
+_FRAME = _SUIT_INDEX[FRAME_TRUMP]
+_PLAIN = [i for i in range(len(Suit)) if i != _FRAME]
+
+
+def _units(attacker: int) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """(free ranks per lane, lanes) for each unit of a defender hand."""
+    units = [(NUM_RANKS - lane(attacker, _FRAME).bit_count(), (_FRAME,))]
+    prev  = None
+    for i in _PLAIN:
+        held = lane(attacker, i)
+        if held == prev:
+            units[-1] = (units[-1][0], units[-1][1] + (i,))
+        else:
+            units.append((NUM_RANKS - held.bit_count(), (i,)))
+        prev = held
+    return tuple(units)
+
+
+@lru_cache(maxsize=None)
+def _count(n: int, g: int, s: int) -> int:
+    return comb(n, s) if g == 1 else len(_runs(n, g, s))
+
+
+@lru_cache(maxsize=None)
+def _runs(n: int, g: int, s: int) -> Dict[Tuple[int, ...], int]:
+    """Rank of every non-increasing g-tuple of n-bit sets with s bits in
+    all, in sorted order."""
+    by_size = [[m for m in range(1 << n) if m.bit_count() == k] for k in range(n + 1)]
+    out = []
+    for sizes in itertools.product(range(min(n, s) + 1), repeat=g):
+        if sum(sizes) == s:
+            out.extend(t for t in itertools.product(*(by_size[k] for k in sizes))
+                       if all(t[j] >= t[j + 1] for j in range(g - 1)))
+    return {t: i for i, t in enumerate(sorted(out))}
+
+
+@lru_cache(maxsize=4096)
+def _ways(units: Tuple[Tuple[int, Tuple[int, ...]], ...], b: int) -> List[List[int]]:
+    """ways[u][r]: defender hands of r cards made from units u onwards."""
+    ways = [[0] * (b + 1) for _ in range(len(units) + 1)]
+    ways[-1][0] = 1
+    for u in range(len(units) - 1, -1, -1):
+        n, lanes = units[u]
+        for r in range(b + 1):
+            ways[u][r] = sum(_count(n, len(lanes), s) * ways[u + 1][r - s] for s in range(r + 1))
+    return ways
+
+
+def block_size(attacker: int, b: int) -> int:
+    """How many defenders of b cards make a canonical pair with attacker."""
+    return _ways(_units(attacker), b)[0][b]
+
+
+def _defender_rank(attacker: int, defender: int) -> int:
+    """Rank of defender among those block_size counts (the pair must be
+    canonical)."""
+    units = _units(attacker)
+    left  = defender.bit_count()
+    ways  = _ways(units, left)
+    rank, fixed, inner = 0, 1, 0       # fixed: ways to fill the units before u
+    for u, (n, lanes) in enumerate(units):
+        parts = tuple(_squeeze(lane(defender, i), lane(attacker, i)) for i in lanes)
+        size  = sum(p.bit_count() for p in parts)
+        g     = len(lanes)
+        rank += fixed * sum(_count(n, g, s) * ways[u + 1][left - s] for s in range(size))
+        left -= size
+        base  = _count(n, g, size)
+        fixed *= base
+        inner = inner * base + (_colex_rank(parts[0]) if g == 1 else _runs(n, g, size)[parts])
+    return rank + inner
+
+
+def canonical_attackers(a: int) -> List[int]:
+    """Sorted frame hands of a cards that are canonical on their own: the
+    only attacker hands a canonical position can have."""
+    return sorted(m for m in _subsets(list(range(NUM_CARDS)), a)
+                  if canonical_hand(m, FRAME_TRUMP)[0] == m)
+
+
+def _layout(k: int, counts: Sequence[int],
+            sizes: Dict[Tuple[int, int], int]) -> Dict[Tuple[int, ...], int]:
+    """Byte offsets of each attacker list (a,), block start list (a, b, 0)
+    and section (a, b), given the attacker count for each size and the
+    size of each section; () is the total size."""
+    offsets, pos = {}, HEADER_SIZE + 4 * k
+    for a in range(1, k + 1):
+        offsets[a,] = pos
+        pos += 8 * counts[a - 1]
+    for a in range(1, k + 1):
+        for b in range(1, k + 1):
+            offsets[a, b, 0] = pos
+            pos += 8 * (counts[a - 1] + 1)
+    for a in range(1, k + 1):
+        for b in range(1, k + 1):
+            offsets[a, b] = pos
+            pos += sizes[a, b]
+    offsets[()] = pos
+    return offsets
+
+
+def slot(block: int, attacker: int, defender: int, offsets: Dict[Tuple[int, ...], int]) -> int:
+    """Byte offset of a canonical position (both hands 1..K cards) whose
+    attacker's block starts at block in its section."""
+    return (offsets[attacker.bit_count(), defender.bit_count()] + block
+            + _defender_rank(attacker, defender))
+
+
+def encode(outcome: int, rounds: int) -> int:
+    return outcome << 6 | min(rounds, MAX_ROUNDS)
+
+
+def decode(byte: int) -> Optional[Tuple[int, int]]:
+    return (byte >> 6, byte & MAX_ROUNDS) if byte else None
+
+
+# ── reader ───────────────────────────────────────────────────────────────────
+
+class Tablebase:
+    """Read-only view of a tablebase file through mmap: the OS pages in only
+    the bytes probed, so resident memory stays near zero."""
+
+    def __init__(self, path: str) -> None:
+        self._fp = open(path, "rb")
+        self._mm = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.k = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} tablebase")
+        counts = struct.unpack_from(f"<{self.k}I", self._mm, HEADER_SIZE)
+        self._offsets = _layout(self.k, counts, self._section_sizes(counts))
+        if len(self._mm) != self._offsets[()]:
+            raise ValueError(f"{path} is truncated")
+        self._attackers = {a: self._uint64s(self._offsets[a,], n)
+                           for a, n in enumerate(counts, start=1)}
+        self._blocks = {(a, b): self._uint64s(self._offsets[a, b, 0], n + 1)
+                        for a, n in enumerate(counts, start=1) for b in range(1, self.k + 1)}
+
+    def _section_sizes(self, counts: Sequence[int]) -> Dict[Tuple[int, int], int]:
+        """Read the last block start (the section size) of each (a, b)."""
+        pos, sizes = HEADER_SIZE + 4 * self.k + 8 * sum(counts), {}
+        for a, n in enumerate(counts, start=1):
+            for b in range(1, self.k + 1):
+                pos += 8 * (n + 1)
+                sizes[a, b] = struct.unpack_from("<Q", self._mm, pos - 8)[0]
+        return sizes
+
+    def _uint64s(self, start: int, n: int) -> Sequence[int]:
+        if sys.byteorder == "little":           # read straight off the map
+            return memoryview(self._mm)[start:start + 8 * n].cast("Q")
+        keys = array("Q", self._mm[start:start + 8 * n])
+        keys.byteswap()
+        return keys
+
+    def close(self) -> None:
+        for keys in [*self._attackers.values(), *self._blocks.values()]:
+            if isinstance(keys, memoryview):
+                keys.release()
+        self._mm.close()
+        self._fp.close()
+
+    def covers(self, attacker: int, defender: int) -> bool:
+        return 0 < attacker.bit_count() <= self.k and 0 < defender.bit_count() <= self.k
+
+    def probe(self, attacker: int, defender: int, trump: Suit) -> Optional[Tuple[int, int]]:
+        """(outcome for the attacker, rounds left) for a round-start position,
+        or None if it is outside the table or not solved yet."""
+        if not self.covers(attacker, defender):
+            return None
+        att, dfn = canonical(to_frame(attacker, trump), to_frame(defender, trump))
+        a    = att.bit_count()
+        i    = bisect.bisect_left(self._attackers[a], att)
+        return decode(self._mm[slot(self._blocks[a, dfn.bit_count()][i], att, dfn, self._offsets)])
+
+
+# ── generator ────────────────────────────────────────────────────────────────
+# Scores are for seat 0 of an EndgameSolver position: a win in n rounds is
+# _BIG - n, a loss in n rounds is n - _BIG and a tie is 0, so plain minimax
+# both decides the game and picks the fastest win / slowest loss.
+
+_BIG = 1000
+
+
+def _outcome(score: int) -> Tuple[int, int]:
+    if score > 0:
+        return WIN, _BIG - score
+    if score < 0:
+        return LOSS, _BIG + score
+    return TIE, 0
+
+
+def canonical(attacker: int, defender: int) -> Tuple[int, int]:
+    """Canonical form of a frame position (see canonical.py)."""
+    return canonical_position((attacker, defender), FRAME_TRUMP)[0]
+
+
+class RoundSolver:
+    """Exact values of round-start positions, by full minimax inside each
+    round (classic rules cannot repeat a position, so plain memoisation is
+    sound). Results for every round start met along the way are memoised on
+    their canonical form and reused across calls."""
+
+    def __init__(self) -> None:
+        self.rules  = EndgameSolver(FRAME_TRUMP)
+        self.starts: Dict[Tuple[int, int], int] = {}     # canonical → attacker score
+        self._memo: Dict[int, int] = {}                  # in-round positions, by key
+
+    def value(self, attacker: int, defender: int) -> Tuple[int, int]:
+        """(outcome for the attacker, rounds left) with both hands non-empty."""
+        return _outcome(self._start(attacker, defender))
+
+    def _start(self, attacker: int, defender: int) -> int:
+        key = canonical(attacker, defender)
+        s = self.starts.get(key)
+        if s is None:
+            a, d = key
+            pos = (a, d, 0, ATTACKING, 0, 0, (), False,
+                   position_key(a, d, 0, ATTACKING, 0, 0, (), False))
+            s = self.starts[key] = self._in_round(pos)
+        return s
+
+    def _in_round(self, pos: tuple) -> int:
+        s = self._memo.get(pos[KEY])
+        if s is not None:
+            return s
+        rules  = self.rules
+        mover0 = mover(pos) == 0
+        best   = None
+        for move in rules.legal(pos):
+            child = rules.apply(pos, move)
+            if isinstance(child, float):                   # game over this round
+                v = {1.0: _BIG - 1, 0.0: 1 - _BIG, 0.5: 0}[child]
+            elif child[AMASK] == 0 and child[DMASK] == 0:  # next round
+                hands = (child[H0], child[H1])
+                att   = child[ATT]
+                v = self._start(hands[att], hands[1 - att])
+                v = v if att == 0 else -v
+                v = v - 1 if v > 0 else v + 1 if v < 0 else 0
+            else:
+                v = self._in_round(child)
+            if best is None or (v > best if mover0 else v < best):
+                best = v
+        self._memo[pos[KEY]] = best
+        return best
+
+
+# process-wide state of a generator worker
+_solver: Optional[RoundSolver] = None
+_done:   Optional[mmap.mmap] = None
+
+
+def _init_worker(path: str) -> None:
+    global _solver, _done
+    _solver = RoundSolver()
+    fp = open(path, "rb")
+    _done = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _subsets(cards: List[int], n: int) -> Iterator[int]:
+    for combo in itertools.combinations(cards, n):
+        yield sum(1 << c for c in combo)
+
+
+def _solve_shard(offsets: Dict[Tuple[int, ...], int], b: int,
+                 attackers: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Worker entry point: solve every canonical position whose defender
+    hand has b cards and whose attacker hand is in attackers, given as
+    (hand, block start) pairs. Returns (slot, byte) for each position not
+    solved already."""
+    out = []
+    for att, block in attackers:
+        rest = [c for c in range(NUM_CARDS) if not att >> c & 1]
+        for dfn in _subsets(rest, b):
+            if canonical(att, dfn) != (att, dfn):
+                continue
+            i = slot(block, att, dfn, offsets)
+            if not _done[i]:
+                out.append((i, encode(*_solver.value(att, dfn))))
+    return out
+
+
+def _block_starts(attackers: List[int], b: int) -> List[int]:
+    """Where each attacker's block starts in its section for defenders of b
+    cards, then the section size."""
+    starts = [0]
+    for att in attackers:
+        starts.append(starts[-1] + block_size(att, b))
+    return starts
+
+
+def _shards(lists: Dict[int, List[int]], blocks: Dict[Tuple[int, int], List[int]],
+            size: int) -> Iterator[Tuple[int, List[Tuple[int, int]]]]:
+    """(b, [(attacker, block start)]) work units, smallest hands first."""
+    for a, attackers in lists.items():
+        for b in range(1, len(lists) + 1):
+            pairs = list(zip(attackers, blocks[a, b]))
+            for i in range(0, len(pairs), size):
+                yield b, pairs[i:i + size]
+
+
+def generate(path: str, k: int = 2, *, workers: Optional[int] = None, shard_size: int = 16,
+             on_shard: Optional[Callable[[int, int], None]] = None) -> None:
+    """Build (or finish) the tablebase at path for hands of up to k cards.
+
+    Work is spread over a process pool; each finished shard is written
+    straight into the file and flushed, and solved positions are skipped on
+    a rerun, so an interrupted build resumes where it stopped. The header
+    and attacker lists are rewritten on every run. on_shard, if given, gets
+    (shards done, shards total)."""
+    lists   = {a: canonical_attackers(a) for a in range(1, k + 1)}
+    counts  = [len(lists[a]) for a in lists]
+    blocks  = {(a, b): _block_starts(lists[a], b) for a in lists for b in lists}
+    offsets = _layout(k, counts, {ab: starts[-1] for ab, starts in blocks.items()})
+    size    = offsets[()]
+    fresh   = not os.path.exists(path)
+    if fresh:
+        with open(path, "wb") as fp:
+            fp.truncate(size)
+    with open(path, "r+b") as fp:
+        mm = mmap.mmap(fp.fileno(), 0)
+        try:
+            magic, version, file_k = _HEADER.unpack_from(mm, 0)
+            if len(mm) != size or (not fresh and (magic, version, file_k) != (MAGIC, VERSION, k)):
+                raise ValueError(f"{path} is not a K={k} version {VERSION} tablebase")
+            mm[:offsets[1, 1]] = (
+                _HEADER.pack(MAGIC, VERSION, k) + struct.pack(f"<{k}I", *counts)
+                + b"".join(struct.pack(f"<{len(m)}Q", *m) for m in [*lists.values(), *blocks.values()]))
+            mm.flush()
+            shards = list(_shards(lists, blocks, shard_size))
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                     initializer=_init_worker, initargs=(path,)) as pool:
+                futures = [pool.submit(_solve_shard, offsets, *s) for s in shards]
+                for done, fut in enumerate(as_completed(futures), start=1):
+                    for i, byte in fut.result():
+                        mm[i] = byte
+                    mm.flush()
+                    if on_shard:
+                        on_shard(done, len(shards))
+        finally:
+            mm.close()
+
+
+if __name__ == "__main__":
+    out = sys.argv[1] if len(sys.argv) > 1 else "endgame.fhtb"
+    k   = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    generate(out, k, on_shard=lambda d, n: print(f"\r  {d}/{n} shards", end="", flush=True))
+    print()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from .engine import GreedyPolicy, HeadlessEngine, Policy, GameResult
+
+
+# ── aggregated stats ─────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class SideStats:
+    """Totals for one policy across a tournament (same stats GameScreen shows)."""
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    rounds: int = 0
+    piles_taken: int = 0
+    biggest_pile: int = 0
+    trumps_played: int = 0
+    passes: int = 0
+
+
+# a deal played twice with seats swapped: (A in seat 0, A in seat 1)
+GamePair = Tuple[GameResult, GameResult]
+
+# anything that builds a fresh Policy with no arguments and pickles: a Policy
+# class, or functools.partial(ISMCTSPolicy, budget_ms=50) for a configured bot
+PolicyFactory = Callable[[], Policy]
+
+
+@dataclass(slots=True)
+class TournamentStats:
+    a: SideStats = field(default_factory=SideStats)
+    b: SideStats = field(default_factory=SideStats)
+    games: int = 0
+    elapsed: float = 0.0
+    pairs: int = 0
+    pair_score_sq: float = 0.0        # sum of squared per-pair mean scores
+
+    def add(self, result: GameResult, a_seat: int) -> None:
+        self.games += 1
+        for side, seat in ((self.a, a_seat), (self.b, 1 - a_seat)):
+            if result.loser is None:
+                side.ties += 1
+            elif result.loser == seat:
+                side.losses += 1
+            else:
+                side.wins += 1
+            side.rounds        += result.rounds
+            side.piles_taken   += result.piles_taken[seat]
+            side.biggest_pile   = max(side.biggest_pile, result.biggest_pile[seat])
+            side.trumps_played += result.trumps_played[seat]
+            side.passes        += result.passes[seat]
+
+    def add_pair(self, pair: GamePair) -> None:
+        straight, swapped = pair
+        self.add(straight, 0)
+        self.add(swapped, 1)
+        s = (_a_score(straight, 0) + _a_score(swapped, 1)) / 2
+        self.pairs         += 1
+        self.pair_score_sq += s * s
+
+    def score(self) -> float:
+        """Policy A's mean score per game: win 1, tie 0.5, loss 0."""
+        if not self.games:
+            return 0.0
+        return (self.a.wins + 0.5 * self.a.ties) / self.games
+
+    def confidence_interval(self, z: float = 1.96) -> tuple[float, float]:
+        """Normal-approximation interval on score() (z=1.96 → 95%), over
+        per-pair means: both games of a pair share the deal, so most of the
+        luck of the cards cancels out."""
+        n = self.pairs
+        if not n:
+            return (0.0, 1.0)
+        mean = self.score()
+        var  = max(0.0, self.pair_score_sq / n - mean * mean)
+        half = z * math.sqrt(var / n)
+        return (max(0.0, mean - half), min(1.0, mean + half))
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def _a_score(result: GameResult, a_seat: int) -> float:
+    if result.loser is None:
+        return 0.5
+    return 0.0 if result.loser == a_seat else 1.0
+
+
+# ── workers ──────────────────────────────────────────────────────────────────
+
+def _play_batch(policy_a: PolicyFactory, policy_b: PolicyFactory,
+                seeds: List[int]) -> List[GamePair]:
+    """Worker entry point. Every seed is played twice, policy A in seat 0 and
+    then in seat 1, so both sides get the same cards and the same seat."""
+    a, b = policy_a(), policy_b()
+    straight = HeadlessEngine([a, b])
+    swapped  = HeadlessEngine([b, a])
+    return [(straight.play(seed), swapped.play(seed)) for seed in seeds]
+
+
+def iter_batches(policy_a: PolicyFactory, policy_b: PolicyFactory, n_games: int, *,
+                 first_seed: int = 0, batch_size: int = 250,
+                 workers: Optional[int] = None) -> Iterator[List[GamePair]]:
+    """Yield batches of game pairs as worker processes finish them. n_games
+    is rounded up to whole pairs; a batch holds batch_size games.
+
+    Policies are passed as factories so each worker builds its own instances."""
+    n_seeds = (n_games + 1) // 2
+    per     = max(1, batch_size // 2)
+    seeds   = range(first_seed, first_seed + n_seeds)
+    shards  = [list(seeds[i:i + per]) for i in range(0, n_seeds, per)]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(_play_batch, policy_a, policy_b, s) for s in shards]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+def run_tournament(policy_a: PolicyFactory, policy_b: PolicyFactory, n_games: int, *,
+                   first_seed: int = 0, batch_size: int = 250,
+                   workers: Optional[int] = None,
+                   on_batch: Optional[Callable[[TournamentStats], None]] = None
+                   ) -> TournamentStats:
+    """Play n_games seeded games, as seat-swapped pairs, across all cores and
+    aggregate them. on_batch, if given, is called with the running totals after every batch."""
+    stats = TournamentStats()
+    start = time.perf_counter()
+    for batch in iter_batches(policy_a, policy_b, n_games, first_seed=first_seed,
+                              batch_size=batch_size, workers=workers):
+        for pair in batch:
+            stats.add_pair(pair)
+        stats.elapsed = time.perf_counter() - start
+        if on_batch:
+            on_batch(stats)
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+if __name__ == "__main__":
+    import sys
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    def progress(s: TournamentStats) -> None:
+        lo, hi = s.confidence_interval()
+        print(f"\r  {s.games}/{n}  score {s.score():.3f} [{lo:.3f}, {hi:.3f}]"
+              f"  {s.games_per_second:.0f} games/s", end="", flush=True)
+
+    final = run_tournament(GreedyPolicy, GreedyPolicy, n, on_batch=progress)
+    print()
+    for label, side in (("A", final.a), ("B", final.b)):
+        print(f"  {label}: W{side.wins} L{side.losses} T{side.ties}  "
+              f"piles {side.piles_taken}  biggest {side.biggest_pile}  "
+              f"trumps {side.trumps_played}  passes {side.passes}")
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import random
+from typing import List
+
+from .card import Suit, NUM_CARDS
+
+
+# ── Zobrist tables ───────────────────────────────────────────────────────────
+# One fixed random 64-bit word per (feature, card). A state's key is the XOR
+# of the words for every feature it has, so each move updates it with one or
+# two XORs. Seeded so keys are stable across runs and processes.
+
+_rng = random.Random(0x20B1)
+MASK64 = (1 << 64) - 1
+
+
+def bits() -> int:
+    return _rng.getrandbits(64)
+
+
+# a card in some player's hand (seat-independent; see seat_key)
+HAND:     List[int] = [bits() for _ in range(NUM_CARDS)]
+# a card still in the deck
+DECK:     List[int] = [bits() for _ in range(NUM_CARDS)]
+# attack / defence card in table slot i (pairs matter, so slots are keyed)
+ATTACK:   List[List[int]] = [[bits() for _ in range(NUM_CARDS)] for _ in range(NUM_CARDS)]
+DEFENCE:  List[List[int]] = [[bits() for _ in range(NUM_CARDS)] for _ in range(NUM_CARDS)]
+TRUMP     = {s: bits() for s in Suit}
+ATTACKER: List[int] = [bits() for _ in range(6)]
+DEFENDER: List[int] = [bits() for _ in range(6)]
+PHASE     = {"attacking": 0, "defending": bits(), "taking": bits()}
+TRANSFERRED   = bits()
+TRANSFER_MODE = bits()
+
+
+def seat_key(hand_key: int, seat: int) -> int:
+    """Place a Player's seat-independent hand key at a seat.
+
+    Rotation is linear over XOR, so this is the same as keying the hand with
+    a per-seat table (HAND rotated by 11 * seat bits) while letting Player
+    keep its key without knowing where it sits."""
+    r = (11 * seat) & 63
+    return ((hand_key << r) | (hand_key >> (64 - r))) & MASK64 if r else hand_key
+
+
+def cards_key(mask: int, table: List[int]) -> int:
+    """XOR of table[card] over a CardSet, for keys built from scratch."""
+    k = 0
+    while mask:
+        low = mask & -mask
+        k ^= table[low.bit_length() - 1]
+        mask ^= low
+    return k
@@ -17,6 +17,7 @@ from .constants import (
 from .achievements import ACHIEVEMENTS, COMMON, RARE, EPIC, PLATINUM, get_global_stats
 from .locale import t as _t
 from .font_manager import get_fonts
+from . import glyph_text
 
 _COLS     = 2
 _CARD_W   = 510
@@ -197,9 +198,8 @@ class AchievementsScreen:
         f_title  = f["title"]
         f_sm     = f["small"]
 
-        title = f_title.render(_t("ach_screen.title"), False, TEXT_MAIN)
-        glow  = f_title.render(_t("ach_screen.title"), False, NEON_GLOW)
-        glow.set_alpha(35)
+        title = glyph_text.render(f_title, _t("ach_screen.title"), TEXT_MAIN)
+        glow  = glyph_text.render(f_title, _t("ach_screen.title"), NEON_GLOW, 35)
         t.blit(glow, (cx - glow.get_width() // 2 - 2, 20))
         t.blit(title, (cx - title.get_width() // 2, 20))
 
@@ -216,7 +216,7 @@ class AchievementsScreen:
             t.blit(gs, (bx - 4, by - 4))
 
         lbl_col = GOLD if count == total else TEXT_DIM
-        lbl = f_sm.render(f"{count} / {total}  {_t('ach_screen.unlocked')}", False, lbl_col)
+        lbl = glyph_text.render(f_sm, f"{count} / {total}  {_t('ach_screen.unlocked')}", lbl_col)
         t.blit(lbl, (cx - lbl.get_width() // 2, by + bar_h + 5))
         pygame.draw.line(t, PURPLE_DIM, (40, _TOP_Y - 6), (WIDTH - 40, _TOP_Y - 6), 1)
 
@@ -277,8 +277,7 @@ class AchievementsScreen:
             if p > 0.6:
                 f_sm    = get_fonts()["small"]
                 hint_a  = int(200 * ((p - 0.6) / 0.4))
-                hint    = f_sm.render(_t("ach_screen.click_close"), False, (80, 55, 110))
-                hint.set_alpha(hint_a)
+                hint    = glyph_text.render(f_sm, _t("ach_screen.click_close"), (80, 55, 110), hint_a)
                 t.blit(hint, (WIDTH // 2 - hint.get_width() // 2, cy + ch + 14))
 
     def _draw_card(self, t, x, y, w, h, ach, unlocked, idx,
@@ -310,9 +309,7 @@ class AchievementsScreen:
 
         sym   = "?" if not unlocked else ("★" if ach.tier == PLATINUM else "◆")
         sym_c = tier_col if unlocked else PURPLE_DIM
-        sym_s = f_name.render(sym, False, sym_c)
-        if alpha < 255:
-            sym_s.set_alpha(alpha)
+        sym_s = glyph_text.render(f_name, sym, sym_c, alpha)
         t.blit(sym_s, (x + icon_w // 2 - sym_s.get_width() // 2,
                         y + h // 2 - sym_s.get_height() // 2))
 
@@ -323,14 +320,16 @@ class AchievementsScreen:
 
         # Name
         name_col = (GOLD if ach.tier == PLATINUM else TEXT_MAIN) if unlocked else TEXT_DIM
-        name_s   = f_name.render(ach.name.upper(), False, name_col)
+        name_s   = glyph_text.render(f_name, ach.name.upper(), name_col)
         if name_s.get_width() > max_w:
             scale  = max_w / name_s.get_width()
             name_s = name_s.convert_alpha()
             name_s = pygame.transform.smoothscale(
                 name_s, (max_w, max(1, int(name_s.get_height() * scale))))
-        if alpha < 255:
-            name_s.set_alpha(alpha)
+            if alpha < 255:
+                name_s.set_alpha(alpha)
+        elif alpha < 255:
+            name_s = glyph_text.render(f_name, ach.name.upper(), name_col, alpha)
         t.blit(name_s, (tx, ty))
 
         # Description — word-wrap when focused, single truncated line otherwise
@@ -355,28 +354,23 @@ class AchievementsScreen:
 
             desc_y = ty + name_s.get_height() + 10
             for ln in lines:
-                ln_s = f_desc.render(ln, False, desc_col)
                 ln_a = int(alpha * ((focused_p - 0.5) / 0.5))
-                ln_s.set_alpha(ln_a)
+                ln_s = glyph_text.render(f_desc, ln, desc_col, ln_a)
                 t.blit(ln_s, (tx, desc_y))
                 desc_y += ln_s.get_height() + 4
         else:
             # Single truncated line
-            desc_s = f_desc.render(desc_text, False, desc_col)
-            if desc_s.get_width() > max_w:
+            if glyph_text.atlas(f_desc, desc_col).size(desc_text)[0] > max_w:
                 d = desc_text
-                while d and f_desc.render(d + "...", False, desc_col).get_width() > max_w:
+                while d and glyph_text.atlas(f_desc, desc_col).size(d + "...")[0] > max_w:
                     d = d[:-1]
-                desc_s = f_desc.render(d + "...", False, desc_col)
-            if alpha < 255:
-                desc_s.set_alpha(alpha)
+                desc_text = d + "..."
+            desc_s = glyph_text.render(f_desc, desc_text, desc_col, alpha)
             t.blit(desc_s, (tx, ty + name_s.get_height() + 6))
 
         # Tier label (bottom right)
-        tier_lbl = f_desc.render(_tier_label(ach.tier), False,
-                                  tier_col if unlocked else PURPLE_DIM)
-        if alpha < 255:
-            tier_lbl.set_alpha(alpha)
+        tier_lbl = glyph_text.render(f_desc, _tier_label(ach.tier),
+                                     tier_col if unlocked else PURPLE_DIM, alpha)
         t.blit(tier_lbl, (x + w - tier_lbl.get_width() - 10,
                            y + h - tier_lbl.get_height() - 8))
 
@@ -395,6 +389,6 @@ class AchievementsScreen:
                           self._back_rect, border_radius=BTN_RADIUS)
         pygame.draw.rect(t, NEON if hov else PURPLE,
                           self._back_rect, width=1, border_radius=BTN_RADIUS)
-        lbl = f.render(_t("ach_screen.back"), False, TEXT_MAIN)
+        lbl = glyph_text.render(f, _t("ach_screen.back"), TEXT_MAIN)
         t.blit(lbl, (self._back_rect.centerx - lbl.get_width() // 2,
                       self._back_rect.centery - lbl.get_height() // 2))
\ No newline at end of file
@@ -6,7 +6,7 @@ import pygame
 
 os.environ.setdefault('SDL_VIDEO_WINDOW_POS', '100,100')
 
-from .constants import WIDTH, HEIGHT, FPS, TITLE
+from .constants import WIDTH, HEIGHT, FPS, TITLE, CARD_W, CARD_H
 from .menu import MainMenu
 from .play_select import PlaySelectScreen
 from .settings_screen import SettingsScreen
@@ -14,7 +14,8 @@ from .pause_screen import PauseScreen
 from .tutorial_screen import TutorialScreen
 from .achievements_screen import AchievementsScreen
 from .transition import ZoomTransition, CardSweepTransition
-from . import audio
+from .preload import Preloader
+from . import assets, audio, card_cache, transition as transitions
 
 _MUFFLED_SCREENS = {"play_select", "pause", "settings", "game_settings"}
 
@@ -53,18 +54,33 @@ def run() -> None:
     screen.fill((12, 8, 20))
     pygame.display.flip()
 
-    audio.init()
+    # Sounds, card images and the big procedural surfaces load in the
+    # background while the menu intro plays; music starts once it is in and
+    # the vignette is filled in place when it is drawn.
+    audio.init_mixer()
     audio.play_music("main_menu")
+    preloader = Preloader()
+    vignette  = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    preloader.submit(audio.load_sounds)
+    preloader.submit(_make_vignette, on_done=lambda surf: vignette.blit(
+        surf, (0, 0), special_flags=pygame.BLEND_RGBA_ADD))
+    preloader.submit(transitions._make_card_back_surf, on_done=lambda surf: card_cache.get(
+        'back', surf.get_size(), "sweep", lambda: surf))
+    preloader.submit(assets.preload, (CARD_W, CARD_H))
+
+    def _quit() -> None:
+        preloader.shutdown()
+        pygame.quit()
+        sys.exit()
 
     fonts       = _load_fonts()
-    vignette    = _make_vignette()
     current     = "menu"
     prev_menu   = "menu"
     pending     = None
     menu        = MainMenu(screen, fonts, vignette)
     play_select = PlaySelectScreen(screen, fonts, vignette)
     settings    = SettingsScreen(screen, fonts, vignette)
-    tutorial    = TutorialScreen(screen, fonts, vignette)
+    tutorial    = None          # built on first visit, after the card images are in
     achievements = AchievementsScreen(screen, fonts, vignette)
     pause       = PauseScreen(fonts)
 
@@ -81,7 +97,6 @@ def run() -> None:
         "menu":         menu,
         "play_select":  play_select,
         "settings":     settings,
-        "tutorial":     tutorial,
         "achievements": achievements,
     }
 
@@ -127,6 +142,8 @@ def run() -> None:
             audio.play_music("main_menu")
             achievements.refresh()
             nonlocal game_screen
+            if game_screen:
+                game_screen.close()
             game_screen = None
         audio.play("transition_change")
         card_sweep.start(on_switch=_on_switch)
@@ -140,8 +157,7 @@ def run() -> None:
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                _quit()
 
             if transition.busy or card_sweep.busy:
                 continue
@@ -149,12 +165,13 @@ def run() -> None:
             if current == "menu":
                 action, rect = menu.handle_event_with_rect(event)
                 if action == "quit":
-                    pygame.quit()
-                    sys.exit()
+                    _quit()
                 elif action == "play" and rect:
                     zoom_to("play_select", rect, direction=1)
                 elif action == "tutorial" and rect:
-                    # Fresh tutorial each time
+                    # Fresh tutorial each time (card images are shared, not reloaded)
+                    if tutorial:
+                        tutorial.close()
                     tutorial = TutorialScreen(screen, fonts, vignette)
                     screens["tutorial"] = tutorial
                     zoom_to("tutorial", rect, direction=1)
@@ -172,8 +189,7 @@ def run() -> None:
             elif current == "play_select":
                 action, rect = play_select.handle_event_with_rect(event)
                 if action == "quit":
-                    pygame.quit()
-                    sys.exit()
+                    _quit()
                 elif action == "back" and rect:
                     zoom_to("menu", rect, direction=-1)
                 elif action == "singleplayer":
@@ -219,8 +235,7 @@ def run() -> None:
             elif current == "game":
                 action = game_screen.handle_event(event)
                 if action == "quit":
-                    pygame.quit()
-                    sys.exit()
+                    _quit()
                 elif action == "back":
                     sweep_to_menu()
                 elif action == "pause":
@@ -241,6 +256,7 @@ def run() -> None:
             elif current == "game_settings":
                 settings.handle_event(event)
 
+        preloader.poll()
         audio.update()
 
         if not transition.busy and not card_sweep.busy:
@@ -0,0 +1,288 @@
+"""
+assets.py — Card images, loaded once per session and shared by every screen.
+
+acquire() hands out a CardImages handle onto one process-wide set of card
+surfaces: the PNGs in assets/cards are read and convert_alpha()'d the first
+time any screen looks a card up through one, and every later GameScreen or
+TutorialScreen reuses them. Pass size= to get a set pre-scaled once to that
+size instead.
+
+Handles are counted. A screen release()s its handle when it goes away;
+unload() frees the surfaces only when no handle is live (before the display
+is torn down, say), so a screen can never lose its images mid-draw.
+
+atlas() packs the 36 faces and the back into one surface at a given card
+size and saves it in the user's cache directory, so later runs open one
+image instead of 37 (the PNGs are only read again when one is newer than
+the atlas, or for a screen that wants another size). Screens blit
+sub-rectangles of it, in Surface.blits() batches where they draw many cards
+at once. Run this module to build the atlas ahead of time.
+
+preload() does the disk reads and PNG decoding on a background thread
+(no display calls), leaving only convert_alpha() for the main thread.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pygame
+
+from ..core.card import RANKS_32
+
+CARD_DIR = os.path.join(os.path.dirname(__file__), 'assets', 'cards')
+
+
+def _cache_dir() -> str:
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(r'~\AppData\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'fools-hand')
+
+
+CACHE_DIR = _cache_dir()     # built atlases; never inside the package
+
+_SUITS = {'♥': 'hearts', '♦': 'diamonds', '♠': 'spades', '♣': 'clubs'}
+# only the ranks a 36-card deck uses; the 2–5 PNGs are never drawn
+_RANKS = {r: {'A': 'ace', 'J': 'jack', 'Q': 'queen', 'K': 'king'}.get(r, r) for r in RANKS_32}
+
+Size = Optional[Tuple[int, int]]
+
+_images: Dict[Size, Dict[str, pygame.Surface]] = {}   # None → full size
+_refs = 0
+_decoded: Dict[str, pygame.Surface] = {}   # path → decoded by preload(), not converted yet
+_converted: Set[str] = set()               # paths _image() has handed out since unload()
+_decode_lock = threading.Lock()            # preload() runs on a worker thread
+
+
+class CardImages:
+    """A live handle on the shared card images, keyed like "10♥" and
+    "back". Reads like the dicts the screens used to load for themselves.
+    Nothing is read until the first lookup, so a screen that draws from
+    the atlas never opens the PNGs."""
+
+    def __init__(self, size: Size) -> None:
+        self._size   = size
+        self._images: Optional[Dict[str, pygame.Surface]] = None
+        self._live   = True
+
+    @property
+    def images(self) -> Dict[str, pygame.Surface]:
+        if self._images is None:
+            self._images = _images_at(self._size)
+        return self._images
+
+    def get(self, key: str, default=None):
+        return self.images.get(key, default)
+
+    def __getitem__(self, key: str) -> pygame.Surface:
+        return self.images[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.images
+
+    def __len__(self) -> int:
+        return len(self.images)
+
+    def release(self) -> None:
+        """Give the handle back; safe to call more than once."""
+        global _refs
+        if self._live:
+            self._live = False
+            _refs -= 1
+
+    def __enter__(self) -> CardImages:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def _image(path: str) -> pygame.Surface:
+    """A display-format image, decoded by preload() if it got there first.
+    Once a path is converted preload() leaves it alone, so no decoded copy
+    outlives the conversion."""
+    with _decode_lock:
+        surf = _decoded.pop(path, None)
+        _converted.add(path)
+    if surf is None:
+        surf = pygame.image.load(path)
+    return surf.convert_alpha()
+
+
+def _load() -> Dict[str, pygame.Surface]:
+    images = {}
+    try:
+        for suit_sym, suit_name in _SUITS.items():
+            for rank_sym, rank_name in _RANKS.items():
+                path = os.path.join(CARD_DIR, f'{rank_name}_of_{suit_name}.png')
+                if os.path.exists(path):
+                    images[f'{rank_sym}{suit_sym}'] = _image(path)
+        back_path = os.path.join(CARD_DIR, 'back.png')
+        if os.path.exists(back_path):
+            images['back'] = _image(back_path)
+    except Exception as e:
+        print(f'[warn] card image load failed: {e}')
+    return images
+
+
+def _images_at(size: Size) -> Dict[str, pygame.Surface]:
+    images = _images.get(size)
+    if images is None:
+        if None not in _images:
+            _images[None] = _load()
+        if size is not None:
+            _images[size] = {k: pygame.transform.smoothscale(s, size)
+                             for k, s in _images[None].items()}
+        images = _images[size]
+    return images
+
+
+def acquire(size: Size = None) -> CardImages:
+    """A handle on the card images, which are loaded the first time any
+    handle is used. With size, every image comes pre-scaled to (w, h)."""
+    global _refs
+    _refs += 1
+    return CardImages(size)
+
+
+def live_handles() -> int:
+    return _refs
+
+
+def unload() -> bool:
+    """Free every loaded image if no handle is live. Returns whether it did."""
+    if _refs:
+        return False
+    _images.clear()
+    _atlases.clear()
+    with _decode_lock:
+        _decoded.clear()
+        _converted.clear()
+    return True
+
+
+# ── atlas ─────────────────────────────────────────────────────────────────────
+
+# atlas layout: one row per suit (ranks in deck order), the back at the end
+# of the first row
+_KEYS  = [[f'{r}{s}' for r in RANKS_32] for s in _SUITS]
+_KEYS[0].append('back')
+_COLS  = len(RANKS_32) + 1
+
+_atlases: Dict[Tuple[int, int], Optional[CardAtlas]] = {}
+
+
+class CardAtlas:
+    """Every card at one size, packed into a single surface."""
+
+    def __init__(self, surface: pygame.Surface, size: Tuple[int, int]) -> None:
+        w, h = size
+        self.surface = surface
+        self.size    = size
+        self.rects   = {key: pygame.Rect(col * w, row * h, w, h)
+                        for row, keys in enumerate(_KEYS) for col, key in enumerate(keys)}
+        self._subs: Dict[str, pygame.Surface] = {}
+
+    def get(self, key: str) -> Optional[pygame.Surface]:
+        """The card as a subsurface (shares pixels with the atlas; copy to
+        alter), or None for an unknown key."""
+        sub = self._subs.get(key)
+        if sub is None:
+            rect = self.rects.get(key)
+            if rect is None:
+                return None
+            sub = self._subs[key] = self.surface.subsurface(rect)
+        return sub
+
+    def blits(self, target: pygame.Surface, cards: Iterable[Tuple[str, Tuple[int, int]]]) -> None:
+        """Draw many (key, position) cards in one Surface.blits() call."""
+        src, rects = self.surface, self.rects
+        target.blits([(src, pos, rects[key]) for key, pos in cards], doreturn=False)
+
+
+def _atlas_path(size: Tuple[int, int]) -> str:
+    return os.path.join(CACHE_DIR, f'atlas_{size[0]}x{size[1]}.png')
+
+
+def _sources() -> List[str]:
+    names = [f'{_RANKS[k[:-1]]}_of_{_SUITS[k[-1]]}.png' for keys in _KEYS for k in keys if k != 'back']
+    return [os.path.join(CARD_DIR, n) for n in names + ['back.png']]
+
+
+def build_atlas(size: Tuple[int, int]) -> Optional[pygame.Surface]:
+    """Pack the card PNGs, scaled to size, into one surface and try to save
+    it. None if any card image is missing."""
+    if not all(os.path.exists(p) for p in _sources()):
+        return None
+    w, h = size
+    with acquire(size) as images:
+        surf = pygame.Surface((_COLS * w, len(_KEYS) * h), pygame.SRCALPHA)
+        surf.blits([(images[key], (col * w, row * h))
+                    for row, keys in enumerate(_KEYS) for col, key in enumerate(keys)],
+                   doreturn=False)
+    _images.pop(size, None)         # the atlas replaces the pre-scaled set
+    _images.pop(None, None)         # and the full-size set, unless a handle reloads it
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        pygame.image.save(surf, _atlas_path(size))
+    except Exception as e:          # no writable cache: rebuild next run
+        print(f'[warn] could not save card atlas: {e}')
+    return surf
+
+
+def _atlas_fresh(size: Tuple[int, int]) -> bool:
+    """A saved atlas exists and is newer than every card PNG."""
+    path = _atlas_path(size)
+    try:
+        return os.path.exists(path) and os.path.getmtime(path) >= max(
+            os.path.getmtime(p) for p in _sources())
+    except OSError:
+        return False
+
+
+def atlas(size: Tuple[int, int]) -> Optional[CardAtlas]:
+    """The card atlas at size, loaded from disk when the saved one is newer
+    than every card PNG, built otherwise. None when images are missing."""
+    if size in _atlases:
+        return _atlases[size]
+    surf = None
+    try:
+        if _atlas_fresh(size):
+            surf = _image(_atlas_path(size))
+    except Exception as e:
+        print(f'[warn] card atlas load failed: {e}')
+    if surf is None:
+        surf = build_atlas(size)
+    _atlases[size] = CardAtlas(surf, size) if surf is not None else None
+    return _atlases[size]
+
+
+def preload(size: Optional[Tuple[int, int]] = None) -> None:
+    """Read and decode what the first screen will open, without touching the
+    display, so it can run on a worker thread: the saved atlas at size if it
+    is fresh, the card PNGs otherwise (to build it, or for size None)."""
+    paths = [_atlas_path(size)] if size is not None and _atlas_fresh(size) else _sources()
+    for path in paths:
+        if path in _decoded or path in _converted or not os.path.exists(path):
+            continue
+        try:
+            surf = pygame.image.load(path)
+        except Exception as e:
+            print(f'[warn] card image preload failed: {e}')
+            continue
+        with _decode_lock:          # the main thread may have loaded it meanwhile
+            if path not in _converted:
+                _decoded[path] = surf
+
+
+if __name__ == "__main__":
+    from .constants import CARD_W, CARD_H
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    print('built' if build_atlas((CARD_W, CARD_H)) is not None else 'card images missing')
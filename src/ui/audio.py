@@ -44,29 +44,44 @@ _normal_vol     = MUSIC_VOL
 _muffled_vol    = 0.0
 _sfx_enabled    = True
 _music_enabled  = True
+_loaded         = False       # load_sounds() has finished
+_pending_key   : str | None = None   # play_music() asked before the sounds were in
 
 
 def init() -> None:
-    """Call once after pygame.init()."""
+    """Call once after pygame.init(). Opens the mixer and loads every sound."""
+    init_mixer()
+    load_sounds()
+
+
+def init_mixer() -> None:
+    """Open the mixer (quick). Sounds come from load_sounds(); until then
+    play() is silent and play_music() waits for them."""
     pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
     pygame.mixer.set_num_channels(16)
     pygame.mixer.set_reserved(2)
 
+
+def load_sounds() -> None:
+    """Decode every WAV. Safe to run on a worker thread after init_mixer();
+    the tables are filled in at the end."""
+    global _loaded
+    sounds, normal, muffled = {}, {}, {}
     for key, filename in _SFX_FILES.items():
         path = os.path.join(_SOUNDS_DIR, filename)
         if os.path.exists(path):
             try:
                 snd = pygame.mixer.Sound(path)
                 snd.set_volume(SFX_VOL)
-                _sounds[key] = snd
+                sounds[key] = snd
             except Exception as e:
                 print(f"[audio] failed to load sfx '{key}': {e}")
         else:
             print(f"[audio] sfx not found: {path}")
 
     for key, (normal_f, muffled_f) in _MUSIC_FILES.items():
-        for store, filename in [(_music_normal, normal_f),
-                                 (_music_muffled, muffled_f)]:
+        for store, filename in [(normal, normal_f),
+                                 (muffled, muffled_f)]:
             path = os.path.join(_SOUNDS_DIR, filename)
             if os.path.exists(path):
                 try:
@@ -76,6 +91,11 @@ def init() -> None:
             else:
                 print(f"[audio] music not found: {path}")
 
+    _sounds.update(sounds)
+    _music_normal.update(normal)
+    _music_muffled.update(muffled)
+    _loaded = True
+
 
 def play(key: str) -> None:
     if not _sfx_enabled:
@@ -87,7 +107,10 @@ def play(key: str) -> None:
 
 def play_music(key: str) -> None:
     """Switch to a music track. Both normal+muffled play; volumes controlled via channels."""
-    global _current_key, _normal_vol, _muffled_vol
+    global _current_key, _normal_vol, _muffled_vol, _pending_key
+    if not _loaded:
+        _pending_key = key
+        return
     if key == _current_key or not _music_enabled:
         return
 
@@ -121,8 +144,12 @@ def set_muffled(state: bool) -> None:
 
 
 def update() -> None:
-    """Call every frame to tick the volume crossfade."""
-    global _normal_vol, _muffled_vol
+    """Call every frame to tick the volume crossfade (and start music that
+    was asked for while sounds were still loading)."""
+    global _normal_vol, _muffled_vol, _pending_key
+    if _loaded and _pending_key is not None:
+        key, _pending_key = _pending_key, None
+        play_music(key)
     if not _music_enabled or _current_key is None:
         return
 
@@ -0,0 +1,46 @@
+"""
+card_cache.py — Scaled card surfaces shared by every screen.
+
+Scaling a full-size card PNG is the most expensive thing a frame does, and
+the same few sizes are asked for over and over (every card in every hand,
+every frame). get() scales once per (card, size, variant) and keeps the
+result, least recently used first out, so GameScreen, TutorialScreen and
+the transitions all draw from one pool.
+
+Returned surfaces are shared: copy() before set_alpha, blit onto or
+otherwise changing them.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+import pygame
+
+# key: card string ("10♥", "back", ...), (w, h), variant (how it was made,
+# e.g. "scale" or "smooth")
+CacheKey = Tuple[str, Tuple[int, int], str]
+
+MAX_ENTRIES = 256
+
+_cache: "OrderedDict[CacheKey, pygame.Surface]" = OrderedDict()
+
+
+def get(card: str, size: Tuple[int, int], variant: str,
+        make: Callable[[], pygame.Surface]) -> pygame.Surface:
+    """The cached surface for (card, size, variant), built with make() on
+    a miss."""
+    key  = (card, (int(size[0]), int(size[1])), variant)
+    surf = _cache.get(key)
+    if surf is not None:
+        _cache.move_to_end(key)
+        return surf
+    surf = _cache[key] = make()
+    if len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return surf
+
+
+def invalidate_cache() -> None:
+    """Drop everything (after reloading card images or a display change)."""
+    _cache.clear()
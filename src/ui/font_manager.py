@@ -9,6 +9,7 @@ only so that invalidate_cache() after a language change triggers a fresh load
 from __future__ import annotations
 
 import pygame
+from . import glyph_text
 from .constants import FONT_PATH
 from .locale import get_lang
 
@@ -42,4 +43,5 @@ def get_fonts() -> dict:
 
 def invalidate_cache() -> None:
     """Call after language change so next get_fonts() reloads."""
-    _cache.clear()
\ No newline at end of file
+    _cache.clear()
+    glyph_text.invalidate_cache()
\ No newline at end of file
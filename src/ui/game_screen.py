@@ -2,10 +2,21 @@ from __future__ import annotations
 
 import math
 import random
+from concurrent.futures import ThreadPoolExecutor
 import pygame
-from ..core.game import _ai_choose_attack, _ai_choose_defence, _ai_should_stop_attacking
+from ..core.actions import (
+    ATTACK, DEFEND, TRANSFER, PASS, TAKE, ATTACKING, DEFENDING, TAKING,
+    can_add_attack, encode, next_defender,
+)
+from ..core.endgame import EndgamePolicy, is_endgame
 from ..core.move_validator import MoveValidator
-from . import audio
+from ..core.record import GameRecorder, restore_snapshot, take_snapshot
+from ..core.state_machine import (
+    GameStateMachine, GameEvent,
+    EV_ROUND_START, EV_ATTACK, EV_DEFEND, EV_TRANSFER, EV_TAKE, EV_PASS,
+    EV_PICKUP, EV_DISCARD, EV_DRAW, EV_GAME_OVER, EV_DEAL,
+)
+from . import assets, audio, card_cache, glyph_text
 from .constants import (
     WIDTH, HEIGHT,
     BG, NEON, NEON_GLOW, NEON_DARK, PURPLE, PURPLE_DIM,
@@ -159,6 +170,7 @@ class GameScreen:
         self._invalid_tick = 0
         self._bot_timer    = 0
         self._bot_action   = None
+        self._bot_future   = None   # endgame solve running on _bot_pool
         self._round_timer  = 0
         self._attack_commit_timer = 0   # ticks after last attack card lands before defence begins
 
@@ -169,7 +181,6 @@ class GameScreen:
         self._vis_table_total: int    = 0        # layout total to use during slide animations
         self._sorting_hand: bool      = False    # suppress hand draw during sort animation
         self._transfer_badge_rects: dict = {}    # card id → badge Rect above card
-        self._pending_defender_took: bool = False  # set when defender chose to take; attacker may still pile on
 
         # ── pre-built cached surfaces (expensive to recreate every frame) ────
         self._time            = 0.0
@@ -183,14 +194,43 @@ class GameScreen:
         # hand spread animation: card_id → [progress 0→1, old_total]
         # when a card lands in hand, existing cards animate from old positions to new
         self._hand_spread: dict = {}
-        self._round_had_transfer: bool = False   # skip bot pile-on window if transfer occurred
+
+        # ── rules ─────────────────────────────────────────────────────────────
+        # GameStateMachine owns the rules and the Game; its events are queued
+        # here and animated one after another (_pump_events). Core state runs
+        # ahead of the animation, so drawing uses the visual hands below.
+        self._machine = GameStateMachine(game, transfer_mode=transfer_mode)
+        self._events: list[GameEvent] = []
+        self._machine.add_listener(self._events.append)
+        self._handlers = {
+            EV_ROUND_START: self._on_round_start,
+            EV_ATTACK:      self._on_attack,
+            EV_DEFEND:      self._on_defend,
+            EV_TRANSFER:    self._on_transfer,
+            EV_TAKE:        self._on_quiet_event,
+            EV_PASS:        self._on_quiet_event,
+            EV_PICKUP:      self._on_pickup,
+            EV_DISCARD:     self._on_discard,
+            EV_DRAW:        self._on_draw,
+            EV_GAME_OVER:   self._on_game_over,
+        }
+        self._bot            = EndgamePolicy(max_nodes=50_000)   # exact once the deck runs out
+        # the exact solver can take most of a second, so it runs off the UI
+        # thread while the bot is shown thinking (see _advance)
+        self._bot_pool       = ThreadPoolExecutor(max_workers=1, thread_name_prefix="endgame")
+        self._vis_hand: list = list(game.players[0].hand)   # player hand as shown
+        self._vis_bot_count  = len(game.players[1].hand)
+        self._next_msg       = ""    # status message for the next decision
+        self._round_attacks  = 0     # attacks on the table when the last round ended
+        self.record          = None  # GameRecord of this game, once dealt
 
         # status fade
         self._status_label = ""
         self._status_alpha = 0
         self._status_fade  = 0
 
-        self._cards = self._load_card_images()
+        self._cards = assets.acquire()   # shared; released in close()
+        self._atlas = assets.atlas((CARD_W, CARD_H))   # None if images are missing
 
         # ── achievement system ────────────────────────────────────────────────
         self._ach_tracker = AchievementTracker()
@@ -239,7 +279,9 @@ class GameScreen:
         if all(len(p.hand) == 0 for p in self.game.players):
             self._begin_initial_deal()
         else:
-            self._start_round()
+            self.record = GameRecorder(self._machine).record
+            self._machine.start()
+            self._pump_events()
 
     # ── position helpers ─────────────────────────────────────────────────────
 
@@ -304,18 +346,14 @@ class GameScreen:
         y       = 20 + CARD_H // 2
         return (x, y)
 
-    def _animate_sort_player_hand(self, g, callback):
+    def _animate_sort_player_hand(self, callback):
         """Slide player hand cards to their sorted positions, then call callback."""
-        player = g.players[0]
-        trump  = g.deck.trump
-        old_hand = list(player.hand)
+        trump    = self.game.deck.trump
+        old_hand = list(self._vis_hand)
         sorted_hand = sorted(old_hand, key=lambda c: c.sort_key(trump))
 
         # Check if sort actually changes anything
         if old_hand == sorted_hand:
-            player.sort_hand(trump)
-            for p in g.players[1:]:
-                p.sort_hand(trump)
             self._animating = False
             callback()
             return
@@ -339,13 +377,10 @@ class GameScreen:
             pending[0] += 1
             surf = self._get_card_surf(card, (CARD_W, CARD_H))
 
-            def on_done(pending=pending, g=g, sorted_hand=sorted_hand,
-                        trump=trump, callback=callback):
+            def on_done(pending=pending, sorted_hand=sorted_hand, callback=callback):
                 pending[0] -= 1
                 if pending[0] <= 0:
-                    player.hand[:] = sorted_hand
-                    for p in g.players[1:]:
-                        p.sort_hand(trump)
+                    self._vis_hand[:]  = sorted_hand
                     self._sorting_hand = False
                     self._animating    = False
                     callback()
@@ -356,78 +391,61 @@ class GameScreen:
 
         if pending[0] == 0:
             # All cards were already in place
-            player.hand[:] = sorted_hand
-            for p in g.players[1:]:
-                p.sort_hand(trump)
+            self._vis_hand[:]  = sorted_hand
             self._sorting_hand = False
             self._animating    = False
             callback()
 
     def _begin_initial_deal(self):
         """Shuffle-while-dealing intro. Requires Game.setup_no_deal()."""
-        g = self.game
-
         self._set(S_DEALING, "")
         self._animating    = True
         self._shuffling    = True
         self._shuffle_tick = 0
 
-        # Build the deal order (player indices only — cards stay in deck until each flies)
-        self._deal_queue = []
-        players = list(range(len(g.players)))
-        for _ in range(3):
-            for p_idx in players:
-                for _ in range(2):
-                    if g.deck.remaining() > 1:   # leave the trump card (bottom) in deck
-                        self._deal_queue.append(p_idx)
-
+        # The machine deals (and picks the first attacker) at once; the DEAL
+        # events it queued give the order the cards fly in.
+        self._machine.deal()
+        self.record = GameRecorder(self._machine).record
+        self._deal_queue = [(ev.seat, ev.card) for ev in self._events if ev.kind == EV_DEAL]
+        self._events.clear()
         self._deal_i = 0
         self._deal_fly_next()
 
+    def _after_deal(self):
+        g = self.game
+        self._animating = True
+        self._animate_sort_player_hand(callback=lambda: (
+            self._ach_tracker.on_game_start(self._vis_hand, g.deck.trump),
+            self._begin_trump_reveal()
+        ))
+
     def _deal_fly_next(self):
         """Launch all remaining deal cards with staggered overlapping starts."""
-        g     = self.game
-        trump = g.deck.trump
-
         if self._deal_i >= len(self._deal_queue):
-            g._assign_first_attacker()
-            self._animating = True
-            self._animate_sort_player_hand(g, callback=lambda: (
-                self._ach_tracker.on_game_start(g.players[0].hand, g.deck.trump),
-                self._begin_trump_reveal()
-            ))
+            self._after_deal()
             return
 
         # Launch all remaining cards with a stagger delay so they overlap in flight.
-        # Each card "pre-draws" from deck and targets its final sorted slot.
-        # on_land callbacks insert them in-order so hand state is always consistent.
+        # on_land callbacks add them to the visual hands in dealing order.
         STAGGER   = 0.16   # seconds between card launches
         DURATION  = 0.45   # seconds per card flight
 
         remaining_queue = self._deal_queue[self._deal_i:]
-        # Pre-draw all cards now (before any land) so targets can be computed
-        pre_drawn: list[tuple] = []   # (p_idx, card, slot_at_launch)
-        hand_sizes = {i: len(g.players[i].hand) for i in range(len(g.players))}
-        for p_idx in remaining_queue:
-            slot = hand_sizes[p_idx]
-            hand_sizes[p_idx] += 1
-            card = g.deck.draw()
-            pre_drawn.append((p_idx, card, slot))
-
         total_by_player = {}
-        for p_idx, _, _ in pre_drawn:
+        for p_idx, _ in remaining_queue:
             total_by_player[p_idx] = total_by_player.get(p_idx, 0) + 1
 
         # Track how many have been sent to each player so far for slot targeting
-        sent_counts: dict[int, int] = {i: len(g.players[i].hand) for i in range(len(g.players))}
+        shown = {0: len(self._vis_hand), 1: self._vis_bot_count}
+        sent_counts = dict(shown)
 
         completed = [0]
-        total_cards = len(pre_drawn)
+        total_cards = len(remaining_queue)
 
-        for launch_idx, (p_idx, card, _) in enumerate(pre_drawn):
-            player     = g.players[p_idx]
+        for launch_idx, (p_idx, card) in enumerate(remaining_queue):
             slot       = sent_counts[p_idx]
-            final_size = len(player.hand) + total_by_player[p_idx]
+            final_size = shown[p_idx] + total_by_player[p_idx]
             sent_counts[p_idx] += 1
 
             if p_idx == 0:
@@ -438,19 +456,17 @@ class GameScreen:
 
             delay = launch_idx * STAGGER   # seconds to wait before launching
 
-            def make_on_land(p=player, c=card):
+            def make_on_land(p=p_idx, c=card):
                 def on_land():
-                    p.hand.append(c)
+                    if p == 0:
+                        self._vis_hand.append(c)
+                    else:
+                        self._vis_bot_count += 1
                     completed[0] += 1
                     if completed[0] >= total_cards:
                         # All dealt — sort and reveal trump
                         self._deal_i = len(self._deal_queue)
-                        g._assign_first_attacker()
-                        self._animating = True
-                        self._animate_sort_player_hand(g, callback=lambda: (
-                            self._ach_tracker.on_game_start(g.players[0].hand, g.deck.trump),
-                            self._begin_trump_reveal()
-                        ))
+                        self._after_deal()
                 return on_land
 
             # Use a delayed FlyingCard so cards launch with stagger
@@ -545,7 +561,8 @@ class GameScreen:
         if self._role_tick >= total:
             self._role_reveal_active = False
             self._animating          = False
-            self._start_round()
+            self._machine.start()
+            self._pump_events()
 
     def _draw_role_reveal(self, t):
         if not self._role_reveal_active:
@@ -602,27 +619,26 @@ class GameScreen:
         title_f = get_fonts()["title"]
         role_f  = get_fonts()["title"]
 
-        you_surf = title_f.render(_t("game.you_are"), False, label_col)
-        you_surf.set_alpha(alpha)
+        you_surf = glyph_text.render(title_f, _t("game.you_are"), label_col, alpha)
 
         role_word = _t(f"game.{word}")
-        role_surf_base = role_f.render(role_word, False, word_col)
+        role_surf_base = glyph_text.render(role_f, role_word, word_col)
         if scale != 1.0:
             new_w = max(1, int(role_surf_base.get_width()  * scale))
             new_h = max(1, int(role_surf_base.get_height() * scale))
             role_surf = pygame.transform.scale(role_surf_base, (new_w, new_h))
         else:
-            role_surf = role_surf_base
+            role_surf = role_surf_base.copy()
         role_surf.set_alpha(alpha)
 
         # Neon glow behind role word
-        glow_surf_base = role_f.render(role_word, False, NEON_GLOW)
+        glow_surf_base = glyph_text.render(role_f, role_word, NEON_GLOW)
         if scale != 1.0:
             gw = max(1, int(glow_surf_base.get_width()  * scale))
             gh = max(1, int(glow_surf_base.get_height() * scale))
             glow_surf = pygame.transform.scale(glow_surf_base, (gw, gh))
         else:
-            glow_surf = glow_surf_base
+            glow_surf = glow_surf_base.copy()
         glow_surf.set_alpha(min(alpha, int(120 * (1 - max(0, tick - hold_end) / self._ROLE_FADE_TICKS))))
 
         gap    = 12
@@ -720,6 +736,8 @@ class GameScreen:
     # ── animation helpers ─────────────────────────────────────────────────────
 
     def _scaled(self, surf):
+        if surf.get_size() == (CARD_W, CARD_H):
+            return surf
         return pygame.transform.scale(surf, (CARD_W, CARD_H))
 
     def _fly_card(self, card_str, src, dst, duration=0.40,
@@ -819,28 +837,6 @@ class GameScreen:
 
     # ── round management ─────────────────────────────────────────────────────
 
-    def _start_round(self):
-        g = self.game
-        g.table.clear()
-        self._vis_table             = []
-        self._sliding_slots         = set()
-        self._vis_table_total       = 0
-        self._pending_defender_took = False
-        self._round_had_transfer    = False
-        self._animating = False
-        self._flying.clear()
-        self._stat_rounds += 1
-        trump = g.deck.trump
-        player_trump_count = sum(1 for c in g.players[0].hand if c.is_trump(trump))
-        bot_hand_size      = len(g.players[1].hand)
-        self._ach_tracker.on_round_start(
-            self._stat_rounds, bot_hand_size, player_trump_count)
-        if g.attacker_idx == 0:
-            self._set(S_HUMAN_ATTACK, "")
-        else:
-            self._set(S_BOT_THINKING, "")
-            self._queue_bot_attack(first=True)
-
     def _set(self, state, msg=""):
         self._state   = state
         self._message = msg
@@ -853,280 +849,98 @@ class GameScreen:
         if state == S_ROUND_OVER:
             self._round_timer = _ROUND_DELAY
 
-    def _queue_bot_attack(self, first=False):
-        g = self.game
-        trump    = g.deck.trump
-        attacker = g.players[g.attacker_idx]
-        defender = g.players[g.defender_idx]
-
-        def act():
-            # Hard cap: 6 cards total. Also cap at defender hand size on the
-            # very first attack so they always have a card to beat with.
-            max_attacks = min(6, len(defender.hand)) if first else 6
-            if len(g.table.pairs) >= max_attacks:
-                card = None
-            elif first:
-                card = _ai_choose_attack(attacker, g.table, trump)
-            else:
-                card = None if _ai_should_stop_attacking(attacker, g.table, defender, trump) \
-                           else _ai_choose_attack(attacker, g.table, trump)
+    def _act(self, action: int) -> None:
+        """Apply one action for whoever is to move and animate what follows."""
+        self._attack_commit_timer = 0
+        self._machine.apply(action)
+        self._pump_events()
+
+    def _pump_events(self):
+        """Animate the next queued machine event. Every handler calls back into
+        here once its cards have landed; with the queue empty, the next player
+        gets to decide."""
+        if self._events:
+            ev = self._events.pop(0)
+            self._handlers[ev.kind](ev)
+        else:
+            self._advance()
 
-            if card is None:
-                # bot passes — scatter what's on table
-                pairs = list(self._vis_table)
-                self._vis_table = []
-                if pairs:
-                    self._scatter_table(pairs, on_all_done=lambda: self._do_finish_round(False))
-                else:
-                    self._do_finish_round(False)
+    def _advance(self):
+        m = self._machine
+        if m.over:
+            return
+        g   = self.game
+        msg = self._next_msg
+        self._next_msg = ""
+
+        if m.to_move() == 0:
+            if m.phase == DEFENDING:
+                self._set(S_HUMAN_DEFEND, msg)
+            elif m.phase == TAKING:
+                self._set(S_PILE_ON_TAKING, msg)
             else:
-                pair_idx = len(g.table.pairs)
-                attacker.remove_card(card)
-                g.table.add_attack(card)
-                if g.attacker_idx != 0:
-                    self._ach_tracker.on_bot_attack()
-                src = self._bot_hand_centre()
-                total = len(g.table.pairs)
-                dst   = self._table_pos(pair_idx, total, False)
-                card_str = str(card)
-
-                # Slide existing table cards to their new positions
-                self._slide_table_to(total)
-
-                def on_land(cs=card_str, pi=pair_idx):
-                    while len(self._vis_table) <= pi:
-                        self._vis_table.append((None, None))
-                    atk_cur, dfn_cur = self._vis_table[pi]
-                    self._vis_table[pi] = (cs, dfn_cur)
-                    self._vis_table_total = len(self._vis_table)
-                    self._animating = False
-                    self._after_attack()
-                self._fly_card(card_str, src, dst, on_done=on_land)
+                self._set(S_HUMAN_ATTACK if g.table.defence_count() == 0 else S_PILE_ON, msg)
+                if not g.table.all_defended():
+                    # window to add more cards before the defender starts
+                    self._attack_commit_timer = _ATTACK_COMMIT_DELAY
+            return
 
+        if is_endgame(m):
+            # solve a copy of the game in the background; update() picks the
+            # move up, and the thinking delay runs meanwhile
+            copy = restore_snapshot(take_snapshot(m, 0), g.deck, seed=g.seed,
+                                    transfer_mode=m.transfer_mode)
+            self._set(S_BOT_THINKING, msg)
+            self._bot_timer  = _BOT_DELAY
+            self._bot_action = None
+            self._bot_future = self._bot_pool.submit(self._bot.choose, copy)
+            return
+        action = self._bot.choose(m)
+        if self._bot_passes_now(action):
+            self._act(action)
+            return
+        self._set(S_BOT_THINKING, msg)
         self._bot_timer  = _BOT_DELAY
-        self._bot_action = act
+        self._bot_action = lambda: self._act(action)
 
-    def _queue_bot_defence(self):
-        g     = self.game
-        trump = g.deck.trump
-        idx   = g.table.first_undefended_index()
-
-        def act():
-            attack_card = g.table.pairs[idx].attack
-            defender    = g.players[g.defender_idx]
-            validator   = MoveValidator(trump)
-
-            # In transfer mode, bot will transfer if it can and has no good defence
-            new_def_hand = g.players[g.attacker_idx].hand  # attacker becomes new defender
-            if self.transfer_mode and validator.can_transfer(attack_card, g.table,
-                                                             new_defender_hand=new_def_hand):
-                transfers = validator.valid_transfers(defender.hand, g.table,
-                                                      new_defender_hand=new_def_hand)
-                defence   = _ai_choose_defence(defender, attack_card, trump)
-                # Prefer transferring if defence would cost a trump or there's no defence
-                should_transfer = transfers and (
-                    defence is None or
-                    (defence.is_trump(trump) and not attack_card.is_trump(trump))
-                )
-                if should_transfer:
-                    card     = transfers[0]
-                    pair_idx = len(g.table.pairs)
-                    defender.remove_card(card)
-                    g.table.add_attack(card)
-                    # Swap roles
-                    g.attacker_idx, g.defender_idx = g.defender_idx, g.attacker_idx
-                    self._round_had_transfer = True
-                    total    = len(g.table.pairs)
-                    dst      = self._table_pos(pair_idx, total, False)
-                    card_str = str(card)
-                    self._slide_table_to(total)
-                    def on_land(cs=card_str, pi=pair_idx):
-                        while len(self._vis_table) <= pi:
-                            self._vis_table.append((None, None))
-                        _, dfn = self._vis_table[pi]
-                        self._vis_table[pi] = (cs, dfn)
-                        self._vis_table_total = len(self._vis_table)
-                        self._animating = False
-                        # Player now defends the transferred attack
-                        self._set(S_HUMAN_DEFEND, _t("game.transfer"))
-                    self._fly_card(card_str, self._bot_hand_centre(), dst, on_done=on_land)
-                    return
-
-            defence = _ai_choose_defence(defender, attack_card, trump)
-
-            if defence is None:
-                pairs = list(self._vis_table)
-                self._vis_table = []
-                taken = g.table.all_cards()
-                defender.hand.extend(taken)
-                defender.sort_hand(trump)
-                # Check if human attacker can pile on
-                attacker = g.players[g.attacker_idx]
-                can_pile = bool(validator.valid_attacks(attacker.hand, g.table))
-                if g.attacker_idx == 0 and can_pile:
-                    # Human can pile on — sweep cards to bot, then wait for human
-                    def after_sweep():
-                        self._animating = False
-                        self._pending_defender_took = True
-                        self._set(S_PILE_ON_TAKING, "")
-                    self._sweep_table(pairs, to_player=False, on_all_done=after_sweep)
-                else:
-                    def_is_player = (g.defender_idx == 0)
-                    g._advance_roles(defender_took=True)
-                    def after():
-                        self._animating = False
-                        self._do_finish_round(defender_took=True)
-                    self._sweep_table(pairs, to_player=def_is_player, on_all_done=after)
-            else:
-                pair_idx = idx
-                defender.remove_card(defence)
-                g.table.add_defence(idx, defence)
-                self._ach_tracker.on_bot_defend_success()
-                src = self._bot_hand_centre()
-                total = len(g.table.pairs)
-                dst   = self._table_pos(pair_idx, total, True)
-                card_str = str(defence)
-                def on_land(cs=card_str, pi=pair_idx):
-                    if pi < len(self._vis_table):
-                        atk_cur, _ = self._vis_table[pi]
-                        self._vis_table[pi] = (atk_cur, cs)
-                    self._animating = False
-                    self._after_attack()
-                self._fly_card(card_str, src, dst, on_done=on_land)
-
-        self._bot_timer  = _BOT_DELAY
-        self._bot_action = act
+    def _bot_passes_now(self, action):
+        """The bot hands its attack over to the defender straight away."""
+        return (self._machine.phase == ATTACKING and action == PASS
+                and not self.game.table.all_defended())
 
-    def _queue_bot_pile_on_taking(self):
-        """Bot (attacker) decides whether to add more cards while defender is taking."""
-        g     = self.game
-        trump = g.deck.trump
-        attacker = g.players[g.attacker_idx]
-        defender = g.players[g.defender_idx]
-
-        def act():
-            validator = MoveValidator(trump)
-            card = _ai_choose_attack(attacker, g.table, trump) \
-                   if validator.valid_attacks(attacker.hand, g.table) else None
-
-            if card is None:
-                self._end_pile_on_taking()
-            else:
-                pair_idx = len(g.table.pairs)
-                attacker.remove_card(card)
-                g.table.add_attack(card)
-                src      = self._bot_hand_centre()
-                total    = len(g.table.pairs)
-                dst      = self._table_pos(pair_idx, total, False)
-                card_str = str(card)
-                self._slide_table_to(total)
-                def on_land(cs=card_str, pi=pair_idx):
-                    while len(self._vis_table) <= pi:
-                        self._vis_table.append((None, None))
-                    atk_cur, dfn_cur = self._vis_table[pi]
-                    self._vis_table[pi] = (cs, dfn_cur)
-                    self._vis_table_total = len(self._vis_table)
-                    self._animating = False
-                    # Bot done piling on — end taking
-                    self._end_pile_on_taking()
-                self._fly_card(card_str, src, dst, on_done=on_land)
-
-        self._bot_timer  = _BOT_DELAY
-        self._bot_action = act
-
-    def _end_pile_on_taking(self):
-        """Finalise the round where defender chose to take."""
-        g = self.game
-        self._pending_defender_took = False
-        # Any NEW cards piled on after the defender clicked take must also go to them
-        # (original pile was already added to hand at pickup time)
-        defender = g.players[g.defender_idx]
-        extra = g.table.all_cards()
-        # Only add cards that aren't already in the defender's hand
-        # (original pile was added at click time; extras are subsequent pile-ons)
-        for c in extra:
-            if c not in defender.hand:
-                defender.hand.append(c)
-        defender.sort_hand(g.deck.trump)
-        pairs = list(self._vis_table)
-        self._vis_table = []
-        # Capture defender_idx BEFORE advancing roles
-        def_is_player = (g.defender_idx == 0)
-        g._advance_roles(defender_took=True)
-        if pairs:
-            def after():
-                self._animating = False
-                self._do_finish_round(defender_took=True)
-            self._sweep_table(pairs, to_player=def_is_player, on_all_done=after)
+    def _poll_bot(self):
+        """Take the endgame solver's move once it is ready."""
+        future = self._bot_future
+        if future is None or not future.done():
+            return
+        self._bot_future = None
+        action = future.result()
+        if self._bot_passes_now(action):
+            self._act(action)
         else:
-            self._do_finish_round(defender_took=True)
-
-    def _after_attack(self):
-        g         = self.game
-        trump     = g.deck.trump
-        validator = MoveValidator(trump)
-        taking    = self._pending_defender_took
+            self._bot_action = lambda: self._act(action)
 
-        if g.table.first_undefended_index() is not None:
-            if g.defender_idx == 0:
-                self._set(S_HUMAN_DEFEND, "")
-            else:
-                self._set(S_BOT_THINKING, "")
-                self._queue_bot_defence()
-        else:
-            if g.attacker_idx == 0:
-                # Stay in taking state if defender already chose to take
-                self._set(S_PILE_ON_TAKING if taking else S_PILE_ON, "")
-            else:
-                self._set(S_BOT_THINKING, "")
-                if taking:
-                    self._queue_bot_pile_on_taking()
-                else:
-                    self._queue_bot_attack(first=False)
-
-    def _finish_round(self, defender_took):
-        """Called from human actions."""
-        self._attack_commit_timer = 0   # cancel any pending commit window
-        pairs = list(self._vis_table)
-        self._vis_table = []
+    # ── machine event handlers ───────────────────────────────────────────────
 
-        if defender_took:
-            def after():
-                self._animating = False
-                self._do_finish_round(True)
-            self._sweep_table(pairs, to_player=True, on_all_done=after)
-        else:
-            if pairs:
-                def after():
-                    self._animating = False
-                    self._do_finish_round(False)
-                self._scatter_table(pairs, on_all_done=after)
-            else:
-                self._do_finish_round(False)
+    def _on_quiet_event(self, ev):
+        self._pump_events()
 
-    def _do_finish_round(self, defender_took):
-        g     = self.game
+    def _on_round_start(self, ev):
+        g = self.game
+        self._vis_table             = []
+        self._sliding_slots         = set()
+        self._vis_table_total       = 0
+        self._animating = False
+        self._flying.clear()
+        # every card has landed by now — resync the visual hands
+        self._vis_hand      = list(g.players[0].hand)
+        self._vis_bot_count = len(g.players[1].hand)
+        self._stat_rounds += 1
         trump = g.deck.trump
-        if not defender_took:
-            # Successful defence — pile discarded
-            self._ach_tracker.on_round_defended_successfully()
-            g._advance_roles(defender_took=False)
-
-        # ── tie detection: both hands empty simultaneously ─────────────────
-        both_empty = all(len(p.hand) == 0 for p in g.players)
-        if both_empty:
-            self._trigger_game_over(R_TIE)
-            return
-
-        loser = g._check_game_over()
-        if loser is not None:
-            result = R_WIN if loser != 0 else R_LOSS
-            # You Had One Job: how many attacks were on table when player lost
-            if result == R_LOSS:
-                atk_count = len([pr for pr in g.table.pairs])
-                self._ach_tracker.on_final_round_attack_count(atk_count)
-            self._trigger_game_over(result)
-            return
+        player_trump_count = sum(1 for c in g.players[0].hand if c.is_trump(trump))
+        bot_hand_size      = len(g.players[1].hand)
+        self._ach_tracker.on_round_start(
+            self._stat_rounds, bot_hand_size, player_trump_count)
 
         # Deck-empty check
         if g.deck.remaining() == 0 and not self._ach_tracker._deck_empty_fired:
@@ -1134,30 +948,137 @@ class GameScreen:
                           [c for c in g.players[1].hand if c.is_trump(trump)])
             self._ach_tracker.on_deck_empty(
                 g.players[0].hand, all_trumps, trump)
+        self._pump_events()
+
+    def _take_from_hand(self, seat, card):
+        """Remove card from a visual hand and return where it leaves from."""
+        if seat != 0:
+            self._vis_bot_count -= 1
+            return self._bot_hand_centre()
+        hand_idx = self._vis_hand.index(card)
+        src_rect = self._hand_rect(hand_idx, len(self._vis_hand))
+        self._vis_hand.remove(card)
+        return (src_rect.centerx, src_rect.centery)
+
+    def _land_on_table(self, card, src, pair_idx, is_defence=False):
+        """Fly card to its table slot, then carry on with the next event."""
+        card_str = str(card)
+        if is_defence:
+            dst = self._table_pos(pair_idx, len(self._vis_table), True)
+        else:
+            total = pair_idx + 1
+            dst   = self._table_pos(pair_idx, total, False)
+            # Slide existing table cards to their new positions
+            self._slide_table_to(total)
 
-        # Draw-up queue
-        order = ([g.attacker_idx]
-                 + [i for i in range(len(g.players))
-                    if i not in (g.attacker_idx, g.defender_idx)]
-                 + [g.defender_idx])
-        needs = {idx: max(0, 6 - len(g.players[idx].hand)) for idx in order}
-        draw_queue = []
-        given      = {idx: 0 for idx in order}
-        any_dealt  = True
-        while any_dealt and g.deck.remaining() > 0:
-            any_dealt = False
-            for idx in order:
-                if given[idx] < needs[idx] and g.deck.remaining() > 0:
-                    draw_queue.append((idx, g.deck.draw()))
-                    given[idx] += 1
-                    any_dealt   = True
-
-        if draw_queue:
-            self._state     = S_DRAWING
-            self._animating = True
-            self._draw_fly_next(draw_queue, 0)
+        def on_land(cs=card_str, pi=pair_idx):
+            while len(self._vis_table) <= pi:
+                self._vis_table.append((None, None))
+            atk_cur, dfn_cur = self._vis_table[pi]
+            self._vis_table[pi] = (atk_cur, cs) if is_defence else (cs, dfn_cur)
+            self._vis_table_total = len(self._vis_table)
+            self._animating = False
+            self._pump_events()
+        self._fly_card(card_str, src, dst, on_done=on_land)
+
+    def _on_attack(self, ev):
+        if ev.seat != 0:
+            self._ach_tracker.on_bot_attack()
+        self._land_on_table(ev.card, self._take_from_hand(ev.seat, ev.card), ev.slot)
+
+    def _on_defend(self, ev):
+        if ev.seat != 0:
+            self._ach_tracker.on_bot_defend_success()
+        self._land_on_table(ev.card, self._take_from_hand(ev.seat, ev.card), ev.slot,
+                            is_defence=True)
+
+    def _on_transfer(self, ev):
+        # the new defender sees why they are suddenly defending
+        self._next_msg = _t("game.transfer")
+        self._land_on_table(ev.card, self._take_from_hand(ev.seat, ev.card), ev.slot)
+
+    def _on_pickup(self, ev):
+        pairs = list(self._vis_table)
+        self._vis_table     = []
+        self._round_attacks = len(pairs)
+        to_player = ev.seat == 0
+
+        def after():
+            if to_player:
+                trump = self.game.deck.trump
+                self._vis_hand.extend(ev.cards)
+                self._vis_hand.sort(key=lambda c: c.sort_key(trump))
+            else:
+                self._vis_bot_count += len(ev.cards)
+            self._animating = False
+            self._pump_events()
+        self._sweep_table(pairs, to_player=to_player, on_all_done=after)
+
+    def _on_discard(self, ev):
+        pairs = list(self._vis_table)
+        self._vis_table     = []
+        self._round_attacks = len(pairs)
+        # Successful defence — pile discarded
+        self._ach_tracker.on_round_defended_successfully()
+        if ev.seat == 0:
+            self._stat_passes += 1
+
+        def after():
+            self._animating = False
+            self._pump_events()
+        self._scatter_table(pairs, on_all_done=after)
+
+    def _on_draw(self, ev):
+        """Fly one draw-up card to its final sorted position."""
+        self._state = S_DRAWING
+        p_idx, card = ev.seat, ev.card
+        src   = self._deck_centre()
+        trump = self.game.deck.trump
+
+        # Simulate the full final hand for this player after all queued draws land
+        future = [e.card for e in self._events if e.kind == EV_DRAW and e.seat == p_idx]
+        if p_idx == 0:
+            final_hand_sim = sorted(self._vis_hand + [card] + future,
+                                    key=lambda c: c.sort_key(trump))
+            rect     = self._hand_rect(final_hand_sim.index(card), len(final_hand_sim))
+            dst      = (rect.x + CARD_W // 2, rect.y + CARD_H // 2)
+            card_key = str(card)
         else:
-            self._start_round()
+            dst      = self._bot_card_centre(self._vis_bot_count,
+                                             self._vis_bot_count + 1 + len(future))
+            card_key = "back"
+
+        def on_land(c=card):
+            if p_idx == 0:
+                # Record old total before inserting so spread animation knows where cards were
+                old_total = len(self._vis_hand)
+                for existing_card in self._vis_hand:
+                    self._hand_spread[id(existing_card)] = [0.0, old_total]
+                self._vis_hand.append(c)
+                self._vis_hand.sort(key=lambda x: x.sort_key(trump))
+            else:
+                self._vis_bot_count += 1
+            self._pump_events()
+
+        self._fly_card(
+            card_key, src, dst,
+            duration=0.40,
+            src_angle=random.uniform(-6, 6),
+            dst_angle=0.0,
+            on_done=on_land,
+            sound="card_take",
+            arc=0.14,
+        )
+
+    def _on_game_over(self, ev):
+        if ev.seat < 0:
+            result = R_TIE
+        else:
+            result = R_WIN if ev.seat != 0 else R_LOSS
+        # You Had One Job: how many attacks were on table when player lost
+        if result == R_LOSS:
+            self._ach_tracker.on_final_round_attack_count(self._round_attacks)
+        self._trigger_game_over(result)
 
     def _trigger_game_over(self, result: str) -> None:
         g     = self.game
@@ -1194,61 +1115,6 @@ class GameScreen:
         self._set(S_GAME_OVER, msg)
         audio.stop_music()
 
-    def _draw_fly_next(self, queue, i):
-        """Fly one draw-up card to its final sorted position, recurse until done."""
-        if i >= len(queue):
-            # All cards landed and already in sorted order — no sort jump needed
-            self._animating = False
-            self._start_round()
-            return
-
-        p_idx, card = queue[i]
-        player      = self.game.players[p_idx]
-        src         = self._deck_centre()
-        trump       = self.game.deck.trump
-
-        # Simulate the full final hand for this player after all queue cards land
-        future_cards_for_player = [c for (pi, c) in queue[i:] if pi == p_idx]
-        final_hand_sim = sorted(
-            list(player.hand) + future_cards_for_player,
-            key=lambda c: c.sort_key(trump)
-        )
-        total_final = len(final_hand_sim)
-        sorted_idx  = final_hand_sim.index(card)
-
-        if p_idx == 0:
-            rect     = self._hand_rect(sorted_idx, total_final)
-            dst      = (rect.x + CARD_W // 2, rect.y + CARD_H // 2)
-            card_key = str(card)
-        else:
-            dst      = self._bot_card_centre(sorted_idx, total_final)
-            card_key = "back"
-
-        def on_land(p=player, c=card, t=trump, qi=i):
-            # Record old total before inserting so spread animation knows where cards were
-            old_total = len(p.hand)
-            future = [cc for (pi, cc) in queue[qi:] if pi == p_idx]
-            sim    = sorted(list(p.hand) + future, key=lambda x: x.sort_key(t))
-            idx    = sim.index(c)
-            p.hand.insert(idx, c)
-            # Start spread: each existing card animates from old_total layout → new layout
-            if p_idx == 0:
-                new_total = len(p.hand)
-                for existing_card in p.hand:
-                    if existing_card is not c:
-                        self._hand_spread[id(existing_card)] = [0.0, old_total]
-            self._draw_fly_next(queue, qi + 1)
-
-        self._fly_card(
-            card_key, src, dst,
-            duration=0.40,
-            src_angle=random.uniform(-6, 6),
-            dst_angle=0.0,
-            on_done=on_land,
-            sound="card_take",
-            arc=0.14,
-        )
-
     # ── events ────────────────────────────────────────────────────────────────
 
     def handle_event(self, event):
@@ -1292,14 +1158,16 @@ class GameScreen:
 
     def _on_confirm(self):
         g = self.game
-        if self._state in (S_HUMAN_ATTACK, S_PILE_ON):
+        if self._state in (S_HUMAN_ATTACK, S_PILE_ON, S_PILE_ON_TAKING):
             if g.table.is_empty():
                 return
-            self._stat_passes += 1
-            self._finish_round(defender_took=False)
-        elif self._state == S_PILE_ON_TAKING:
-            # Human attacker lets defender take without adding more
-            self._end_pile_on_taking()
+            self._act(PASS)
+
+    def _reject(self, card, message):
+        self._invalid_card = card
+        self._invalid_tick = 40
+        self._message      = message
+        audio.play("card_reject")
 
     def _on_click(self, pos):
         g         = self.game
@@ -1311,93 +1179,38 @@ class GameScreen:
 
         if self._state in (S_HUMAN_ATTACK, S_PILE_ON, S_PILE_ON_TAKING):
             if not g.table.is_empty() and self._pass_rect().collidepoint(pos):
-                if self._state == S_PILE_ON_TAKING:
-                    self._end_pile_on_taking()
-                else:
-                    self._stat_passes += 1
-                    self._finish_round(defender_took=False)
+                self._act(PASS)
                 return
             card = self._card_at_pos(pos)
             if card is None:
                 return
 
-            # Card limit: max 6 cards total on table.
-            # During initial attack only, also cap at defender's hand size
-            # (so they always have cards to beat with). During pile-on the
-            # defender has already committed, so only the 6-card hard cap applies.
-            defender    = g.players[g.defender_idx]
-            if self._state == S_HUMAN_ATTACK and g.table.is_empty():
-                max_attacks = min(6, len(defender.hand))
-            else:
-                max_attacks = 6
-            if len(g.table.pairs) >= max_attacks:
-                self._invalid_card = card
-                self._invalid_tick = 40
-                self._message = _t("game.too_many_cards")
-                audio.play("card_reject")
+            # Card limit: max 6 cards on the table, and never more undefended
+            # attacks than the defender has cards to beat them with.
+            if not can_add_attack(g):
+                self._reject(card, _t("game.too_many_cards"))
                 return
-
             if not g.table.is_empty() and not validator.can_attack(card, g.table):
-                self._invalid_card = card
-                self._invalid_tick = 40
-                self._message = f"{card} — {_t('game.rank_not_on_table')}"
-                audio.play("card_reject")
+                self._reject(card, f"{card} — {_t('game.rank_not_on_table')}")
                 return
-            hand_before = list(g.players[0].hand)
-            hand_idx    = g.players[0].hand.index(card)
-            src_rect    = self._hand_rect(hand_idx, len(g.players[0].hand))
-            pair_idx    = len(g.table.pairs)
-            g.players[0].remove_card(card)
-            g.table.add_attack(card)
-            g.players[0].sort_hand(trump)
-            total    = len(g.table.pairs)
-            dst      = self._table_pos(pair_idx, total, False)
-            src      = (src_rect.centerx, src_rect.centery)
-            card_str = str(card)
+            hand_before = list(self._vis_hand)
             if card.is_trump(trump):
                 self._stat_trumps_played += 1
             self._ach_tracker.on_player_attack(card, trump, hand_before)
-            if len(g.players[0].hand) == 0:
+            if len(hand_before) == 1:
                 self._ach_tracker.on_final_card_played(card, trump, was_attack=True)
-            self._slide_table_to(total)
-            def on_land(cs=card_str, pi=pair_idx):
-                while len(self._vis_table) <= pi:
-                    self._vis_table.append((None, None))
-                _, dfn = self._vis_table[pi]
-                self._vis_table[pi] = (cs, dfn)
-                self._vis_table_total = len(self._vis_table)
-                self._animating = False
-                self._attack_commit_timer = _ATTACK_COMMIT_DELAY
-            self._fly_card(card_str, src, dst, on_done=on_land)
+            self._act(encode(ATTACK, card))
 
         elif self._state == S_HUMAN_DEFEND:
+            idx = g.table.first_undefended_index()
+            atk = g.table.pairs[idx].attack
             if self._pickup_rect().collidepoint(pos):
-                taken = g.table.all_cards()
-                idx_def  = g.table.first_undefended_index()
-                had_valid = False
-                if idx_def is not None:
-                    atk_card = g.table.pairs[idx_def].attack
-                    had_valid = bool(validator.valid_defences(g.players[0].hand, atk_card))
+                taken     = g.table.all_cards()
+                had_valid = bool(validator.valid_defences(g.players[0].hand, atk))
                 self._stat_piles_taken  += 1
                 self._stat_biggest_pile  = max(self._stat_biggest_pile, len(taken))
                 self._ach_tracker.on_player_takes_pile(taken, trump, had_valid)
-                # Give cards to defender but don't advance roles yet — check if attacker can pile on
-                g.players[0].hand.extend(taken)
-                g.players[0].sort_hand(trump)
-                # Check if attacker (bot) has any pile-on cards.
-                # Skip pile-on window if a transfer already happened this round —
-                # the attacker already played their transfer card, no second bite.
-                attacker = g.players[g.attacker_idx]
-                can_pile = (not self._round_had_transfer and
-                            bool(validator.valid_attacks(attacker.hand, g.table)))
-                if g.attacker_idx != 0 and can_pile:
-                    # Bot can pile on — enter taking state so bot gets a chance
-                    self._set(S_PILE_ON_TAKING, "")
-                    self._pending_defender_took = True
-                    self._queue_bot_pile_on_taking()
-                else:
-                    g._advance_roles(defender_took=True)
-                    self._finish_round(defender_took=True)
+                self._act(TAKE)
                 return
             card = self._card_at_pos(pos)
 
@@ -1405,42 +1218,22 @@ class GameScreen:
             if self.transfer_mode:
                 for crd, badge_r in self._transfer_badge_rects.items():
                     if badge_r.collidepoint(pos):
-                        self._do_transfer(crd, validator, trump)
+                        if crd.is_trump(trump):
+                            self._stat_trumps_played += 1
+                        self._act(encode(TRANSFER, crd))
                         return
 
             if card is None:
                 return
-            idx = g.table.first_undefended_index()
-            atk = g.table.pairs[idx].attack
-
             if not validator.can_defend(card, atk):
-                self._invalid_card = card
-                self._invalid_tick = 40
-                self._message = f"{card} {_t('game.cant_beat')} {atk}"
-                audio.play("card_reject")
+                self._reject(card, f"{card} {_t('game.cant_beat')} {atk}")
                 return
-            hand_before = list(g.players[0].hand)
-            hand_idx    = g.players[0].hand.index(card)
-            src_rect    = self._hand_rect(hand_idx, len(g.players[0].hand))
-            g.players[0].remove_card(card)
-            g.table.add_defence(idx, card)
-            g.players[0].sort_hand(trump)
-            total    = len(g.table.pairs)
-            dst      = self._table_pos(idx, total, True)
-            src      = (src_rect.centerx, src_rect.centery)
-            card_str = str(card)
             if card.is_trump(trump):
                 self._stat_trumps_played += 1
             self._ach_tracker.on_player_defend(card, atk, trump)
-            if len(g.players[0].hand) == 0:
+            if len(self._vis_hand) == 1:
                 self._ach_tracker.on_final_card_played(card, trump, was_attack=False)
-            def on_land(cs=card_str, pi=idx):
-                if pi < len(self._vis_table):
-                    atk_s, _ = self._vis_table[pi]
-                    self._vis_table[pi] = (atk_s, cs)
-                self._animating = False
-                self._after_attack()
-            self._fly_card(card_str, src, dst, on_done=on_land)
+            self._act(encode(DEFEND, card))
 
     # ── update ────────────────────────────────────────────────────────────────
 
@@ -1474,23 +1267,19 @@ class GameScreen:
         if not self._flying:
             self._animating = False
 
-        if self._state == S_BOT_THINKING and self._bot_action and not self._animating:
+        if self._state == S_BOT_THINKING and not self._animating:
+            self._poll_bot()
             self._bot_timer -= dt * 60
-            if self._bot_timer <= 0:
+            if self._bot_timer <= 0 and self._bot_action:
                 fn = self._bot_action
                 self._bot_action = None
                 fn()
 
-        if self._state == S_ROUND_OVER and not self._animating:
-            self._round_timer -= dt * 60
-            if self._round_timer <= 0:
-                self._start_round()
-
         # Attack commit window
         if self._attack_commit_timer > 0 and not self._animating:
             self._attack_commit_timer -= dt * 60
             if self._attack_commit_timer <= 0:
-                self._after_attack()
+                self._act(PASS)
 
         if self._status_fade > 0:
             self._status_fade -= dt * 60
@@ -1499,7 +1288,7 @@ class GameScreen:
 
         # Card hover — smooth lerp
         mouse = pygame.mouse.get_pos()
-        hand  = self.game.players[0].hand
+        hand  = self._vis_hand
         speed = 1 - (0.85 ** (dt * 60))   # frame-rate independent lerp
         for i, card in enumerate(hand):
             rect   = self._hand_rect(i, len(hand))
@@ -1695,8 +1484,7 @@ class GameScreen:
             t.blit(rot, (x - rot.get_width() // 2, y - rot.get_height() // 2))
 
     def _draw_bot_hand(self, t, W, H):
-        bot     = self.game.players[1]
-        count   = len(bot.hand)
+        count   = self._vis_bot_count
         max_w   = W - 40
         gap     = 6
         total_w = count * CARD_W + max(0, count - 1) * gap
@@ -1712,16 +1500,16 @@ class GameScreen:
                              (sx + i * (CARD_W + gap) + 2, y + 3, CARD_W, CARD_H),
                              border_radius=6)
 
-        for i in range(count):
-            t.blit(self._get_back_surf((CARD_W, CARD_H)), (sx + i * (CARD_W + gap), y))
+        back = self._get_back_surf((CARD_W, CARD_H))
+        t.blits([(back, (sx + i * (CARD_W + gap), y)) for i in range(count)], doreturn=False)
 
         # Bot badge — draw directly onto screen (opaque, fast)
         av_cx, av_cy = W // 2, y + CARD_H + 44
         f   = get_fonts()["small"]
         label_str = _t("game.status_bot")
         cnt_str   = str(count)
-        lbl_s = f.render(label_str, False, TEXT_DIM)
-        cnt_s = f.render(cnt_str,   False, TEXT_MAIN)
+        lbl_s = glyph_text.render(f, label_str, TEXT_DIM)
+        cnt_s = glyph_text.render(f, cnt_str,   TEXT_MAIN)
         pad   = 14
         pill_w = lbl_s.get_width() + cnt_s.get_width() + pad * 3 + 6
         pill_h = 26
@@ -1772,7 +1560,7 @@ class GameScreen:
         # Card count badge — opaque
         f       = get_fonts()["small"]
         cnt_str = str(remaining)
-        cnt_s   = f.render(cnt_str, False, TEXT_DIM if remaining > 0 else (80, 50, 100))
+        cnt_s   = glyph_text.render(f, cnt_str, TEXT_DIM if remaining > 0 else (80, 50, 100))
         pad     = 8
         badge_w = cnt_s.get_width() + pad * 2
         badge_h = cnt_s.get_height() + 6
@@ -1818,7 +1606,7 @@ class GameScreen:
             if self._state == S_BOT_THINKING:
                 label = "THINKING" + "." * (int(self._time * 4) % 4)
 
-            lbl_s  = f.render(label, False, NEON_GLOW)
+            lbl_s  = glyph_text.render(f, label, NEON_GLOW)
             pad    = 14
             pill_w = lbl_s.get_width() + pad * 2
             pill_h = lbl_s.get_height() + 10
@@ -1856,11 +1644,11 @@ class GameScreen:
             if len(pts) >= 2:
                 pygame.draw.lines(t, col, False, pts, 3)
             secs = math.ceil(self._attack_commit_timer / 60)
-            lbl  = f.render(str(secs), False, col)
+            lbl  = glyph_text.render(f, str(secs), col)
             t.blit(lbl, (cx - lbl.get_width() // 2, arc_y - lbl.get_height() // 2))
 
         if self._message:
-            msg_s  = f.render(self._message, False, TEXT_DIM)
+            msg_s  = glyph_text.render(f, self._message, TEXT_DIM)
             pad    = 10
             pill_w = msg_s.get_width() + pad * 2
             pill_h = msg_s.get_height() + 8
@@ -1875,14 +1663,14 @@ class GameScreen:
     def _draw_player_hand(self, t, W, H, mouse):
         if self._sorting_hand:
             return
-        hand       = self.game.players[0].hand
+        hand       = self._vis_hand
         actionable = self._state in (S_HUMAN_ATTACK, S_HUMAN_DEFEND, S_PILE_ON, S_PILE_ON_TAKING)
 
         # Compute transfer-eligible cards when defending in transfer mode
         transfer_cards = set()
         if self.transfer_mode and self._state == S_HUMAN_DEFEND:
             validator = MoveValidator(self.game.deck.trump)
-            new_def_hand = self.game.players[self.game.attacker_idx].hand
+            new_def_hand = self.game.players[next_defender(self.game)].hand
             transfer_cards = {c for c in hand
                               if validator.can_transfer(c, self.game.table,
                                                         new_defender_hand=new_def_hand)}
@@ -1897,7 +1685,7 @@ class GameScreen:
                              (rect.x + 2, rect.y - lift + 4, CARD_W, CARD_H), border_radius=6)
 
         f_small   = get_fonts()["small"]
-        badge_lbl = f_small.render(_t("game.transfer"), False, (255, 200, 60))
+        badge_lbl = glyph_text.render(f_small, _t("game.transfer"), (255, 200, 60))
         badge_pad = 8
         badge_w   = badge_lbl.get_width() + badge_pad * 2
         badge_h   = badge_lbl.get_height() + 6
@@ -1918,6 +1706,8 @@ class GameScreen:
 
         pulse = 0.5 + 0.5 * math.sin(self._time * 5.0)   # smooth, time-based
 
+        # Cards in one blits() batch (atlas subsurfaces, so mostly one source)
+        batch = []
         for i, card in enumerate(hand):
             rect    = self._hand_rect_spread(i, len(hand), card)
             lift    = int(self._hover.get(id(card), 0.0)) if actionable else 0
@@ -1929,7 +1719,12 @@ class GameScreen:
                 surf.blit(self._invalid_overlay if invalid else self._hover_overlay, (0, 0))
                 pygame.draw.rect(surf, (220, 60, 60) if invalid else NEON_GLOW,
                                  (0, 0, CARD_W, CARD_H), width=2)
-            t.blit(surf, (rect.x, rect.y - lift))
+            batch.append((surf, (rect.x, rect.y - lift)))
+        t.blits(batch, doreturn=False)
+
+        for i, card in enumerate(hand):
+            rect = self._hand_rect_spread(i, len(hand), card)
+            lift = int(self._hover.get(id(card), 0.0)) if actionable else 0
 
             # Transfer badge
             if card in transfer_cards:
@@ -1961,7 +1756,7 @@ class GameScreen:
                 pygame.draw.rect(bs, (*bc, 255 if hovered else 220),
                                  bs.get_rect(), width=3 if hovered else 2,
                                  border_radius=sh_h // 2)
-                lbl = f_small.render(_t("game.transfer"), False, bc)
+                lbl = glyph_text.render(f_small, _t("game.transfer"), bc)
                 bs.blit(lbl, (sw // 2 - lbl.get_width() // 2,
                               sh_h // 2 - lbl.get_height() // 2))
                 t.blit(bs, (bx, by))
@@ -1989,7 +1784,7 @@ class GameScreen:
                 pygame.draw.rect(t, (*border_col[:3], pulse_a) if len(border_col) == 3
                                  else (*border_col, pulse_a),
                                  er, width=2, border_radius=10)
-            lbl = f.render(label, False, TEXT_MAIN)
+            lbl = glyph_text.render(f, label, TEXT_MAIN)
             t.blit(lbl, (r.centerx - lbl.get_width() // 2,
                           r.centery - lbl.get_height() // 2))
 
@@ -2008,11 +1803,9 @@ class GameScreen:
                       hov_col=(50, 40, 110))
 
         if self._state == S_PILE_ON_TAKING:
+            # the bot took; the player is only piling on before it picks up
             r = self._pass_rect()
-            # If human is the defender who chose to take → "LET TAKE"
-            # If bot is the defender who took → "PASS" (human is just piling on)
-            lbl = _t("game.let_take") if self.game.defender_idx == 0 else _t("game.pass")
-            _draw_btn(r, lbl,
+            _draw_btn(r, _t("game.pass"),
                       base_col=(22, 18, 60),
                       border_col=PURPLE,
                       hov_col=(50, 40, 110))
@@ -2051,7 +1844,7 @@ class GameScreen:
 
         # "TRUMP" label
         f = get_fonts()["small"]
-        label = f.render(_t("game.trump"), False, TEXT_DIM)
+        label = glyph_text.render(f, _t("game.trump"), TEXT_DIM)
         t.blit(label, (r.x + 12, r.y + 10))
 
         # Draw suit glyph as vector polygon — reliable across all fonts
@@ -2103,7 +1896,7 @@ class GameScreen:
         draw_fn[suit_sym](gx, gy, sz, suit_col)
 
         # Suit name text
-        name = f.render(name_map.get(suit_sym, suit_sym), False, suit_col)
+        name = glyph_text.render(f, name_map.get(suit_sym, suit_sym), suit_col)
         t.blit(name, (gx + sz + 14, gy - name.get_height() // 2))
 
         # Thin accent line at bottom
@@ -2169,9 +1962,7 @@ class GameScreen:
             sub_col   = TEXT_DIM
             sub_str   = _t("result.sub_draw")
 
-        title_s = f_title.render(title_str, False, title_col)
-        glow_s  = f_title.render(title_str, False, title_col)
-        glow_s.set_alpha(int(60 * fade_in))
+        title_s = glyph_text.render(f_title, title_str, title_col, int(255 * fade_in))
 
         # Pulse glow
         pulse = abs(math.sin(tick * 0.04)) * 20
@@ -2181,11 +1972,9 @@ class GameScreen:
                          border_radius=6)
         t.blit(gs, (cx - gs.get_width() // 2, cy - 120 - 10))
 
-        title_s.set_alpha(int(255 * fade_in))
         t.blit(title_s, (cx - title_s.get_width() // 2, cy - 120))
 
-        sub_s = f_sm.render(sub_str, False, sub_col)
-        sub_s.set_alpha(int(220 * fade_in))
+        sub_s = glyph_text.render(f_sm, sub_str, sub_col, int(220 * fade_in))
         t.blit(sub_s, (cx - sub_s.get_width() // 2, cy - 120 + title_s.get_height() + 8))
 
         # ── divider ───────────────────────────────────────────────────────────
@@ -2216,10 +2005,8 @@ class GameScreen:
 
         for i, (label, val) in enumerate(stat_lines):
             sy    = py + 8 + i * 22
-            lbl_s = f_sm.render(label, False, TEXT_DIM)
-            val_s = f_sm.render(val,   False, TEXT_MAIN)
-            lbl_s.set_alpha(int(220 * stat_fade))
-            val_s.set_alpha(int(220 * stat_fade))
+            lbl_s = glyph_text.render(f_sm, label, TEXT_DIM,  int(220 * stat_fade))
+            val_s = glyph_text.render(f_sm, val,   TEXT_MAIN, int(220 * stat_fade))
             t.blit(lbl_s, (px + 12, sy))
             t.blit(val_s, (px + panel_w - val_s.get_width() - 12, sy))
 
@@ -2227,42 +2014,33 @@ class GameScreen:
         prompt_fade = min(1.0, max(0.0, (tick - 50) / 30))
         if prompt_fade > 0:
             blink = abs(math.sin(tick * 0.05))
-            prompt_s = f_sm.render(_t("result.press_any_key"), False, TEXT_DIM)
-            prompt_s.set_alpha(int(200 * prompt_fade * blink))
+            prompt_s = glyph_text.render(f_sm, _t("result.press_any_key"), TEXT_DIM,
+                                         int(200 * prompt_fade * blink))
             t.blit(prompt_s, (cx - prompt_s.get_width() // 2, cy + panel_h + 20))
 
-    # ── card image loading ────────────────────────────────────────────────────
-
-    def _load_card_images(self):
-        import os
-        card_dir = os.path.join(os.path.dirname(__file__), 'assets', 'cards')
-        images   = {}
-        suit_map = {'♥': 'hearts', '♦': 'diamonds', '♠': 'spades', '♣': 'clubs'}
-        rank_map = {
-            'A': 'ace', '2': '2', '3': '3', '4': '4', '5': '5', '6': '6',
-            '7': '7', '8': '8', '9': '9', '10': '10',
-            'J': 'jack', 'Q': 'queen', 'K': 'king',
-        }
-        try:
-            for suit_sym, suit_name in suit_map.items():
-                for rank_sym, rank_name in rank_map.items():
-                    key  = f'{rank_sym}{suit_sym}'
-                    path = os.path.join(card_dir, f'{rank_name}_of_{suit_name}.png')
-                    if os.path.exists(path):
-                        images[key] = pygame.image.load(path).convert_alpha()
-            back_path = os.path.join(card_dir, 'back.png')
-            if os.path.exists(back_path):
-                images['back'] = pygame.image.load(back_path).convert_alpha()
-        except Exception as e:
-            print(f'[warn] card image load failed: {e}')
-        return images
+    # ── card images ───────────────────────────────────────────────────────────
+
+    def close(self):
+        """Release shared resources once this screen is dropped."""
+        self._cards.release()
+        self._bot_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _card_image(self, key, size):
+        """A card image from assets/cards scaled to size (the atlas at card
+        size, the shared cache otherwise), or None if the image is missing."""
+        if self._atlas is not None and size == (CARD_W, CARD_H):
+            return self._atlas.get(key)
+        base = self._cards.get(key)
+        if base is None:
+            return None
+        return card_cache.get(key, size, "scale", lambda: pygame.transform.scale(base, size))
 
     def _card_surf_by_str(self, card_str):
         card_str = card_str.strip()
-        # Try direct lookup first 
-        base = self._cards.get(card_str)
-        if base:
-            return pygame.transform.scale(base, (CARD_W, CARD_H))
+        # Try direct lookup first
+        surf = self._card_image(card_str, (CARD_W, CARD_H))
+        if surf:
+            return surf
         # Fall back to parsing and drawing programmatically
         from ..core.card import Card, Suit
         suit_map = {'♥': Suit.HEARTS, '♦': Suit.DIAMONDS, '♠': Suit.SPADES, '♣': Suit.CLUBS}
@@ -2280,16 +2058,17 @@ class GameScreen:
 
     def _get_card_surf(self, card, size):
         key  = f'{card.rank}{card.suit.value}'
-        base = self._cards.get(key, None)
-        if base is None:
-            base = self._make_card_face_surf(card)
-        return pygame.transform.scale(base, size)
+        surf = self._card_image(key, size)
+        if surf is None:
+            surf = card_cache.get(key, size, "drawn", lambda: pygame.transform.scale(
+                self._make_card_face_surf(card), size))
+        return surf
 
     def _get_back_surf(self, size):
-        base = self._cards.get('back')
-        if base is None:
-            return self._make_card_back_surf(*size)
-        return pygame.transform.scale(base, size)
+        surf = self._card_image('back', size)
+        if surf is None:
+            surf = card_cache.get('back', size, "drawn", lambda: self._make_card_back_surf(*size))
+        return surf
 
     def _make_card_back_surf(self, w, h):
         surf = pygame.Surface((w, h), pygame.SRCALPHA)
@@ -2303,20 +2082,19 @@ class GameScreen:
         col    = CARD_RED if is_red else CARD_BLACK
         pygame.draw.rect(surf, CARD_BG,    (0, 0, CARD_W, CARD_H), border_radius=5)
         pygame.draw.rect(surf, CARD_BORDER,(0, 0, CARD_W, CARD_H), width=1, border_radius=5)
-        lbl = get_fonts()["small"].render(str(card), False, col)
+        lbl = glyph_text.render(get_fonts()["small"], str(card), col)
         surf.blit(lbl, (4, 4))
         return surf
 
     def _draw_card_face(self, target, card_str, x, y):
-        base = self._cards.get(card_str.strip())
-        surf = pygame.transform.scale(base, (CARD_W, CARD_H)) if base else \
+        surf = self._card_image(card_str.strip(), (CARD_W, CARD_H)) or \
                (lambda s: (s.fill((220,220,220)), s)[1])(pygame.Surface((CARD_W, CARD_H)))
         target.blit(surf, (x, y))
 
     # ── hit testing ───────────────────────────────────────────────────────────
 
     def _card_at_pos(self, pos):
-        hand = self.game.players[0].hand
+        hand = self._vis_hand
         for i, card in reversed(list(enumerate(hand))):
             if self._hand_rect(i, len(hand)).collidepoint(pos):
                 return card
@@ -2327,34 +2105,3 @@ class GameScreen:
 
     def _pass_rect(self):
         return pygame.Rect(WIDTH - 200, HEIGHT // 2 + 130, 140, 40)
-
-    def _do_transfer(self, card, validator, trump):
-        """Player transfers the attack to the bot by playing a same-rank card."""
-        g = self.game
-        hand_idx = g.players[0].hand.index(card)
-        src_rect = self._hand_rect(hand_idx, len(g.players[0].hand))
-        pair_idx = len(g.table.pairs)
-        g.players[0].remove_card(card)
-        g.table.add_attack(card)
-        g.players[0].sort_hand(trump)
-        # Swap roles: original attacker becomes defender
-        g.attacker_idx, g.defender_idx = g.defender_idx, g.attacker_idx
-        self._round_had_transfer = True
-        total    = len(g.table.pairs)
-        dst      = self._table_pos(pair_idx, total, False)
-        src      = (src_rect.centerx, src_rect.centery)
-        card_str = str(card)
-        if card.is_trump(trump):
-            self._stat_trumps_played += 1
-        self._slide_table_to(total)
-        def on_land(cs=card_str, pi=pair_idx):
-            while len(self._vis_table) <= pi:
-                self._vis_table.append((None, None))
-            _, dfn = self._vis_table[pi]
-            self._vis_table[pi] = (cs, dfn)
-            self._vis_table_total = len(self._vis_table)
-            self._animating = False
-            # Now bot must defend the transferred attack
-            self._set(S_BOT_THINKING, _t("game.transfer"))
-            self._queue_bot_defence()
-        self._fly_card(card_str, src, dst, on_done=on_land)
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+glyph_text.py — Text drawn from per-font glyph atlases instead of font.render.
+
+PressStart2P is a monospace pixel font with no kerning, so a string is just
+its glyphs side by side. Each (font, colour) pair gets a GlyphAtlas that
+rasterizes a character the first time it is asked for and keeps it, so a
+new string is composed with one Surface.blits() call of sub-rectangles
+instead of a font.render. Any character the font has can be drawn, so the
+Cyrillic and Romanian text in locale.py works as-is; LOCALE_CHARS lists them
+for warming an atlas up. Glyphs are not all one height (the comma below
+Ș/ș reaches under the baseline), so cells and strings take their height
+from font.size(), the same as font.render.
+
+Most labels are the same from frame to frame, so render() also keeps the
+composed strings, least recently used first out: a repeat is a dict lookup
+and the caller's one blit. The surfaces are colour-keyed, like font.render's
+own, and shared: pass alpha= rather than calling set_alpha() on them. Run this module for a timing against
+font.render.
+"""
+from __future__ import annotations
+
+import string
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+from .locale import _STRINGS
+
+Colour = Tuple[int, ...]
+
+ATLAS_W     = 512
+MAX_ATLASES = 64     # colours are sometimes animated; keep the recent ones
+MAX_STRINGS = 512
+
+
+def _leaves(node) -> Iterable[str]:
+    if isinstance(node, dict):
+        for v in node.values():
+            yield from _leaves(v)
+    elif isinstance(node, str):
+        yield node
+
+
+# printable ASCII plus every character in the string table (all languages)
+LOCALE_CHARS = "".join(sorted(set(string.printable.strip()) | {" "}
+                              | {ch for s in _leaves(_STRINGS) for ch in s if ch.isprintable()}))
+
+
+class GlyphAtlas:
+    """The glyphs of one font in one colour, packed into rows (each as tall
+    as its tallest glyph) on a surface that grows as new characters turn
+    up."""
+
+    def __init__(self, font: pygame.font.Font, colour: Colour) -> None:
+        self.font    = font
+        self.colour  = colour
+        self.height  = font.size("")[1]          # of an empty string; glyphs may be taller
+        # 8-bit and colour-keyed like font.render's own output, which blits
+        # (and fades) faster than per-pixel alpha
+        self.key     = (0, 0, 0) if tuple(colour[:3]) != (0, 0, 0) else (255, 255, 255)
+        self.surface = self._blank((ATLAS_W, self.height))
+        self.rects: Dict[str, pygame.Rect] = {}
+        self._x = self._y = self._row_h = 0
+
+    def _add(self, ch: str) -> pygame.Rect:
+        glyph = self.font.render(ch, False, self.colour)
+        w, h  = glyph.get_size()
+        if self._x + w > ATLAS_W or (self._x and h > self._row_h):
+            self._x, self._y, self._row_h = 0, self._y + self._row_h, 0
+        self._row_h = max(self._row_h, h)
+        if self._y + h > self.surface.get_height():
+            grown = self._blank((ATLAS_W, max(self._y + h, self.surface.get_height() * 2)))
+            grown.blit(self.surface, (0, 0))
+            self.surface = grown
+        self.surface.blit(glyph, (self._x, self._y))
+        rect = self.rects[ch] = pygame.Rect(self._x, self._y, w, h)
+        self._x += w
+        return rect
+
+    def _blank(self, size: Tuple[int, int]) -> pygame.Surface:
+        surf = pygame.Surface(size, depth=8)
+        surf.set_palette([self.key, self.colour[:3]])
+        surf.fill(0)
+        surf.set_colorkey(0)
+        return surf
+
+    def warm(self, chars: str = LOCALE_CHARS) -> None:
+        """Rasterize chars now rather than the first time they are drawn."""
+        for ch in chars:
+            if ch not in self.rects:
+                self._add(ch)
+
+    def _glyphs(self, text: str) -> List[pygame.Rect]:
+        rects = self.rects
+        return [rects.get(ch) or self._add(ch) for ch in text]
+
+    def size(self, text: str) -> Tuple[int, int]:
+        rects = self._glyphs(text)
+        return sum(r.width for r in rects), max([self.height] + [r.height for r in rects])
+
+    def draw(self, target: pygame.Surface, text: str, pos: Tuple[int, int]) -> pygame.Rect:
+        """Blit text glyph by glyph with its top-left at pos; returns the
+        area drawn."""
+        x, y = int(pos[0]), int(pos[1])
+        src, left, blits, h = self.surface, x, [], self.height
+        for rect in self._glyphs(text):
+            blits.append((src, (x, y), rect))
+            x += rect.width
+            h  = max(h, rect.height)
+        target.blits(blits, doreturn=False)
+        return pygame.Rect(left, y, x - left, h)
+
+    def render(self, text: str) -> pygame.Surface:
+        surf = self._blank(self.size(text))
+        self.draw(surf, text, (0, 0))
+        return surf
+
+
+_atlases: "OrderedDict[Tuple[pygame.font.Font, Colour], GlyphAtlas]" = OrderedDict()
+_strings: "OrderedDict[Tuple[pygame.font.Font, Colour, str, bool], pygame.Surface]" = OrderedDict()
+
+
+def atlas(font: pygame.font.Font, colour: Colour) -> GlyphAtlas:
+    """The shared atlas for font in colour (RGB or RGBA)."""
+    key = (font, tuple(colour))
+    a   = _atlases.get(key)
+    if a is not None:
+        _atlases.move_to_end(key)
+        return a
+    a = _atlases[key] = GlyphAtlas(font, key[1])
+    if len(_atlases) > MAX_ATLASES:
+        _atlases.popitem(last=False)
+    return a
+
+
+def render(font: pygame.font.Font, text: str, colour: Colour,
+           alpha: int = 255) -> pygame.Surface:
+    """Like font.render(text, False, colour), composed from the glyph atlas
+    and kept. With alpha < 255 the result is a second kept copy whose
+    surface alpha is set on every call, so blit it before asking again."""
+    faded = alpha < 255
+    key   = (font, tuple(colour), text, faded)
+    surf  = _strings.get(key)
+    if surf is not None:
+        _strings.move_to_end(key)
+    else:
+        surf = _strings[key] = (render(font, text, colour).copy() if faded
+                                else atlas(font, colour).render(text))
+        if len(_strings) > MAX_STRINGS:
+            _strings.popitem(last=False)
+    if faded:
+        surf.set_alpha(alpha)
+    return surf
+
+
+def draw(target: pygame.Surface, font: pygame.font.Font, text: str,
+         colour: Colour, pos: Tuple[int, int]) -> pygame.Rect:
+    """Blit render(font, text, colour) with its top-left at pos."""
+    return target.blit(render(font, text, colour), pos)
+
+
+def invalidate_cache() -> None:
+    """Drop every atlas and string (after the fonts are reloaded)."""
+    _atlases.clear()
+    _strings.clear()
+
+
+if __name__ == "__main__":
+    import os
+    import time
+    from .constants import FONT_PATH
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((640, 480))
+    n = 20000
+    for size, text in [(8, "BOT"), (8, "IAU CĂRȚILE"), (16, "ВЗЯТЬ КАРТЫ"), (32, "FOOL'S HAND")]:
+        font = pygame.font.Font(FONT_PATH, size)
+        def faded():
+            surf = font.render(text, False, (255, 255, 255))
+            surf.set_alpha(128)
+            screen.blit(surf, (10, 10))
+        for name, fn in [("font.render      ", lambda: screen.blit(font.render(text, False, (255, 255, 255)), (10, 10))),
+                         ("glyph_text       ", lambda: screen.blit(render(font, text, (255, 255, 255)), (10, 10))),
+                         ("font.render a=128", faded),
+                         ("glyph_text  a=128", lambda: screen.blit(render(font, text, (255, 255, 255), 128), (10, 10)))]:
+            fn()
+            start = time.perf_counter()
+            for _ in range(n):
+                fn()
+            print(f"{size:2d}px {text!r:16} {name} {(time.perf_counter() - start) / n * 1e6:6.1f} µs")
@@ -13,6 +13,7 @@ from .constants import (
 from .widgets import Button
 from .locale import t as _t
 from .font_manager import get_fonts
+from . import glyph_text
 
 _REPEL_DIST  = 30
 _REPEL_FORCE = 180
@@ -254,7 +255,7 @@ class MainMenu:
         y     = 60
         pad   = px + 24
 
-        title_surf = small.render(_t("menu.credits"), False, NEON_GLOW)
+        title_surf = glyph_text.render(small, _t("menu.credits"), NEON_GLOW)
         self._draw_target.blit(title_surf, (pad, y))
         y += title_surf.get_height() + 4
         pygame.draw.rect(self._draw_target, NEON, (pad, y, _PANEL_W - 48, 2))
@@ -262,11 +263,11 @@ class MainMenu:
 
         for header, value in self._credits:
             if header:
-                label = small.render(header, False, NEON)
+                label = glyph_text.render(small, header, NEON)
                 self._draw_target.blit(label, (pad, y))
                 y += label.get_height() + 8
             elif value:
-                label = body.render(value, False, TEXT_MAIN)
+                label = glyph_text.render(body, value, TEXT_MAIN)
                 self._draw_target.blit(label, (pad, y))
                 y += label.get_height() + 6
 
@@ -288,7 +289,7 @@ class MainMenu:
 
         # arrow points right when closed, left when open
         arrow = ">" if not self._panel_open else "<"
-        label = self.fonts["btn"].render(arrow, False, TEXT_MAIN)
+        label = glyph_text.render(self.fonts["btn"], arrow, TEXT_MAIN)
         lx    = tab.centerx - label.get_width() // 2
         ly    = tab.centery - label.get_height() // 2
         self._draw_target.blit(label, (lx, ly))
@@ -395,15 +396,14 @@ class MainMenu:
 
         tx_base = WIDTH // 2
 
+        glow = glyph_text.render(title_font, display, NEON_GLOW).copy()
         for offset, glow_alpha in [(10, 30), (6, 60), (3, 100)]:
-            glow = title_font.render(display, False, NEON_GLOW)
             glow.set_alpha(int(glow_alpha * alpha_override / 255))
             gx = tx_base - glow.get_width() // 2 + x_offset
             self._draw_target.blit(glow, (gx - offset // 2, ty + int(pulse)))
             self._draw_target.blit(glow, (gx + offset // 2, ty + int(pulse)))
 
-        title = title_font.render(display, False, colour)
-        title.set_alpha(alpha_override)
+        title = glyph_text.render(title_font, display, colour, alpha_override)
         tx    = tx_base - title.get_width() // 2 + x_offset
         self._draw_target.blit(title, (tx, ty + int(pulse)))
 
@@ -419,8 +419,7 @@ class MainMenu:
         self._draw_target.blit(line_surf, (ux, uy))
 
         sub_text = "A  DURAK  CARD  GAME" if not self._title_decoded else "the original name"
-        sub      = self.fonts["sub"].render(sub_text, False, TEXT_DIM)
-        sub.set_alpha(alpha_override)
+        sub      = glyph_text.render(self.fonts["sub"], sub_text, TEXT_DIM, alpha_override)
         sx       = tx_base - sub.get_width() // 2 + x_offset
         self._draw_target.blit(sub, (sx, uy + 14))
 
@@ -435,16 +434,16 @@ class MainMenu:
         colour = NEON if self.x_btn.collidepoint(mouse) else PURPLE
         pygame.draw.rect(self._draw_target, PURPLE_DIM, self.x_btn, border_radius=4)
         pygame.draw.rect(self._draw_target, colour, self.x_btn, width=1, border_radius=4)
-        label = self.fonts["small"].render("X", False, TEXT_MAIN)
+        label = glyph_text.render(self.fonts["small"], "X", TEXT_MAIN)
         lx    = self.x_btn.centerx - label.get_width() // 2
         ly    = self.x_btn.centery - label.get_height() // 2
         self._draw_target.blit(label, (lx, ly))
 
     def _draw_footer(self) -> None:
         small = self.fonts["small"]
-        ver   = small.render(_t("menu.pre_release"), False, TEXT_DIM)
+        ver   = glyph_text.render(small, _t("menu.pre_release"), TEXT_DIM)
         self._draw_target.blit(ver, (12, HEIGHT - ver.get_height() - 10))
-        rights = small.render("(c) 2025 Dumitru Ceaicovschi", False, TEXT_DIM)
+        rights = glyph_text.render(small, "(c) 2025 Dumitru Ceaicovschi", TEXT_DIM)
         self._draw_target.blit(rights, (WIDTH - rights.get_width() - 12,
                                    HEIGHT - rights.get_height() - 10))
 
@@ -469,7 +468,7 @@ class MainMenu:
 
         # Trophy symbol
         f   = self.fonts["btn"]
-        sym = f.render("*", False, GOLD if is_full else TEXT_DIM)
+        sym = glyph_text.render(f, "*", GOLD if is_full else TEXT_DIM)
         self._draw_target.blit(sym, (
             self._trophy_btn.centerx - sym.get_width()  // 2,
             self._trophy_btn.centery - sym.get_height() // 2 - 4,
@@ -477,8 +476,8 @@ class MainMenu:
 
         # Counter badge
         f_sm  = self.fonts["small"]
-        badge = f_sm.render(f"{count}/{total}", False,
-                             GOLD if is_full else TEXT_DIM)
+        badge = glyph_text.render(f_sm, f"{count}/{total}",
+                                  GOLD if is_full else TEXT_DIM)
         self._draw_target.blit(badge, (
             self._trophy_btn.centerx - badge.get_width() // 2,
             self._trophy_btn.bottom  - badge.get_height() - 2,
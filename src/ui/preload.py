@@ -0,0 +1,56 @@
+"""
+preload.py — Slow startup work on a background thread.
+
+Decoding sounds and card PNGs and drawing the big procedural surfaces takes
+longer than the whole menu intro, so app.run() hands it to a Preloader and
+starts drawing straight away. Jobs run on one worker thread and must not
+touch the display (no convert(), no display surfaces); their results come
+back on the main thread through poll(), which runs each job's on_done
+callback once it has finished. Screens are handed placeholders until then.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class Preloader:
+    def __init__(self) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preload")
+        self._jobs: List[Tuple[Future, Optional[Callable[[Any], None]]]] = []
+
+    def submit(self, fn: Callable[..., Any], *args: Any,
+               on_done: Optional[Callable[[Any], None]] = None) -> Future:
+        """Run fn(*args) in the background; on_done(result) is called from
+        poll() on the main thread once it is done."""
+        future = self._pool.submit(fn, *args)
+        self._jobs.append((future, on_done))
+        return future
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._jobs)
+
+    def poll(self) -> None:
+        """Call every frame: hand finished results to their callbacks. A job
+        that raised is reported and skipped, so the game still starts."""
+        if not self._jobs:
+            return
+        waiting = []
+        for future, on_done in self._jobs:
+            if not future.done():
+                waiting.append((future, on_done))
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"[warn] preload failed: {e}")
+                continue
+            if on_done is not None:
+                on_done(result)
+        self._jobs = waiting
+
+    def shutdown(self) -> None:
+        """Drop jobs not yet started and wait for the running one (call
+        before pygame.quit())."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
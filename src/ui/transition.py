@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 import pygame
+from . import card_cache
 from .constants import WIDTH, HEIGHT, CARD_BACK, PURPLE, NEON, NEON_GLOW, TEXT_MAIN
 
 _DURATION = 40
@@ -155,7 +156,7 @@ class CardSweepTransition:
         self._active    = True
         self._switched  = False
         self._on_switch = on_switch
-        back = _make_card_back_surf()
+        back = card_cache.get('back', (_CS_W, _CS_H), "sweep", _make_card_back_surf)
         self._full_back = back
         fly_frame_count = int(_CS_DURATION * _CS_FLY_END) + 1
         self._fly_frames = []
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import math
-import os
 import random
 import pygame
 
@@ -12,6 +11,7 @@ from .constants import (
     TEXT_MAIN, TEXT_DIM, BTN_RADIUS, GOLD,
 )
 from ..core.card import Card, Suit, RANKS_32
+from . import assets, card_cache
 
 # ── extra colours ─────────────────────────────────────────────────────────────
 _GREEN   = (60,  220, 120)
@@ -33,32 +33,16 @@ CW, CH = 76, 110
 
 # ── card rendering ────────────────────────────────────────────────────────────
 
-def _load_images() -> dict:
-    d    = os.path.join(os.path.dirname(__file__), 'assets', 'cards')
-    imgs = {}
-    sm   = {'♥': 'hearts', '♦': 'diamonds', '♠': 'spades', '♣': 'clubs'}
-    rm   = {'A': 'ace', 'J': 'jack', 'Q': 'queen', 'K': 'king',
-            **{str(i): str(i) for i in range(2, 11)}}
-    try:
-        for ss, sn in sm.items():
-            for rs, rn in rm.items():
-                k = f'{rs}{ss}'
-                p = os.path.join(d, f'{rn}_of_{sn}.png')
-                if os.path.exists(p):
-                    imgs[k] = pygame.image.load(p).convert_alpha()
-        bp = os.path.join(d, 'back.png')
-        if os.path.exists(bp):
-            imgs['back'] = pygame.image.load(bp).convert_alpha()
-    except Exception as e:
-        print(f'[tutorial] {e}')
-    return imgs
-
-
 def _csurf(card: Card, imgs: dict, font, w=CW, h=CH) -> pygame.Surface:
+    """Card face at (w, h), from the shared card cache. Shared: copy to alter."""
     k = f'{card.rank}{card.suit.value}'
     b = imgs.get(k)
     if b:
-        return pygame.transform.smoothscale(b, (w, h))
+        return card_cache.get(k, (w, h), "smooth", lambda: pygame.transform.smoothscale(b, (w, h)))
+    return card_cache.get(k, (w, h), "tutorial", lambda: _draw_face(card, font, w, h))
+
+
+def _draw_face(card: Card, font, w: int, h: int) -> pygame.Surface:
     s  = pygame.Surface((w, h), pygame.SRCALPHA)
     rc = CARD_RED if card.suit.value in ('♥', '♦') else CARD_BLACK
     pygame.draw.rect(s, CARD_BG,     (0, 0, w, h), border_radius=5)
@@ -69,9 +53,14 @@ def _csurf(card: Card, imgs: dict, font, w=CW, h=CH) -> pygame.Surface:
 
 
 def _bsurf(imgs: dict, w=CW, h=CH) -> pygame.Surface:
+    """Card back at (w, h), from the shared card cache. Shared: copy to alter."""
     b = imgs.get('back')
     if b:
-        return pygame.transform.smoothscale(b, (w, h))
+        return card_cache.get('back', (w, h), "smooth", lambda: pygame.transform.smoothscale(b, (w, h)))
+    return card_cache.get('back', (w, h), "tutorial", lambda: _draw_back(w, h))
+
+
+def _draw_back(w: int, h: int) -> pygame.Surface:
     s = pygame.Surface((w, h), pygame.SRCALPHA)
     pygame.draw.rect(s, CARD_BACK, (0, 0, w, h), border_radius=5)
     pygame.draw.rect(s, PURPLE,    (0, 0, w, h), width=1, border_radius=5)
@@ -1301,7 +1290,7 @@ class TutorialScreen:
         self.fonts     = fonts
         self._vignette = vignette
         self.tick      = 0
-        self.imgs      = _load_images()
+        self.imgs      = assets.acquire()   # shared; released in close()
 
         self._steps      = [cls() for cls in self._STEPS]
         self._idx        = 0
@@ -1336,6 +1325,10 @@ class TutorialScreen:
 
     # ── public ───────────────────────────────────────────────────────────────
 
+    def close(self) -> None:
+        """Release shared resources once this screen is dropped."""
+        self.imgs.release()
+
     def handle_event(self, ev) -> str | None:
         if ev.type == pygame.QUIT:
             return "menu"
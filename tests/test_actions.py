@@ -0,0 +1,48 @@
+import unittest
+from src.core.actions import (
+    ATTACKING, DEFENDING, TAKE, PASS, ATTACK, DEFEND, TRANSFER,
+    legal_actions, action_card, action_kind, encode,
+)
+from src.core.card import Card, Suit
+from src.core.deck import Deck
+from src.core.game import Game
+from src.core.player import Player
+
+
+def _game(hand0, hand1, trump=Suit.SPADES):
+    g = Game()
+    g.deck = Deck(cards=[], trump=trump)
+    g.players = [Player("a", list(hand0)), Player("b", list(hand1))]
+    return g
+
+
+class TestLegalActions(unittest.TestCase):
+    def test_round_trip(self):
+        c = Card(Suit.HEARTS, "Q")
+        for kind in (ATTACK, DEFEND, TRANSFER):
+            a = encode(kind, c)
+            self.assertLess(a, 256)
+            self.assertEqual((action_kind(a), action_card(a)), (kind, c))
+
+    def test_opening_and_pile_on(self):
+        h0 = [Card(Suit.HEARTS, "9"), Card(Suit.CLUBS, "9"), Card(Suit.CLUBS, "K")]
+        g = _game(h0, [Card(Suit.HEARTS, "A")])
+        self.assertEqual(len(legal_actions(g, ATTACKING)), 3)   # no PASS on an empty table
+        g.players[0].remove_card(h0[0])
+        g.table.add_attack(h0[0])
+        # defender holds one card and already faces one undefended attack
+        self.assertEqual(legal_actions(g, ATTACKING), [PASS])
+
+    def test_defend_transfer_take(self):
+        atk = Card(Suit.HEARTS, "9")
+        h1  = [Card(Suit.HEARTS, "10"), Card(Suit.CLUBS, "9"), Card(Suit.DIAMONDS, "A")]
+        g = _game([Card(Suit.CLUBS, "6"), Card(Suit.CLUBS, "7")], h1)
+        g.table.add_attack(atk)
+        plain = legal_actions(g, DEFENDING)
+        self.assertEqual(plain, [encode(DEFEND, h1[0]), TAKE])
+        with_transfer = legal_actions(g, DEFENDING, transfer_mode=True)
+        self.assertIn(encode(TRANSFER, h1[1]), with_transfer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import importlib.util
+import os
+import unittest
+
+HAS_PYGAME = importlib.util.find_spec("pygame") is not None
+
+if HAS_PYGAME:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from src.ui import assets
+
+
+@unittest.skipUnless(HAS_PYGAME, "pygame not installed")
+class PreloadTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        assets.unload()
+        self.paths = assets._sources()[:3]
+        if not self.paths:
+            self.skipTest("card images missing")
+
+    def tearDown(self):
+        assets.unload()
+
+    def test_conversion_takes_the_decoded_copy(self):
+        assets.preload()
+        self.assertIn(self.paths[0], assets._decoded)
+        assets._image(self.paths[0])
+        self.assertNotIn(self.paths[0], assets._decoded)
+
+    def test_preload_after_conversion_keeps_nothing(self):
+        for path in self.paths:         # the main thread got there first
+            assets._image(path)
+        assets.preload()
+        for path in self.paths:
+            self.assertNotIn(path, assets._decoded)
+
+
+if __name__ == "__main__":
+    unittest.main()
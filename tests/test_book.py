@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+from src.core.book import BookPolicy, OpeningBook, build
+from src.core.engine import HeadlessEngine, GreedyPolicy
+
+
+class TestOpeningBook(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.book = build(12, rollouts=2, workers=1, shard_size=4)
+
+    def test_save_and_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "book.fhob")
+            self.book.save(path)
+            loaded = OpeningBook.load(path)
+        self.assertEqual(list(loaded.keys), list(self.book.keys))
+        self.assertEqual(loaded.actions, self.book.actions)
+        self.assertEqual(list(loaded.keys), sorted(loaded.keys))
+
+    def test_lookup_hits_book_deals_only_at_the_opening(self):
+        engine = HeadlessEngine([GreedyPolicy()] * 2)
+        for seed in range(12):
+            m = engine.new_game(seed)
+            m.start()
+            action = self.book.lookup(m)
+            self.assertIn(action, m.legal_actions())
+            m.apply(action)
+            self.assertIsNone(self.book.lookup(m))
+        misses = 0
+        for seed in range(1000, 1020):
+            m = engine.new_game(seed)
+            m.start()
+            misses += self.book.lookup(m) is None
+        self.assertGreater(misses, 0)
+
+    def test_book_policy_plays_legal_games(self):
+        engine = HeadlessEngine([BookPolicy(self.book), GreedyPolicy()])
+        for seed in range(6):
+            engine.play(seed)
+
+
+if __name__ == "__main__":
+    unittest.main()
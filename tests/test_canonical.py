@@ -0,0 +1,70 @@
+import random
+import unittest
+from dataclasses import replace
+from src.core.canonical import (
+    FRAME_TRUMP, canonical_hand, canonical_snapshot, invert, permute_action, permute_card,
+)
+from src.core.card import CARDS, Suit
+from src.core.cardset import permute_suits
+from src.core.deck import Deck
+from src.core.engine import HeadlessEngine, GreedyPolicy
+from src.core.record import restore_snapshot, take_snapshot
+
+_SUITS = list(Suit)
+
+
+def _relabel(snap, deck, perm):
+    """The same position with every suit lane i renamed to perm[i]."""
+    snap = replace(snap,
+                   hands=tuple(permute_suits(h, perm) for h in snap.hands),
+                   attacks=tuple(permute_card(c, perm) for c in snap.attacks),
+                   defences=tuple(permute_card(c, perm) if c >= 0 else -1 for c in snap.defences))
+    trump = _SUITS[perm[_SUITS.index(deck.trump)]]
+    return snap, Deck(cards=[CARDS[permute_card(c.id, perm)] for c in deck.cards],
+                      trump=trump, pos=deck.pos)
+
+
+class TestCanonical(unittest.TestCase):
+    def test_relabeled_hands_share_a_form(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            hand  = sum(1 << c for c in rng.sample(range(36), rng.randint(0, 8)))
+            trump = rng.choice(_SUITS)
+            perm  = tuple(rng.sample(range(4), 4))
+            canon, p = canonical_hand(hand, trump)
+            self.assertEqual(permute_suits(hand, p), canon)
+            self.assertEqual(permute_suits(canon, invert(p)), hand)
+            moved = _SUITS[perm[_SUITS.index(trump)]]
+            self.assertEqual(canonical_hand(permute_suits(hand, perm), moved)[0], canon)
+
+    def test_canonical_games_are_equivalent(self):
+        rng = random.Random(1)
+        for seed in range(8):
+            m = HeadlessEngine([GreedyPolicy()] * 2, transfer_mode=seed % 2 == 1).new_game(seed)
+            m.start()
+            while not m.over:
+                snap, deck = take_snapshot(m, 0), m.game.deck
+                csnap, cdeck, p = canonical_snapshot(snap, deck)
+                self.assertEqual(cdeck.trump, FRAME_TRUMP)
+                canon = restore_snapshot(csnap, cdeck, transfer_mode=m.transfer_mode)
+                self.assertEqual(sorted(canon.legal_actions()),
+                                 sorted(permute_action(a, p) for a in m.legal_actions()))
+                # any relabeling of the same game lands on the same form
+                other = canonical_snapshot(*_relabel(snap, deck, tuple(rng.sample(range(4), 4))))
+                self.assertEqual(other[0], csnap)
+                self.assertEqual(other[1].cards, cdeck.cards)
+                m.apply(rng.choice(m.legal_actions()))
+
+    def test_draw_order_breaks_ties_between_lanes(self):
+        # two plain lanes with the same cards in the deck, drawn in another order
+        m = HeadlessEngine([GreedyPolicy()] * 2).new_game(0)
+        m.start()
+        snap  = replace(take_snapshot(m, 0), hands=(0, 0), attacks=(), defences=())
+        order = [0, 9, 10, 1, 27]      # clubs 6, diamonds 6, diamonds 7, clubs 7, spades 6
+        deck  = Deck(cards=[CARDS[c] for c in order], trump=Suit.SPADES, pos=0)
+        swap  = canonical_snapshot(*_relabel(snap, deck, (1, 0, 2, 3)))
+        self.assertEqual(swap[1].cards, canonical_snapshot(snap, deck)[1].cards)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,19 @@
+import itertools
 import unittest
-from src.core.card import Card, Suit
+from src.core.card import Card, Suit, RANKS_32, CARDS
+from src.core.cardset import beaters, cards_of
+
+
+def _ref_beats(d, a, trump):
+    """The rules as originally written, on rank positions rather than tables."""
+    dv, av = RANKS_32.index(d.rank), RANKS_32.index(a.rank)
+    if d.suit == a.suit:
+        return dv > av
+    return d.suit == trump and a.suit != trump
+
+
+def _ref_sort_key(c, trump):
+    return (1 if c.suit == trump else 0, RANKS_32.index(c.rank), list(Suit).index(c.suit))
 
 
 class TestCardRules(unittest.TestCase):
@@ -17,6 +31,20 @@ class TestCardRules(unittest.TestCase):
         self.assertTrue(b.can_beat(a, trump))
         self.assertFalse(a.can_beat(b, trump))
 
+    def test_tables_match_reference_rules(self):
+        for trump in Suit:
+            for d, a in itertools.product(CARDS, CARDS):
+                self.assertEqual(d.can_beat(a, trump), _ref_beats(d, a, trump))
+            for a in CARDS:
+                self.assertEqual(set(cards_of(beaters(a, trump))),
+                                 {d for d in CARDS if _ref_beats(d, a, trump)})
+            by_table = sorted(CARDS, key=lambda c: c.sort_key(trump))
+            self.assertEqual(by_table, sorted(CARDS, key=lambda c: _ref_sort_key(c, trump)))
+
+    def test_off_deck_rank_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Card(Suit.HEARTS, "2")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from src.core.card import Card, Suit
+from src.core.cardset import (
+    ALL_CARDS, FULL_DECK, mask_of, cards_of, rank_bits, same_rank_cards, beaters,
+)
+from src.core.move_validator import MoveValidator
+from src.core.table import Table
+
+
+class TestCardSet(unittest.TestCase):
+    def test_round_trip(self):
+        cards = [Card(Suit.HEARTS, "9"), Card(Suit.CLUBS, "A"), Card(Suit.SPADES, "6")]
+        self.assertEqual(set(cards_of(mask_of(cards))), set(cards))
+        self.assertEqual(mask_of(ALL_CARDS), FULL_DECK)
+
+    def test_rank_folding(self):
+        m = mask_of([Card(Suit.HEARTS, "9"), Card(Suit.CLUBS, "9")])
+        self.assertEqual(rank_bits(m), 1 << 3)
+        nines = [c for c in ALL_CARDS if c.rank == "9"]
+        self.assertEqual(same_rank_cards(m), mask_of(nines))
+
+    def test_beaters_spot_checks(self):
+        nine_h = Card(Suit.HEARTS, "9")
+        self.assertEqual(set(cards_of(beaters(nine_h, Suit.SPADES))),
+                         {Card(Suit.HEARTS, r) for r in ("10", "J", "Q", "K", "A")}
+                         | {c for c in ALL_CARDS if c.suit == Suit.SPADES})
+        self.assertEqual(set(cards_of(beaters(Card(Suit.SPADES, "K"), Suit.SPADES))),
+                         {Card(Suit.SPADES, "A")})
+
+    def test_validator_transfer(self):
+        v = MoveValidator(Suit.SPADES)
+        table = Table()
+        table.add_attack(Card(Suit.HEARTS, "9"))
+        hand = [Card(Suit.CLUBS, "9"), Card(Suit.CLUBS, "10")]
+        self.assertEqual(v.valid_transfers(hand, table), [Card(Suit.CLUBS, "9")])
+        self.assertEqual(v.valid_transfers(hand, table, new_defender_hand=[hand[1]]), [])
+        table.add_defence(0, Card(Suit.HEARTS, "K"))
+        self.assertEqual(v.valid_transfers(hand, table), [])
+        self.assertEqual(v.valid_attacks(hand, table), [Card(Suit.CLUBS, "9")])
+
+
+if __name__ == "__main__":
+    unittest.main()
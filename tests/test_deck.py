@@ -0,0 +1,41 @@
+import unittest
+from src.core.card import CARDS
+from src.core.deck import Deck
+
+
+def _deck():
+    return Deck(cards=list(CARDS), trump=CARDS[-1].suit)
+
+
+class TestDeck(unittest.TestCase):
+    def test_deal_round_robin_in_chunks(self):
+        deck  = _deck()
+        hands = deck.deal(2, 6)
+        self.assertEqual(hands[0], CARDS[0:2] + CARDS[4:6] + CARDS[8:10])
+        self.assertEqual(hands[1], CARDS[2:4] + CARDS[6:8] + CARDS[10:12])
+        self.assertEqual(deck.remaining(), 24)
+
+    def test_deal_caps_each_hand_with_a_short_last_chunk(self):
+        self.assertEqual([len(h) for h in _deck().deal(2, 5)], [5, 5])
+        self.assertEqual([len(h) for h in _deck().deal(3, 1)], [1, 1, 1])
+        hands = _deck().deal(2, 3)
+        self.assertEqual(hands, [CARDS[0:2] + CARDS[4:5], CARDS[2:4] + CARDS[5:6]])
+        with self.assertRaises(ValueError):
+            _deck().deal(2, 6, chunk=0)
+
+    def test_draw_many_past_the_end_and_stable_trump(self):
+        deck   = _deck()
+        bottom = deck.peek_bottom()
+        self.assertEqual(deck.draw_many(30), CARDS[:30])
+        self.assertEqual(deck.peek_bottom(), bottom)
+        self.assertEqual(deck.draw_many(10), CARDS[30:])
+        self.assertEqual(deck.draw_many(3), [])
+        self.assertEqual((deck.remaining(), deck.mask()), (0, 0))
+        with self.assertRaises(IndexError):
+            deck.draw()
+        with self.assertRaises(IndexError):
+            deck.peek_bottom()
+
+
+if __name__ == "__main__":
+    unittest.main()
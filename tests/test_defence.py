@@ -0,0 +1,56 @@
+import itertools
+import random
+import unittest
+from src.core.card import Card, Suit
+from src.core.cardset import BEATERS
+from src.core.defence import CoverPolicy, cover, cover_table, defence_cost
+from src.core.engine import HeadlessEngine, GreedyPolicy
+from src.core.table import Table, BattlePair
+
+
+def _brute(attacks, hand, trump):
+    """Cheapest cover by trying every ordered choice of hand cards."""
+    cards = [c for c in range(36) if hand >> c & 1]
+    best  = None
+    for defs in itertools.permutations(cards, len(attacks)):
+        if all(BEATERS[trump][a] >> d & 1 for a, d in zip(attacks, defs)):
+            cost = sum(defence_cost(d, trump) for d in defs)
+            best = cost if best is None else min(best, cost)
+    return best
+
+
+class TestCover(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            trump = rng.choice(list(Suit))
+            cards = rng.sample(range(36), 12)
+            n     = rng.randint(1, 4)
+            attacks, hand = cards[:n], sum(1 << c for c in cards[n:n + rng.randint(n, 8)])
+            plan = cover(attacks, hand, trump)
+            want = _brute(attacks, hand, trump)
+            if want is None:
+                self.assertIsNone(plan)
+                continue
+            cost, defs = plan
+            self.assertEqual(cost, want)
+            self.assertEqual(len(set(defs)), n)
+            for a, d in zip(attacks, defs):
+                self.assertTrue(hand >> d & 1 and BEATERS[trump][a] >> d & 1)
+
+    def test_cover_table_saves_the_trump_for_the_card_that_needs_it(self):
+        trump = Suit.SPADES
+        table = Table(pairs=[BattlePair(Card(Suit.HEARTS, "7")), BattlePair(Card(Suit.CLUBS, "K"))])
+        hand  = sum(1 << c.id for c in (Card(Suit.HEARTS, "8"), Card(Suit.SPADES, "6")))
+        cost, defs = cover_table(table, hand, trump)
+        self.assertEqual([str(c) for c in defs], ["8♥", "6♠"])
+        self.assertIsNone(cover_table(table, 1 << Card(Suit.SPADES, "6").id, trump))
+
+    def test_policy_plays_legal_games(self):
+        engine = HeadlessEngine([CoverPolicy(), GreedyPolicy()], transfer_mode=True)
+        for seed in range(20):
+            engine.play(seed)
+
+
+if __name__ == "__main__":
+    unittest.main()
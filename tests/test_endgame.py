@@ -0,0 +1,74 @@
+import random
+import unittest
+from src.core.endgame import EndgamePolicy, EndgameSolver, is_endgame, position_of
+from src.core.engine import HeadlessEngine, GreedyPolicy
+from src.core.record import restore_snapshot, take_snapshot
+
+
+def _endgames(n, transfer_mode, max_cards=36):
+    """(seed, machine) at the first empty-deck decision of random games with
+    at most max_cards left in the hands."""
+    engine = HeadlessEngine([GreedyPolicy(), GreedyPolicy()], transfer_mode=transfer_mode)
+    for seed in range(n):
+        m = engine.new_game(seed)
+        m.start()
+        rng = random.Random(seed)
+        while not m.over and not (
+                is_endgame(m) and sum(len(p.hand) for p in m.game.players) <= max_cards):
+            m.apply(rng.choice(m.legal_actions()))
+        if not m.over:
+            yield seed, m
+
+
+def _minimax(m, seat, memo):
+    """Brute force over real machines: best reachable outcome for seat.
+    Without transfers every round sheds cards, so positions never repeat."""
+    if m.over:
+        return 0.5 if m.loser is None else float(m.loser != seat)
+    key = position_of(m)[-1]
+    if key not in memo:
+        vals = []
+        for a in m.legal_actions():
+            child = restore_snapshot(take_snapshot(m, 0), m.game.deck)
+            child.apply(a)
+            vals.append(_minimax(child, seat, memo))
+        memo[key] = max(vals) if m.to_move() == seat else min(vals)
+    return memo[key]
+
+
+class TestEndgameSolver(unittest.TestCase):
+    def test_position_rules_match_state_machine(self):
+        for transfer_mode in (False, True):
+            for seed, m in _endgames(30, transfer_mode):
+                solver = EndgameSolver(m.game.deck.trump, transfer_mode=transfer_mode)
+                rng = random.Random(seed)
+                pos = position_of(m)
+                while not m.over:
+                    self.assertEqual(sorted(solver.legal(pos)), m.legal_actions())
+                    action = rng.choice(m.legal_actions())
+                    m.apply(action)
+                    pos = solver.apply(pos, action)
+                    if m.over:
+                        self.assertEqual(pos, 0.5 if m.loser is None else float(m.loser == 1))
+                    else:
+                        self.assertEqual(pos, position_of(m))
+
+    def test_values_match_brute_force(self):
+        checked = 0
+        for seed, m in _endgames(20, False, max_cards=6):
+            solver = EndgameSolver(m.game.deck.trump)
+            value, action = solver.solve(m)
+            self.assertEqual(value, _minimax(m, m.to_move(), {}))
+            self.assertIn(action, m.legal_actions())
+            checked += 1
+        self.assertGreater(checked, 3)
+
+    def test_policy_plays_legal_games(self):
+        engine = HeadlessEngine([EndgamePolicy(max_nodes=20_000), GreedyPolicy()],
+                                transfer_mode=True)
+        for seed in range(4):
+            self.assertGreater(engine.play(seed).rounds, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
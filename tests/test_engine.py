@@ -0,0 +1,32 @@
+import importlib.util
+import unittest
+from src.core.engine import HeadlessEngine, GreedyPolicy, WIN, LOSS, TIE
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class TestHeadlessEngine(unittest.TestCase):
+    def test_games_finish_and_are_reproducible(self):
+        engine = HeadlessEngine([GreedyPolicy(), GreedyPolicy()])
+        a = engine.run(50).results
+        b = engine.run(50).results
+        self.assertEqual([(r.loser, r.plies) for r in a], [(r.loser, r.plies) for r in b])
+        for r in a:
+            self.assertIn(r.outcome(0), (WIN, LOSS, TIE))
+            self.assertGreater(r.rounds, 0)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_batch_simulator_matches_engine(self):
+        from src.core.batch_sim import BatchSimulator
+        seeds  = range(200)
+        batch  = BatchSimulator.from_seeds(seeds).run()
+        engine = HeadlessEngine([GreedyPolicy(), GreedyPolicy()])
+        for s in seeds:
+            r = engine.play(s)
+            self.assertEqual(int(batch.loser[s]), -1 if r.loser is None else r.loser)
+            self.assertEqual(int(batch.plies[s]), r.plies)
+            self.assertEqual(list(batch.piles_taken[s]), r.piles_taken)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import importlib.util
+import os
+import unittest
+
+HAS_PYGAME = importlib.util.find_spec("pygame") is not None
+
+if HAS_PYGAME:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from src.ui import glyph_text
+    from src.ui.constants import FONT_PATH
+
+
+def _pixels(surf):
+    """surf drawn over a solid background, as raw RGB bytes."""
+    out = pygame.Surface(surf.get_size())
+    out.fill((10, 20, 30))
+    out.blit(surf, (0, 0))
+    return pygame.image.tobytes(out, "RGB")
+
+
+@unittest.skipUnless(HAS_PYGAME, "pygame not installed")
+class GlyphTextTests(unittest.TestCase):
+    TEXTS = ["IAU CĂRȚILE", "Și ț ș Ț Ș", "ВЗЯТЬ КАРТЫ ёЁ", "FOOL'S HAND 3/12", ""]
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        glyph_text.invalidate_cache()
+
+    def test_matches_font_render(self):
+        for size in (8, 16, 32):
+            font = pygame.font.Font(FONT_PATH, size)
+            for text in self.TEXTS:
+                for colour in [(255, 255, 255), (0, 0, 0), (120, 200, 60)]:
+                    want = font.render(text, False, colour)
+                    got  = glyph_text.render(font, text, colour)
+                    self.assertEqual(got.get_size(), want.get_size(), (size, text))
+                    self.assertEqual(_pixels(got), _pixels(want), (size, text, colour))
+
+    def test_draw_matches_render(self):
+        font   = pygame.font.Font(FONT_PATH, 16)
+        atlas  = glyph_text.atlas(font, (255, 200, 60))
+        text   = "Ș ВЗЯТЬ"
+        target = pygame.Surface(atlas.size(text))
+        target.fill((10, 20, 30))
+        atlas.draw(target, text, (0, 0))
+        self.assertEqual(pygame.image.tobytes(target, "RGB"),
+                         _pixels(font.render(text, False, (255, 200, 60))))
+
+    def test_render_is_kept_and_faded_copy_is_separate(self):
+        font  = pygame.font.Font(FONT_PATH, 8)
+        plain = glyph_text.render(font, "BOT", (255, 255, 255))
+        self.assertIs(glyph_text.render(font, "BOT", (255, 255, 255)), plain)
+        faded = glyph_text.render(font, "BOT", (255, 255, 255), 100)
+        self.assertIsNot(faded, plain)
+        self.assertEqual(faded.get_alpha(), 100)
+        self.assertIn(plain.get_alpha(), (None, 255))
+
+    def test_atlas_grows_for_every_locale_glyph(self):
+        font  = pygame.font.Font(FONT_PATH, 32)
+        atlas = glyph_text.atlas(font, (255, 255, 255))
+        atlas.warm()
+        for ch in "ȘșȚțĂăÂâÎîЖЯё":
+            self.assertEqual(atlas.rects[ch].size, font.size(ch))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+from src.core.engine import HeadlessEngine, GreedyPolicy
+from src.core.ismcts import ISMCTSPolicy, RootParallelISMCTSPolicy, determinize
+
+
+class TestISMCTS(unittest.TestCase):
+    def test_determinize_keeps_public_cards(self):
+        engine = HeadlessEngine([GreedyPolicy(), GreedyPolicy()])
+        m = engine.new_game(3)
+        m.start()
+        for _ in range(6):
+            m.apply(GreedyPolicy().choose(m))
+        g = m.game
+        seen = set(g.players[0].hand) | set(g.table.all_cards())
+        for seed in range(20):
+            d = determinize(m, 0, random.Random(seed)).game
+            self.assertEqual(d.players[0].hand, g.players[0].hand)
+            self.assertEqual(str(d.table), str(g.table))
+            self.assertEqual(len(d.players[1].hand), len(g.players[1].hand))
+            self.assertEqual(d.deck.remaining(), g.deck.remaining())
+            self.assertEqual(d.deck.peek_bottom(), g.deck.peek_bottom())
+            cards = [c for p in d.players for c in p.hand] + d.table.all_cards() \
+                + d.deck.cards[d.deck.pos:]
+            self.assertEqual(len(set(cards)), len(cards))
+            self.assertFalse(seen & set(d.players[1].hand))
+
+    def test_plays_legal_games_and_reuses_tree(self):
+        bot = ISMCTSPolicy(budget_ms=10_000, max_iterations=30, seed=0)
+        for seed in range(2):
+            res = HeadlessEngine([bot, GreedyPolicy()], transfer_mode=seed == 1).play(seed)
+            self.assertGreater(res.rounds, 0)
+
+        # a fresh root never gets visits; a subtree kept from the last search does
+        m = HeadlessEngine([bot, GreedyPolicy()]).new_game(5)
+        m.start()
+        reused = 0
+        while not m.over:
+            if m.to_move() == 0:
+                action = bot.choose(m)
+                reused += bot._root.visits > 0
+            else:
+                action = GreedyPolicy().choose(m)
+            m.apply(action)
+        self.assertGreater(reused, 0)
+
+    def test_root_parallel_merges_worker_searches(self):
+        bot = RootParallelISMCTSPolicy(budget_ms=10_000, max_iterations=10, workers=2, seed=0)
+        try:
+            m = HeadlessEngine([bot, GreedyPolicy()]).new_game(7)
+            m.start()
+            searched = []
+            while not m.over:
+                if m.to_move() == 0:
+                    action = bot.choose(m)
+                    searched.append(bot.iterations)
+                else:
+                    action = GreedyPolicy().choose(m)
+                self.assertIn(action, m.legal_actions())
+                m.apply(action)
+            self.assertIn(20, searched)
+        finally:
+            bot.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+from src.core.cardset import FULL_DECK
+from src.core.engine import HeadlessEngine, GreedyPolicy
+from src.core.ismcts import determinize
+from src.core.knowledge import CardKnowledge
+from src.core.state_machine import EV_PICKUP
+
+
+class TestCardKnowledge(unittest.TestCase):
+    def test_tracks_hands_pickups_and_discards(self):
+        rng = random.Random(0)
+        for seed in range(12):
+            m = HeadlessEngine([GreedyPolicy()] * 3, transfer_mode=seed % 2 == 1).new_game(seed)
+            trackers = [CardKnowledge.attach(m, s) for s in range(3)]
+            picked   = [0] * 3
+            m.add_listener(lambda ev: ev.kind == EV_PICKUP and picked.__setitem__(
+                ev.seat, picked[ev.seat] | sum(1 << c.id for c in ev.cards)))
+            m.start()
+            while not m.over:
+                m.apply(rng.choice(m.legal_actions()))
+                g = m.game
+                hands = [p.hand_mask() for p in g.players]
+                in_play = g.deck.mask() | g.table.mask()
+                for h in hands:
+                    in_play |= h
+                for k in trackers:
+                    self.assertEqual(k.known[k.seat], hands[k.seat])
+                    self.assertEqual(k.discarded, FULL_DECK ^ in_play)
+                    for s in range(3):
+                        self.assertEqual(k.known[s] & ~hands[s], 0)
+                        # whatever was picked up in the open and not played since
+                        self.assertEqual(k.known[s] & picked[s] & hands[s], picked[s] & hands[s])
+                    # the unseen cards are exactly the other hands' unknown part and the hidden deck
+                    hidden = g.deck.mask() & ~(1 << g.deck.cards[-1].id) if g.deck.remaining() else 0
+                    for s in range(3):
+                        hidden |= hands[s] & ~k.known[s]
+                    self.assertEqual(k.unseen(g.table.mask()), hidden)
+
+    def test_determinize_keeps_known_cards_in_place(self):
+        rng = random.Random(1)
+        checked = 0
+        for seed in range(10):
+            m = HeadlessEngine([GreedyPolicy()] * 2).new_game(seed)
+            k = CardKnowledge.attach(m, 0)
+            m.start()
+            while not m.over:
+                if k.known[1]:
+                    d = determinize(m, 0, rng, k).game
+                    self.assertEqual(d.players[1].hand_mask() & k.known[1], k.known[1])
+                    self.assertEqual(len(d.players[1].hand), len(m.game.players[1].hand))
+                    self.assertEqual(d.deck.remaining(), m.game.deck.remaining())
+                    checked += 1
+                m.apply(GreedyPolicy().choose(m))
+            k.detach()
+        self.assertGreater(checked, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
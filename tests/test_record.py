@@ -0,0 +1,41 @@
+import io
+import unittest
+from src.core.engine import HeadlessEngine, GreedyPolicy
+from src.core.record import GameRecord, HEADER_SIZE, Replayer, iter_records, write_records
+
+
+def _state(m):
+    g = m.game
+    return ([p.hand for p in g.players], g.deck.pos, str(g.table),
+            g.attacker_idx, g.defender_idx, m.phase, m.round, m.over, m.loser)
+
+
+class TestGameRecord(unittest.TestCase):
+    def setUp(self):
+        engine = HeadlessEngine([GreedyPolicy(), GreedyPolicy()],
+                                transfer_mode=True, record=True)
+        self.results = [engine.play(seed) for seed in range(5)]
+
+    def test_bytes_round_trip(self):
+        records = [r.record for r in self.results]
+        buf = io.BytesIO()
+        size = write_records(buf, records)
+        self.assertEqual(size, sum(HEADER_SIZE + len(r) for r in records))
+        self.assertEqual(list(iter_records(buf.getvalue())), records)
+        self.assertTrue(records[0].transfer_mode)
+        with self.assertRaises(ValueError):
+            GameRecord.from_bytes(records[0].to_bytes()[:-1])
+
+    def test_seek_matches_straight_replay(self):
+        for res in self.results:
+            straight = Replayer(res.record, snapshot_every=10_000)
+            seek     = Replayer(res.record, snapshot_every=7)
+            for ply in range(len(res.record) + 1):
+                self.assertEqual(_state(seek.machine_at(ply)), _state(straight.machine_at(ply)))
+            end = seek.machine_at(len(seek))
+            self.assertTrue(end.over)
+            self.assertEqual(end.loser, res.loser)
+
+
+if __name__ == "__main__":
+    unittest.main()
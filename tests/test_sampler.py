@@ -0,0 +1,79 @@
+import random
+import unittest
+from collections import Counter
+from src.core.cardset import FULL_DECK, card_bit, mask_of
+from src.core.engine import HeadlessEngine, GreedyPolicy
+from src.core.knowledge import CardKnowledge
+from src.core.sampler import DealSampler
+
+
+def _play_until_pickup(seed):
+    """A game (with seat 0's tracker) just after seat 1 picked up in the open."""
+    m = HeadlessEngine([GreedyPolicy()] * 2).new_game(seed)
+    k = CardKnowledge.attach(m, 0)
+    m.start()
+    while not m.over and not k.known[1]:
+        m.apply(GreedyPolicy().choose(m))
+    return m, k
+
+
+class TestDealSampler(unittest.TestCase):
+    def test_deals_respect_every_constraint(self):
+        rng = random.Random(0)
+        for seed in range(10):
+            m, k = _play_until_pickup(seed)
+            if m.over:
+                continue
+            g, sampler = m.game, DealSampler(m, 0, k)
+            for hands, rest in [sampler.sample(rng) for _ in range(25)] + sampler.sample_many(25, rng):
+                self.assertEqual(hands[0], g.players[0].hand_mask())
+                self.assertEqual(hands[1] & k.known[1], k.known[1])
+                self.assertEqual(hands[1].bit_count(), len(g.players[1].hand))
+                self.assertEqual(len(rest) + 1 if g.deck.remaining() else len(rest),
+                                 g.deck.remaining())
+                cards = hands[0] | hands[1] | mask_of(rest) | g.table.mask() | k.discarded
+                if g.deck.remaining():
+                    cards |= card_bit(g.deck.peek_bottom())
+                self.assertEqual(cards, FULL_DECK)
+                d = sampler.restore(hands, rest).game
+                self.assertEqual(d.deck.cards[-1], g.deck.cards[-1])
+
+    def test_unknown_cards_are_spread_evenly(self):
+        m, k = _play_until_pickup(4)
+        sampler, rng = DealSampler(m, 0, k), random.Random(1)
+        free  = sampler._unseen
+        need  = dict(sampler._need)[1]
+        n     = 4000
+        seen  = Counter()
+        for _ in range(n):
+            hands, _ = sampler.sample(rng)
+            for c in free:
+                seen[c] += hands[1] >> c.id & 1
+        want = n * need / len(free)
+        for c in free:
+            self.assertLess(abs(seen[c] - want), 5 * want ** 0.5)
+
+    def test_sample_many_is_repeatable_and_spread_evenly(self):
+        m, k = _play_until_pickup(4)
+        sampler = DealSampler(m, 0, k)
+        self.assertEqual(sampler.sample_many(5, random.Random(2)),
+                         sampler.sample_many(5, random.Random(2)))
+        free, need, n = sampler._unseen, dict(sampler._need)[1], 4000
+        seen = Counter()
+        for hands, _ in sampler.sample_many(n, random.Random(3)):
+            for c in free:
+                seen[c] += hands[1] >> c.id & 1
+        want = n * need / len(free)
+        for c in free:
+            self.assertLess(abs(seen[c] - want), 5 * want ** 0.5)
+
+    def test_rejects_knowledge_from_another_game(self):
+        m, k = _play_until_pickup(3)
+        other = HeadlessEngine([GreedyPolicy()] * 2).new_game(4)
+        other.start()
+        with self.assertRaises(ValueError):
+            DealSampler(other, 0, k)
+
+
+if __name__ == "__main__":
+    unittest.main()
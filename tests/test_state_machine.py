@@ -0,0 +1,64 @@
+import random
+import unittest
+from src.core.actions import ATTACK, TAKE, PASS, TAKING, encode
+from src.core.card import Card, Suit
+from src.core.deck import Deck
+from src.core.game import Game
+from src.core.player import Player
+from src.core.state_machine import (
+    GameStateMachine, EV_DEAL, EV_DRAW, EV_GAME_OVER, EV_PICKUP, EV_ROUND_START,
+)
+
+
+def _machine(seed, transfer_mode=False):
+    g = Game(seed=seed)
+    g.setup_no_deal(num_players=2, quiet=True)
+    m = GameStateMachine(g, transfer_mode=transfer_mode)
+    events = []
+    m.add_listener(events.append)
+    m.deal(rng=random.Random(seed))
+    m.start()
+    return m, events
+
+
+class TestGameStateMachine(unittest.TestCase):
+    def test_random_games_finish_and_keep_every_card(self):
+        for seed in range(40):
+            m, events = _machine(seed, transfer_mode=seed % 2 == 1)
+            rng = random.Random(seed)
+            self.assertEqual(sum(e.kind == EV_DEAL for e in events), 12)
+            while not m.over:
+                m.apply(rng.choice(m.legal_actions()))
+                g = m.game
+                seen = [c for p in g.players for c in p.hand] + g.table.all_cards()
+                self.assertEqual(len(set(seen)), len(seen))
+            self.assertEqual(events[-1].kind, EV_GAME_OVER)
+            self.assertEqual(m.round, sum(e.kind == EV_ROUND_START for e in events))
+            self.assertEqual(m.legal_actions(), [])
+
+    def test_take_lets_attacker_pile_on_then_draw_up_order(self):
+        g = Game()
+        g.deck = Deck(cards=[Card(Suit.CLUBS, "6"), Card(Suit.CLUBS, "7"),
+                             Card(Suit.CLUBS, "8")], trump=Suit.SPADES)
+        nines = [Card(Suit.HEARTS, "9"), Card(Suit.CLUBS, "9")]
+        g.players = [Player("a", nines + [Card(Suit.HEARTS, "A")]),
+                     Player("b", [Card(Suit.DIAMONDS, "6"), Card(Suit.DIAMONDS, "7")])]
+        m = GameStateMachine(g)
+        events = []
+        m.add_listener(events.append)
+        m.start()
+        m.apply(encode(ATTACK, nines[0]))
+        m.apply(PASS)
+        m.apply(TAKE)
+        self.assertEqual(m.phase, TAKING)
+        m.apply(encode(ATTACK, nines[1]))
+        m.apply(PASS)
+        pickup = next(e for e in events if e.kind == EV_PICKUP)
+        self.assertEqual(pickup.cards, nines)
+        # attacker keeps the lead; the short deck is shared one card at a time
+        self.assertEqual([e.seat for e in events if e.kind == EV_DRAW], [0, 1, 0])
+        self.assertEqual((g.attacker_idx, m.round), (0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
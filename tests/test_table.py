@@ -0,0 +1,55 @@
+import unittest
+from src.core.card import Card, Suit
+from src.core.cardset import mask_of, rank_bits
+from src.core.table import BattlePair, Table
+
+
+def _rescan(table):
+    attacks  = [p.attack for p in table.pairs]
+    defences = [p.defence for p in table.pairs if p.defence]
+    undefended = [i for i, p in enumerate(table.pairs) if p.defence is None]
+    return (attacks, defences, undefended[0] if undefended else None, len(undefended),
+            rank_bits(mask_of(attacks + defences)), mask_of(attacks), mask_of(defences))
+
+
+def _view(table):
+    return (table.attacks(), table.defences(), table.first_undefended_index(),
+            table.undefended_count(), table.rank_mask(),
+            table.attack_mask(), table.defence_mask())
+
+
+class TestTable(unittest.TestCase):
+    def test_incremental_state_matches_rescan(self):
+        table = Table()
+        for rank in ("6", "9", "K", "Q"):
+            table.add_attack(Card(Suit.HEARTS, rank))
+            self.assertEqual(_view(table), _rescan(table))
+        # defend out of order: third, second, fourth, then first
+        table.add_defence(2, Card(Suit.HEARTS, "A"))
+        self.assertEqual(_view(table), _rescan(table))
+        table.add_defence(1, Card(Suit.HEARTS, "10"))
+        self.assertEqual(table.first_undefended_index(), 0)
+        self.assertEqual(_view(table), _rescan(table))
+        table.add_defence(3, Card(Suit.SPADES, "7"))
+        self.assertEqual(_view(table), _rescan(table))
+        with self.assertRaises(ValueError):
+            table.add_defence(2, Card(Suit.SPADES, "6"))
+        table.add_defence(0, Card(Suit.HEARTS, "7"))
+        self.assertTrue(table.all_defended())
+        self.assertEqual(_view(table), _rescan(table))
+        self.assertEqual((table.attack_count(), table.defence_count()), (4, 4))
+
+        table.clear()
+        self.assertTrue(table.is_empty())
+        self.assertEqual(_view(table), ([], [], None, 0, 0, 0, 0))
+
+    def test_constructed_from_pairs(self):
+        pairs = [BattlePair(Card(Suit.CLUBS, "8"), Card(Suit.CLUBS, "J")),
+                 BattlePair(Card(Suit.DIAMONDS, "8"))]
+        table = Table(pairs=pairs)
+        self.assertEqual(_view(table), _rescan(table))
+        self.assertEqual(table.first_undefended_index(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
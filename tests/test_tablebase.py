@@ -0,0 +1,87 @@
+import itertools
+import os
+import random
+import tempfile
+import unittest
+from src.core.actions import ATTACKING
+from src.core.card import Suit
+from src.core.cardset import permute_suits
+from src.core.endgame import EndgameSolver, position_key
+from src.core.tablebase import (
+    FRAME_TRUMP, WIN, LOSS, TIE, RoundSolver, Tablebase, _defender_rank, block_size,
+    canonical, canonical_attackers, generate, to_frame,
+)
+
+_VALUE = {WIN: 1.0, LOSS: 0.0, TIE: 0.5}
+
+
+def _deal(rng, a, b):
+    cards = rng.sample(range(36), a + b)
+    return sum(1 << c for c in cards[:a]), sum(1 << c for c in cards[a:])
+
+
+class TestTablebase(unittest.TestCase):
+    def test_round_solver_matches_endgame_solver(self):
+        rng, rounds = random.Random(1), RoundSolver()
+        for _ in range(60):
+            att, dfn = _deal(rng, rng.randint(1, 4), rng.randint(1, 4))
+            solver = EndgameSolver(FRAME_TRUMP)
+            pos = (att, dfn, 0, ATTACKING, 0, 0, (), False,
+                   position_key(att, dfn, 0, ATTACKING, 0, 0, (), False))
+            outcome, n = rounds.value(att, dfn)
+            self.assertEqual(_VALUE[outcome], solver._search(pos, 0.0, 1.0))
+            self.assertGreaterEqual(n, 0 if outcome == TIE else 1)
+
+    def test_generate_resume_and_probe_every_trump(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "k1.fhtb")
+            generate(path, 1, workers=1)
+            with open(path, "rb") as fp:
+                full = fp.read()
+            # one byte per canonical position (18 attackers, 387 pairs), none empty
+            self.assertEqual(len(full), 6 + 4 + 8 * 18 + 8 * 19 + 387)
+            self.assertNotIn(0, full[-387:])
+            with open(path, "r+b") as fp:      # lose some results, then resume
+                fp.seek(len(full) - 300)
+                fp.write(bytes(200))
+            generate(path, 1, workers=1)
+            with open(path, "rb") as fp:
+                self.assertEqual(fp.read(), full)
+
+            tb, rounds, rng = Tablebase(path), RoundSolver(), random.Random(2)
+            try:
+                for _ in range(100):
+                    att, dfn = _deal(rng, 1, 1)
+                    trump = rng.choice(list(Suit))
+                    want  = rounds.value(to_frame(att, trump), to_frame(dfn, trump))
+                    self.assertEqual(tb.probe(att, dfn, trump), want)
+                self.assertIsNone(tb.probe(att | dfn, dfn, Suit.HEARTS))
+                for att in range(36):
+                    for dfn in range(36):
+                        if att != dfn:
+                            self.assertIsNotNone(tb.probe(1 << att, 1 << dfn, Suit.CLUBS))
+            finally:
+                tb.close()
+
+    def test_defender_ranks_fill_each_block(self):
+        for a in (1, 2):
+            for att in canonical_attackers(a):
+                for b in (1, 2):
+                    ranks = sorted(_defender_rank(att, dfn)
+                                   for dfn in (sum(1 << c for c in combo)
+                                               for combo in itertools.combinations(range(36), b))
+                                   if not dfn & att and canonical(att, dfn) == (att, dfn))
+                    self.assertEqual(ranks, list(range(block_size(att, b))))
+
+    def test_suit_relabelling_preserves_values(self):
+        rng, rounds = random.Random(3), RoundSolver()
+        for _ in range(30):
+            att, dfn = _deal(rng, 2, 3)
+            perm = rng.sample(range(3), 3) + [3]
+            self.assertEqual(rounds.value(att, dfn),
+                             RoundSolver().value(permute_suits(att, perm),
+                                                 permute_suits(dfn, perm)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import functools
+import unittest
+from src.core.endgame import EndgamePolicy
+from src.core.engine import HeadlessEngine, GreedyPolicy
+from src.core.tournament import run_tournament
+
+
+class TestTournament(unittest.TestCase):
+    def test_paired_games_aggregate_across_workers(self):
+        bot   = functools.partial(EndgamePolicy, max_nodes=2_000)
+        stats = run_tournament(bot, GreedyPolicy, 12, batch_size=4, workers=2)
+        self.assertEqual((stats.games, stats.pairs), (12, 6))
+        a, b = stats.a, stats.b
+        self.assertEqual(a.wins + a.losses + a.ties, 12)
+        self.assertEqual((a.wins, a.losses, a.ties), (b.losses, b.wins, b.ties))
+
+        # same totals as playing every seed both ways in this process
+        straight = HeadlessEngine([bot(), GreedyPolicy()])
+        swapped  = HeadlessEngine([GreedyPolicy(), bot()])
+        losses = sum(straight.play(s).loser == 0 for s in range(6)) \
+            + sum(swapped.play(s).loser == 1 for s in range(6))
+        self.assertEqual(a.losses, losses)
+        lo, hi = stats.confidence_interval()
+        self.assertLessEqual(lo, stats.score())
+        self.assertLessEqual(stats.score(), hi)
+
+
+if __name__ == "__main__":
+    unittest.main()
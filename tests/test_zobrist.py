@@ -0,0 +1,39 @@
+import random
+import unittest
+from src.core.engine import HeadlessEngine, GreedyPolicy
+from src.core.record import restore_snapshot, take_snapshot
+
+
+class TestZobrist(unittest.TestCase):
+    def test_incremental_keys_match_rebuilt_state(self):
+        seen = {}
+        for seed in range(20):
+            engine = HeadlessEngine([GreedyPolicy()] * 2, transfer_mode=seed % 2 == 1)
+            m = engine.new_game(seed)
+            m.start()
+            rng = random.Random(seed)
+            while not m.over:
+                m.apply(rng.choice(m.legal_actions()))
+                snap    = take_snapshot(m, 0)
+                rebuilt = restore_snapshot(snap, m.game.deck, transfer_mode=m.transfer_mode)
+                key     = m.key()
+                self.assertEqual(key, rebuilt.key())
+                # equal keys only for equal states (trump and deck order differ per seed)
+                state = (m.game.deck.trump, tuple(m.game.deck.cards[m.game.deck.pos:]),
+                         snap.hands, snap.attacks, snap.defences, snap.attacker,
+                         snap.defender, snap.phase, snap.transferred, m.transfer_mode)
+                self.assertEqual(seen.setdefault(key, state), state)
+
+    def test_key_tracks_roles_and_hand_order_is_ignored(self):
+        m = HeadlessEngine([GreedyPolicy()] * 2).new_game(1)
+        m.start()
+        g = m.game
+        before = g.key()
+        g.players[0].hand.reverse()
+        self.assertEqual(g.key(), before)
+        g._advance_roles(defender_took=False)
+        self.assertNotEqual(g.key(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()